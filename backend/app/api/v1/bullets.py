@@ -4,13 +4,15 @@ import sys
 from pathlib import Path
 from typing import List, Optional
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel
 
 # Add project root to path for imports
 project_root = Path(__file__).parent.parent.parent.parent
 sys.path.insert(0, str(project_root))
 
+from backend.app.dependencies import get_bullet_format_cache
+from src.extractors.bullet_format_cache import BulletFormatCache
 from src.extractors.bullet_formatter import BulletFormatter
 
 router = APIRouter()
@@ -31,10 +33,13 @@ class BulletGenerationResponse(BaseModel):
 
 
 @router.post("/bullets/generate", response_model=BulletGenerationResponse)
-async def generate_bullets(request: BulletGenerationRequest):
+async def generate_bullets(
+    request: BulletGenerationRequest,
+    cache: BulletFormatCache = Depends(get_bullet_format_cache),
+):
     """Generate formatted resume bullets for a project."""
     try:
-        formatter = BulletFormatter()
+        formatter = BulletFormatter(cache=cache)
         
         # Use description as raw bullets if no context provided
         raw_bullets = [request.description]
@@ -141,7 +141,6 @@ async def update_job(
         
         # Update other fields via direct SQL (since Database doesn't have general update method)
         if request.notes is not None or request.contact_name is not None or request.date_applied is not None:
-            cursor = db.conn.cursor()
             updates = []
             params = []
             
@@ -157,11 +156,13 @@ async def update_job(
             
             if updates:
                 params.append(job_id)
-                cursor.execute(
-                    f"UPDATE jobs SET {', '.join(updates)} WHERE id = ?",
-                    params
-                )
-                db.conn.commit()
+                # bulk() commits on the database's write lock, so this cannot
+                # commit another request's transaction
+                with db.bulk() as conn:
+                    conn.execute(
+                        f"UPDATE jobs SET {', '.join(updates)} WHERE id = ?",
+                        params
+                    )
         
         # Get updated job
         updated_job = db.get_job_full(job_id)
@@ -341,7 +342,7 @@ def _job_dict_to_response(job: dict, db: Optional[Database] = None) -> JobRespon
     latest_resume_id = None
     if job_id and db:
         try:
-            resumes = db.get_resumes_by_job_id(job_id)
+            resumes = db.list_resume_meta_for_job(job_id)
             if resumes:
                 has_resume = True
                 latest_resume_id = resumes[0]["id"]  # Most recent resume
@@ -12,10 +12,11 @@ from pydantic import BaseModel
 project_root = Path(__file__).parent.parent.parent.parent
 sys.path.insert(0, str(project_root))
 
-from backend.app.dependencies import get_db
+from backend.app.dependencies import get_db, get_reasoning_cache
 from src.db.database import Database
 from src.models.resume import Resume, Bullet
 from src.compilation.resume_rewriter import ResumeRewriter
+from src.compilation.reasoning_cache import ReasoningCache
 from src.matching.skill_matcher import SkillMatcher
 from src.models.skills import SkillOntology, UserSkills
 
@@ -38,6 +39,7 @@ class CompleteResumeRequest(BaseModel):
 async def start_resume_generation(
     request: GenerateResumeRequest,
     db: Database = Depends(get_db),
+    reasoning_cache: ReasoningCache = Depends(get_reasoning_cache),
 ):
     """Start resume generation workflow for a job."""
     try:
@@ -77,7 +79,7 @@ async def start_resume_generation(
                 pass
         
         # Generate variations
-        rewriter = ResumeRewriter(user_skills=user_skills)
+        rewriter = ResumeRewriter(user_skills=user_skills, reasoning_cache=reasoning_cache)
         variations = rewriter.generate_variations(
             resume,
             job_match,
@@ -127,6 +129,7 @@ async def regenerate_bullet(
     request: GenerateResumeRequest,
     bullet_id: str = Query(..., description="ID of the bullet to regenerate"),
     db: Database = Depends(get_db),
+    reasoning_cache: ReasoningCache = Depends(get_reasoning_cache),
 ):
     """Regenerate variations for a specific bullet with new rewrite intent."""
     try:
@@ -166,7 +169,7 @@ async def regenerate_bullet(
                 pass
         
         # Generate variations for specific bullet
-        rewriter = ResumeRewriter(user_skills=user_skills)
+        rewriter = ResumeRewriter(user_skills=user_skills, reasoning_cache=reasoning_cache)
         variations = rewriter.generate_variations(
             resume,
             job_match,
@@ -211,6 +214,7 @@ async def regenerate_bullet(
 async def complete_resume_generation(
     request: CompleteResumeRequest,
     db: Database = Depends(get_db),
+    reasoning_cache: ReasoningCache = Depends(get_reasoning_cache),
 ):
     """Complete resume generation by applying approved bullets."""
     try:
@@ -249,7 +253,7 @@ async def complete_resume_generation(
                 pass
         
         # Generate variations to get candidates
-        rewriter = ResumeRewriter(user_skills=user_skills)
+        rewriter = ResumeRewriter(user_skills=user_skills, reasoning_cache=reasoning_cache)
         variations = rewriter.generate_variations(
             resume,
             job_match,
@@ -8,10 +8,24 @@ project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
 from functools import lru_cache
+from src.compilation.reasoning_cache import ReasoningCache
 from src.db.database import Database
+from src.extractors.bullet_format_cache import BulletFormatCache
 
 
 @lru_cache()
 def get_db() -> Database:
     """Get database instance (singleton)."""
     return Database()
+
+
+@lru_cache()
+def get_reasoning_cache() -> ReasoningCache:
+    """Get reasoning cache instance (singleton)."""
+    return ReasoningCache()
+
+
+@lru_cache()
+def get_bullet_format_cache() -> BulletFormatCache:
+    """Get formatted bullet cache instance (singleton)."""
+    return BulletFormatCache()
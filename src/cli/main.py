@@ -767,7 +767,7 @@ def render_pdf(resume_json):
 
 @cli.command()
 def deduplicate_jobs():
-    """Remove duplicate jobs from database, keeping the most recent one for each company+title combination."""
+    """Remove duplicate jobs from database, keeping the most recent one for each company+title or source URL."""
     try:
         db = Database()
         stats = db.deduplicate_jobs()
@@ -0,0 +1,231 @@
+"""Persistent cache of reasoning chains for repeated bullet/job-gap pairs."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import math
+import sqlite3
+from array import array
+from pathlib import Path
+from typing import List, Optional, Sequence
+
+from src.models.resume import Reasoning
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+
+CACHE_PATH = Path("data/reasoning_cache.db")
+
+# Embedding model used for near-duplicate (paraphrase) lookups
+EMBEDDING_MODEL = "text-embedding-3-small"
+
+# Minimum cosine similarity for a paraphrased bullet to reuse a cached reasoning
+DEFAULT_SIMILARITY_THRESHOLD = 0.93
+
+
+def _cosine_similarity(a: Sequence[float], b: Sequence[float]) -> float:
+    """Cosine similarity between two equal-length vectors."""
+    dot = sum(x * y for x, y in zip(a, b))
+    norm = math.sqrt(sum(x * x for x in a)) * math.sqrt(sum(y * y for y in b))
+    return dot / norm if norm else 0.0
+
+
+class ReasoningCache:
+    """Cache reasoning chains keyed by bullet text and a signature of the other prompt inputs.
+
+    A signature covers the job's skill gaps, the model and the prompt version
+    (see make_signature), narrowed to one bullet's skills by
+    bullet_signature(). Lookups are exact first (normalized bullet text +
+    bullet signature). When semantic matching is enabled, a miss falls back to
+    comparing the bullet's embedding against cached bullets that share the
+    same bullet signature, so paraphrased bullets reuse an existing reasoning
+    instead of calling the LLM.
+    Bullet embeddings are also stored by text, so a bullet is embedded once
+    no matter how many jobs it is matched against.
+    """
+
+    def __init__(
+        self,
+        path: Path = CACHE_PATH,
+        similarity_threshold: Optional[float] = DEFAULT_SIMILARITY_THRESHOLD,
+    ):
+        """Initialize cache.
+
+        Args:
+            path: SQLite file backing the cache (created on first use)
+            similarity_threshold: Cosine similarity required for a semantic hit,
+                or None to disable semantic lookups
+        """
+        self.path = Path(path)
+        self.similarity_threshold = similarity_threshold
+        self._conn: Optional[sqlite3.Connection] = None
+
+    @property
+    def semantic(self) -> bool:
+        """Whether embedding-based lookups are enabled."""
+        return self.similarity_threshold is not None
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS reasoning_cache (
+                    hash TEXT PRIMARY KEY,
+                    signature TEXT NOT NULL,
+                    embedding BLOB,
+                    reasoning_json TEXT NOT NULL
+                )
+            """)
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_reasoning_cache_signature ON reasoning_cache(signature)"
+            )
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS embedding_cache (
+                    hash TEXT PRIMARY KEY,
+                    embedding BLOB NOT NULL
+                )
+            """)
+            self._conn.commit()
+        return self._conn
+
+    def close(self) -> None:
+        """Close the underlying connection."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    @staticmethod
+    def normalize_text(text: str) -> str:
+        """Normalize bullet text for keying and embedding."""
+        return " ".join(text.lower().split())
+
+    @staticmethod
+    def make_signature(
+        required_missing: List[str],
+        preferred_missing: List[str],
+        missing_skills: List[str],
+        matching_skills: List[str],
+        allowed_skills: List[str],
+        model: str,
+        prompt_version: int,
+    ) -> str:
+        """Build a stable signature of the job-side inputs to a reasoning prompt.
+
+        The model and prompt version are included so that switching either
+        misses entries generated by the old ones.
+        """
+        return json.dumps([
+            sorted(required_missing),
+            sorted(preferred_missing),
+            sorted(missing_skills),
+            sorted(matching_skills),
+            sorted(allowed_skills),
+            model,
+            prompt_version,
+        ])
+
+    @staticmethod
+    def bullet_signature(signature: str, bullet_skills: Sequence[str]) -> str:
+        """Narrow a job signature to one bullet's skills, which its prompt also lists."""
+        return json.dumps([signature, list(bullet_skills)])
+
+    def make_key(self, bullet_text: str, signature: str) -> str:
+        """Hash a normalized bullet text and bullet signature into a cache key."""
+        payload = f"{self.normalize_text(bullet_text)}\x00{signature}"
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[Reasoning]:
+        """Return the cached reasoning for an exact key, if present."""
+        row = self.conn.execute(
+            "SELECT reasoning_json FROM reasoning_cache WHERE hash = ?", (key,)
+        ).fetchone()
+        if row:
+            return Reasoning.model_validate_json(row[0])
+        return None
+
+    def find_similar(self, signature: str, embedding: Sequence[float]) -> Optional[Reasoning]:
+        """Return the most similar cached reasoning with the same signature.
+
+        Only matches at or above the similarity threshold are returned.
+        """
+        if not self.semantic:
+            return None
+
+        rows = self.conn.execute(
+            "SELECT embedding, reasoning_json FROM reasoning_cache WHERE signature = ? AND embedding IS NOT NULL",
+            (signature,),
+        ).fetchall()
+        if not rows:
+            return None
+
+        best_json = None
+        if NUMPY_AVAILABLE:
+            # Score every cached bullet in one matrix-vector product
+            matrix = np.frombuffer(b"".join(blob for blob, _ in rows), dtype=np.float32).reshape(len(rows), -1)
+            query = np.asarray(embedding, dtype=np.float32)
+            norms = np.linalg.norm(matrix, axis=1) * np.linalg.norm(query)
+            scores = np.divide(matrix @ query, norms, out=np.zeros(len(rows), dtype=np.float32), where=norms > 0)
+            best = int(np.argmax(scores))
+            if scores[best] >= self.similarity_threshold:
+                best_json = rows[best][1]
+        else:
+            best_score = self.similarity_threshold
+            for blob, reasoning_json in rows:
+                vector = array("f")
+                vector.frombytes(blob)
+                score = _cosine_similarity(embedding, vector)
+                if score >= best_score:
+                    best_score = score
+                    best_json = reasoning_json
+
+        if best_json is not None:
+            return Reasoning.model_validate_json(best_json)
+        return None
+
+    def put(
+        self,
+        key: str,
+        signature: str,
+        reasoning: Reasoning,
+        embedding: Optional[Sequence[float]] = None,
+    ) -> None:
+        """Store a reasoning chain under its key."""
+        blob = array("f", embedding).tobytes() if embedding is not None else None
+        self.conn.execute(
+            """
+            INSERT OR REPLACE INTO reasoning_cache (hash, signature, embedding, reasoning_json)
+            VALUES (?, ?, ?, ?)
+            """,
+            (key, signature, blob, reasoning.model_dump_json()),
+        )
+        self.conn.commit()
+
+    def _embedding_key(self, text: str) -> str:
+        payload = f"{EMBEDDING_MODEL}\x00{self.normalize_text(text)}"
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get_embedding(self, text: str) -> Optional[List[float]]:
+        """Return the stored embedding of a bullet text, if present."""
+        row = self.conn.execute(
+            "SELECT embedding FROM embedding_cache WHERE hash = ?", (self._embedding_key(text),)
+        ).fetchone()
+        if row:
+            vector = array("f")
+            vector.frombytes(row[0])
+            return vector.tolist()
+        return None
+
+    def put_embedding(self, text: str, embedding: Sequence[float]) -> None:
+        """Store the embedding of a bullet text."""
+        self.conn.execute(
+            "INSERT OR REPLACE INTO embedding_cache (hash, embedding) VALUES (?, ?)",
+            (self._embedding_key(text), array("f", embedding).tobytes()),
+        )
+        self.conn.commit()
@@ -1,29 +1,353 @@
 """Resume rewriter with reasoning chain generation."""
 
+import asyncio
 import os
+import re
+import time
 import uuid
-from typing import Dict, List, Tuple, Optional
-from openai import OpenAI
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from itertools import chain, islice
+from typing import Any, Dict, FrozenSet, Iterable, Iterator, List, Tuple, Optional
+from openai import AsyncOpenAI, OpenAI
 from src.models.resume import Resume, Bullet, Reasoning, Justification, BulletCandidate
 from src.models.job import JobMatch
 from src.models.skills import SkillOntology, UserSkills
+from src.compilation.bullet_feedback import BulletFeedbackStore, FEEDBACK_PATH
 from src.compilation.bullet_scorer import BulletScorer
 from src.compilation.bullet_validator import BulletValidator
+from src.compilation.reasoning_cache import ReasoningCache, EMBEDDING_MODEL
+from src.utils import fast_json
+from src.utils.aho_corasick import AhoCorasick, entry_at, join_with_offsets
+
+
+# Verbs marking a bullet as technical work that extra skills can be woven into
+_TECH_KEYWORDS = frozenset({
+    "develop", "build", "implement", "create", "design", "code",
+    "program", "system", "software", "application",
+})
+# Narrower set used when judging a single missing skill against a bullet
+_SKILL_CONTEXT_KEYWORDS = frozenset({"develop", "build", "implement", "create", "design", "code"})
+# Substring scans (e.g. "develop" matches "developed"), one regex pass each
+_TECH_RE = re.compile("|".join(map(re.escape, sorted(_TECH_KEYWORDS))))
+_SKILL_CONTEXT_RE = re.compile("|".join(map(re.escape, sorted(_SKILL_CONTEXT_KEYWORDS))))
+
+# Related technology mappings
+_RELATED_TECH = {
+    "python": frozenset({"numpy", "pandas", "scikit-learn", "tensorflow", "pytorch", "matplotlib"}),
+    "javascript": frozenset({"typescript", "node.js", "react", "vue", "angular"}),
+    "java": frozenset({"spring", "maven", "gradle"}),
+    "golang": frozenset({"go"}),
+    "react": frozenset({"react native", "next.js"}),
+    "node.js": frozenset({"express", "trpc", "graphql"}),
+}
+_RELATED_PAIRS = frozenset(
+    (key, related) for key, related_set in _RELATED_TECH.items() for related in related_set
+)
+
+# Field defaults for candidate metadata missing from the LLM response
+_SCORE_DEFAULTS = {
+    "job_skill_coverage": 0.0,
+    "ats_keyword_gain": 0.0,
+    "semantic_similarity": 0.0,
+    "constraint_violations": 0.0,
+}
+_DIFF_KEYS = ("added", "removed")
+_JUSTIFICATION_LIST_KEYS = ("job_requirements_addressed", "skills_mapped")
+
+# Model generating reasoning chains, and the version of its prompt; bump the
+# version whenever _REASONING_SYSTEM_MESSAGE or the reasoning prompt builders
+# change, so cached reasoning from the old prompt is no longer served
+REASONING_MODEL = "gpt-4o-mini"
+REASONING_PROMPT_VERSION = 1
+
+# Prompts are ordered static -> per-job -> per-bullet so that every request for
+# one job shares the longest possible prefix, which OpenAI's automatic prompt
+# caching serves from cache for all bullets after the first.
+_REASONING_SYSTEM_MESSAGE = """You are an expert resume writer. Think step-by-step about how to improve resume bullets to match job requirements.
+
+For the bullet given, provide:
+1. problem_identification: What gap/issue prompted this change? (Only consider gaps that can be addressed with verified skills)
+2. analysis: How does current bullet compare to job requirements? (Focus on skills you can actually add)
+3. solution_approach: Why was this approach chosen? (Only use verified skills from the Skills page)
+4. evaluation: Why does this variation work better? (Without fabricating new skills)
+5. alternatives_considered: What other approaches were considered? (list)
+6. confidence_score: Confidence in this change (0.0-1.0)
+
+Return as JSON:
+{
+    "problem_identification": "...",
+    "analysis": "...",
+    "solution_approach": "...",
+    "evaluation": "...",
+    "alternatives_considered": ["...", "..."],
+    "confidence_score": 0.85
+}"""
+
+_CANDIDATE_SYSTEM_MESSAGE = "You are an expert resume writer. Generate bullet point candidates with detailed metadata including scores, diffs, and justifications. Maintain factual accuracy - do not fabricate experience."
+_CANDIDATE_SKILLS_RULE = " CRITICAL: You may ONLY use skills from the user's verified Skills page. Adding any skill not explicitly listed is STRICTLY FORBIDDEN and will result in rejection."
+
+# Static sections of the candidate instructions, split around the rewrite intent
+_CANDIDATE_FIELDS_INSTRUCTIONS = '''Generate 4 bullet candidates for each bullet given, based on its reasoning chain.
+
+For each candidate, provide:
+1. text: The bullet text (≤150 characters)
+2. score: Object with:
+   - job_skill_coverage: 0.0-1.0 (how well it covers required/preferred skills)
+   - ats_keyword_gain: integer (number of new ATS keywords added)
+   - semantic_similarity: 0.0-1.0 (how similar to original meaning)
+   - constraint_violations: integer (number of constraint violations, 0 is best)
+3. diff_from_original: Object with:
+   - added: List of words/phrases added
+   - removed: List of words/phrases removed
+4. justification: Object with:
+   - job_requirements_addressed: List of job requirements this addresses
+   - skills_mapped: List of skills mentioned/added
+   - why_this_version: Brief explanation
+5. rewrite_intent: "'''
+
+_CANDIDATE_RULES_AND_FORMAT = '''"
+
+Each candidate must:
+- Be ≤150 characters
+- Maintain factual accuracy (no fabrication)
+- Include ONLY skills from the verified Skills page list (if provided)
+- Have one clear claim per bullet
+- For project bullets: Only use skills that match the project's tech stack AND are in your Skills page
+- NEVER add skills that are not in the allowed skills list - this is STRICTLY FORBIDDEN
+- If a job requires a skill you don't have, rephrase to emphasize skills you DO have instead of adding new ones
+
+Return as JSON:
+{
+    "candidates": [
+        {
+            "text": "...",
+            "score": {
+                "job_skill_coverage": 0.85,
+                "ats_keyword_gain": 3,
+                "semantic_similarity": 0.90,
+                "constraint_violations": 0
+            },
+            "diff_from_original": {
+                "added": ["Linux", "pipelines"],
+                "removed": []
+            },
+            "justification": {
+                "job_requirements_addressed": ["Linux experience", "Automation"],
+                "skills_mapped": ["Python", "Linux", "Automation"],
+                "why_this_version": "Maximizes required skill coverage without introducing new experience claims"
+            },
+            "rewrite_intent": "'''
+
+_CANDIDATE_PROMPT_END = '''"
+        },
+        ...
+    ]
+}'''
+
+# Intent-specific guidance appended to the candidate prompt
+_INTENT_GUIDANCE = {
+    "reword_only": "\n\n🚫 CRITICAL: REWORD-ONLY MODE - You MUST NOT add any new skills. You may ONLY reword the existing bullet text to improve clarity, strength, or readability. The set of skills mentioned in the bullet must remain EXACTLY the same. Preserve all existing skills and do not introduce any new technical terms or skill names.",
+    "emphasize_skills": "\n\nFocus: Emphasize required/preferred skills from the job description. Add skill keywords naturally, but ONLY from the allowed skills list.",
+    "more_technical": "\n\nFocus: Make the bullet more technical and specific. Use precise technical terminology, but ONLY from the allowed skills list.",
+    "more_concise": "\n\nFocus: Make the bullet more concise while preserving key information. Remove unnecessary words. Do not add new skills unless they are in the allowed list.",
+    "conservative": "\n\nFocus: Conservative rewrite - minimal changes, only add skills that clearly fit the context AND are in the allowed skills list. Avoid scope expansion.",
+}
+
+_NO_FILTERED_SKILLS = "None - focus on emphasizing existing skills"
+
+# Bullet length limit enforced by the resume models, and the marker used
+# when shortening LLM output to fit it
+MAX_BULLET_LENGTH = 150
+_ELLIPSIS = "..."
+
+# Candidates kept from each LLM response (the prompt asks for this many)
+MAX_CANDIDATES_PER_BULLET = 4
+
+# Maximum number of OpenAI requests in flight during generate_variations
+MAX_CONCURRENT_REQUESTS = 8
+
+# Retries for rate-limited (429) and transient errors; the OpenAI SDK applies
+# exponential backoff with jitter and honors retry-after headers
+MAX_API_RETRIES = 5
+
+# OpenAI Batch API settings for non-interactive runs
+BATCH_ENDPOINT = "/v1/chat/completions"
+BATCH_COMPLETION_WINDOW = "24h"
+BATCH_TERMINAL_STATUSES = {"completed", "failed", "expired", "cancelled"}
+
+
+def _run_sync(coro):
+    """Run a coroutine to completion from synchronous code.
+    
+    Falls back to a worker thread when called from inside a running event loop
+    (e.g. an async FastAPI endpoint), where asyncio.run() is not allowed.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coro).result()
+
+
+def _truncate_bullet(text: str) -> str:
+    """Shorten text to MAX_BULLET_LENGTH, ending in an ellipsis when cut."""
+    if len(text) <= MAX_BULLET_LENGTH:
+        return text
+    return text[:MAX_BULLET_LENGTH - len(_ELLIPSIS)] + _ELLIPSIS
+
+
+def _has_allowed_match(skill_lower: str, allowed_set_lower: FrozenSet[str]) -> bool:
+    """Check if a skill equals, contains, or is contained in an allowed skill.
+    
+    Args:
+        skill_lower: Skill name, lowercased and stripped
+        allowed_set_lower: Allowed skills, lowercased and stripped
+    """
+    if skill_lower in allowed_set_lower:
+        return True
+    return any(allowed in skill_lower or skill_lower in allowed for allowed in allowed_set_lower)
+
+
+def _filter_to_allowed(skills: List[str], allowed_set_lower: FrozenSet[str]) -> List[str]:
+    """Keep skills that match an allowed skill (see _has_allowed_match)."""
+    return [skill for skill in skills if _has_allowed_match(skill.lower().strip(), allowed_set_lower)]
+
+
+@dataclass
+class ResumeBullets:
+    """Resume bullets flattened into parallel lists by a single traversal.
+    
+    contexts and project_names are None for experience bullets and hold the
+    project's tech stack and name for project bullets. Lowercased bullet text
+    and tech stacks are kept alongside for case-insensitive matching.
+    """
+    
+    ids: List[str] = field(default_factory=list)
+    bullets: List[Bullet] = field(default_factory=list)
+    contexts: List[Optional[List[str]]] = field(default_factory=list)
+    project_names: List[Optional[str]] = field(default_factory=list)
+    texts_lower: List[str] = field(default_factory=list)
+    contexts_lower: List[Optional[List[str]]] = field(default_factory=list)
+    
+    def append(
+        self,
+        bullet_id: str,
+        bullet: Bullet,
+        context: Optional[List[str]],
+        project_name: Optional[str],
+        text_lower: Optional[str] = None,
+        context_lower: Optional[List[str]] = None,
+    ) -> None:
+        self.ids.append(bullet_id)
+        self.bullets.append(bullet)
+        self.contexts.append(context)
+        self.project_names.append(project_name)
+        self.texts_lower.append(text_lower if text_lower is not None else bullet.text.lower())
+        if context_lower is None and context is not None:
+            context_lower = [s.lower() for s in context]
+        self.contexts_lower.append(context_lower)
+    
+    def duplicate_groups(self) -> Dict[int, List[int]]:
+        """Group identical bullets so they share one reasoning and candidate set.
+        
+        Bullets match only when their text, skills and project context are
+        all equal, so every member of a group would have sent the same prompt.
+        
+        Returns:
+            Mapping of representative index -> indices of all bullets in its group
+        """
+        groups: Dict[Tuple, List[int]] = {}
+        for index, (bullet, context, project_name) in enumerate(
+            zip(self.bullets, self.contexts, self.project_names)
+        ):
+            key = (
+                bullet.text,
+                tuple(bullet.skills),
+                tuple(context) if context is not None else None,
+                project_name,
+            )
+            groups.setdefault(key, []).append(index)
+        return {members[0]: members for members in groups.values()}
+
+
+@dataclass
+class MissingSkillsView:
+    """Job skill gaps read once from a JobMatch and shared across bullets."""
+    
+    required: List[str]
+    preferred: List[str]
+    general: List[str]
+    # (skill, lowercased skill) for the top gaps a bullet may be enhanced with
+    candidates: Tuple[Tuple[str, str], ...]
+    
+    @classmethod
+    def from_job_match(cls, job_match: JobMatch) -> "MissingSkillsView":
+        required = job_match.skill_gaps.get("required_missing", []) or []
+        preferred = job_match.skill_gaps.get("preferred_missing", []) or []
+        general = job_match.missing_skills or []
+        candidates = tuple(
+            (skill, skill.lower())
+            for skill in chain(required[:5], preferred[:3], general[:3])
+        )
+        return cls(required=required, preferred=preferred, general=general, candidates=candidates)
+    
+    @property
+    def has_gaps(self) -> bool:
+        return bool(self.required or self.preferred or self.general)
 
 
 class ResumeRewriter:
     """Generate resume bullet variations with reasoning chains."""
     
-    def __init__(self, api_key: Optional[str] = None, user_skills: Optional[UserSkills] = None, ontology: Optional[SkillOntology] = None):
-        """Initialize rewriter with OpenAI client and optional user skills."""
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        user_skills: Optional[UserSkills] = None,
+        ontology: Optional[SkillOntology] = None,
+        max_concurrency: int = MAX_CONCURRENT_REQUESTS,
+        reasoning_cache: Optional[ReasoningCache] = None,
+    ):
+        """Initialize rewriter with OpenAI client and optional user skills.
+        
+        Pass a ReasoningCache to reuse reasoning chains for bullets that were
+        already analyzed against the same job skill gaps.
+        """
         api_key = api_key or os.getenv("OPENAI_API_KEY")
         if not api_key:
             raise ValueError("OpenAI API key required. Set OPENAI_API_KEY environment variable.")
-        self.client = OpenAI(api_key=api_key)
+        self.api_key = api_key
+        self.client = OpenAI(api_key=api_key, max_retries=MAX_API_RETRIES)
+        self.max_concurrency = max_concurrency
+        self.reasoning_cache = reasoning_cache
         self.user_skills = user_skills
         self.ontology = ontology or SkillOntology()
         self.scorer = BulletScorer()
         self.validator = BulletValidator(ontology=self.ontology, user_skills=user_skills)
+        # (feedback file mtime, preference note) from the last feedback load
+        self._feedback_note: Optional[Tuple[Optional[int], str]] = None
+        # (allowed skills list, its lowercased set) last used to build prompts
+        self._allowed_lower: Optional[Tuple[List[str], FrozenSet[str]]] = None
+    
+    @property
+    def user_skills(self) -> Optional[UserSkills]:
+        """User skills library that bounds which skills bullets may mention."""
+        return self._user_skills
+    
+    @user_skills.setter
+    def user_skills(self, user_skills: Optional[UserSkills]) -> None:
+        self._user_skills = user_skills
+        # Derived once here rather than for every bullet and prompt
+        names = sorted(user_skills.get_all_skill_names()) if user_skills else []
+        self._user_skill_names = names
+        # Index-aligned with names, so names differing only in case or
+        # spacing each stay reachable
+        user_skills_lower = [name.lower().strip() for name in names]
+        # Automaton over user skills plus the joined skill text, for matching
+        # against job skills in a single scan each way
+        self._user_skill_matcher = AhoCorasick(user_skills_lower)
+        self._user_skills_text, self._user_skill_starts = join_with_offsets(user_skills_lower)
     
     def _get_allowed_job_skills_for_user(self, job_match: JobMatch) -> List[str]:
         """Get intersection of user skills and job skills (required + preferred).
@@ -39,9 +363,6 @@ class ResumeRewriter:
         if not self.user_skills:
             return []
         
-        user_skills_set = self.user_skills.get_all_skill_names()
-        user_skills_lower = {s.lower().strip() for s in user_skills_set}
-        
         # Get all job skills (required + preferred)
         job_skills_list = []
         if hasattr(job_match, 'skill_gaps'):
@@ -50,18 +371,31 @@ class ResumeRewriter:
         if hasattr(job_match, 'missing_skills'):
             job_skills_list.extend(job_match.missing_skills)
         
-        # Find intersection: skills that are both in user's skills AND in job requirements
+        # Find intersection: skills that are both in user's skills AND in job requirements.
+        # A user skill matches a job skill on equality or when either contains the
+        # other; both containment directions are found with one automaton scan.
+        job_skills_lower = [job_skill.lower().strip() for job_skill in job_skills_list]
+        job_skills_text, job_skill_starts = join_with_offsets(job_skills_lower)
+        matched_pairs = set()
+        
+        # User skill equal to or contained in a job skill
+        for position, user_index in self._user_skill_matcher.iter_matches(job_skills_text):
+            matched_pairs.add((entry_at(job_skill_starts, position), user_index))
+        
+        # Job skill contained in a user skill
+        job_skill_matcher = AhoCorasick(job_skills_lower)
+        for position, job_index in job_skill_matcher.iter_matches(self._user_skills_text):
+            matched_pairs.add((job_index, entry_at(self._user_skill_starts, position)))
+        
+        # Order by job skill, then user skill, as a nested scan would
+        user_skill_names = self._user_skill_names
         allowed_skills = []
-        for job_skill in job_skills_list:
-            job_skill_lower = job_skill.lower().strip()
-            # Check for exact match or partial match
-            for user_skill in user_skills_set:
-                user_skill_lower = user_skill.lower().strip()
-                if (user_skill_lower == job_skill_lower or 
-                    user_skill_lower in job_skill_lower or 
-                    job_skill_lower in user_skill_lower):
-                    if user_skill not in allowed_skills:
-                        allowed_skills.append(user_skill)
+        seen = set()
+        for _, user_index in sorted(matched_pairs):
+            user_skill = user_skill_names[user_index]
+            if user_skill not in seen:
+                seen.add(user_skill)
+                allowed_skills.append(user_skill)
         
         return allowed_skills
     
@@ -74,6 +408,33 @@ class ResumeRewriter:
     ) -> Dict[str, Tuple[Reasoning, List[BulletCandidate]]]:
         """Generate ranked candidate variations for bullets needing adjustment.
         
+        Synchronous wrapper around generate_variations_async(); OpenAI calls for
+        all bullets are issued concurrently.
+        
+        Args:
+            resume: Resume to generate variations for
+            job_match: Job match information
+            ontology: Skill ontology (uses instance ontology if not provided)
+            rewrite_intent: Optional rewrite intent ("emphasize_skills", "more_technical", "more_concise", "conservative")
+        
+        Returns: Dict mapping bullet_id -> (Reasoning, List[ranked BulletCandidate objects])
+        """
+        return _run_sync(self.generate_variations_async(
+            resume, job_match, ontology=ontology, rewrite_intent=rewrite_intent
+        ))
+    
+    async def generate_variations_async(
+        self,
+        resume: Resume,
+        job_match: JobMatch,
+        ontology: Optional[SkillOntology] = None,
+        rewrite_intent: Optional[str] = None,
+    ) -> Dict[str, Tuple[Reasoning, List[BulletCandidate]]]:
+        """Generate ranked candidate variations, running bullets concurrently.
+        
+        Each bullet's reasoning -> candidates chain runs as its own task, with at
+        most max_concurrency OpenAI requests in flight at once.
+        
         Args:
             resume: Resume to generate variations for
             job_match: Job match information
@@ -82,120 +443,395 @@ class ResumeRewriter:
         
         Returns: Dict mapping bullet_id -> (Reasoning, List[ranked BulletCandidate objects])
         """
-        if ontology:
-            self.ontology = ontology
-            self.validator = BulletValidator(ontology=ontology, user_skills=self.user_skills)
+        self._use_ontology(ontology)
         
         # Track resume generation started event (if db available)
         # Note: This requires db to be passed or accessed differently
         # For now, we'll track this in the calling code
         
-        proposals = {}
-        
         # Identify bullets that need adjustment based on gap analysis
-        bullets_to_adjust = self._identify_bullets_to_adjust(resume, job_match)
+        selected = self._identify_bullets_to_adjust(resume, job_match)
+        if not selected.ids:
+            return {}
         
-        # Build a map of bullet_id to project context (if it's a project bullet)
-        project_context_map = {}
-        project_name_map = {}
-        bullet_id = 0
-        for project in resume.projects:
-            for bullet in project.bullets:
-                bullet_key = f"proj_{project.name}_{bullet_id}"
-                project_context_map[bullet_key] = project.tech_stack
-                project_name_map[bullet_key] = project.name
-                bullet_id += 1
+        # Same for every bullet, so computed once instead of per prompt
+        allowed_job_skills = self._get_allowed_job_skills_for_user(job_match)
         
-        for bullet_id, bullet in bullets_to_adjust.items():
-            # Step 1: Generate reasoning chain
-            reasoning = self._generate_reasoning(bullet, job_match, self.ontology)
-            
-            # Step 2: Generate candidates with reasoning (pass project context if applicable)
-            project_context = project_context_map.get(bullet_id)
-            project_name = project_name_map.get(bullet_id)
-            candidates = self._generate_candidates_with_reasoning(
-                bullet, reasoning, job_match, self.ontology, 
-                project_context=project_context, 
-                project_name=project_name,
-                rewrite_intent=rewrite_intent
-            )
+        # Duplicate bullets share one reasoning + candidates request
+        groups = selected.duplicate_groups()
+        bullets_to_adjust = {selected.ids[index]: selected.bullets[index] for index in groups}
+        project_context_map = dict(zip(selected.ids, selected.contexts))
+        project_name_map = dict(zip(selected.ids, selected.project_names))
+        
+        # The async client is created per run: its connection pool is bound to
+        # the event loop, which _run_sync() creates fresh for every call
+        async with AsyncOpenAI(api_key=self.api_key, max_retries=MAX_API_RETRIES) as aclient:
+            # Resolve cached reasoning chains up front, embedding all misses in one request
+            cached_reasonings, cache_entries = {}, {}
+            if self.reasoning_cache is not None:
+                signature = self._reasoning_signature(job_match, allowed_job_skills)
+                cached_reasonings, cache_entries = await self._lookup_reasonings_async(
+                    aclient, bullets_to_adjust, signature
+                )
             
-            # Step 3: Validate and filter candidates
-            # Get allowed job skills for validation
+            semaphore = asyncio.Semaphore(self.max_concurrency)
+            results = await asyncio.gather(*(
+                self._generate_proposal_async(
+                    aclient,
+                    semaphore,
+                    bullet,
+                    job_match,
+                    project_context=project_context_map[bullet_id],
+                    project_name=project_name_map[bullet_id],
+                    rewrite_intent=rewrite_intent,
+                    allowed_job_skills=allowed_job_skills,
+                    reasoning=cached_reasonings.get(bullet_id),
+                    cache_entry=cache_entries.get(bullet_id),
+                )
+                for bullet_id, bullet in bullets_to_adjust.items()
+            ))
+        
+        proposals = {}
+        for members, (reasoning, candidates) in zip(groups.values(), results):
+            for index in members:
+                proposals[selected.ids[index]] = (
+                    reasoning,
+                    self._rank_valid_candidates(
+                        selected.bullets[index],
+                        candidates if index == members[0] else self._copy_candidates(candidates, selected.bullets[index]),
+                        job_match,
+                        rewrite_intent,
+                        allowed_job_skills,
+                    ),
+                )
+        
+        # Keep proposals in resume order
+        return {bullet_id: proposals[bullet_id] for bullet_id in selected.ids}
+    
+    def _use_ontology(self, ontology: Optional[SkillOntology]) -> None:
+        """Switch to a caller-provided ontology, rebuilding the validator only if it changed."""
+        if ontology is None or ontology is self.ontology or ontology == self.ontology:
+            return
+        self.ontology = ontology
+        self.validator = BulletValidator(ontology=ontology, user_skills=self.user_skills)
+    
+    def generate_variations_batch(
+        self,
+        resume: Resume,
+        job_match: JobMatch,
+        ontology: Optional[SkillOntology] = None,
+        rewrite_intent: Optional[str] = None,
+        poll_interval: float = 30.0,
+    ) -> Dict[str, Tuple[Reasoning, List[BulletCandidate]]]:
+        """Generate variations through the OpenAI Batch API.
+        
+        Intended for offline pipelines that can wait for results: batch requests
+        cost half as much but complete within a 24h window. All reasoning
+        requests go out as one batch, followed by one batch of candidate
+        requests. Bullets whose requests fail are omitted from the result.
+        
+        Args:
+            resume: Resume to generate variations for
+            job_match: Job match information
+            ontology: Skill ontology (uses instance ontology if not provided)
+            rewrite_intent: Optional rewrite intent ("emphasize_skills", "more_technical", "more_concise", "conservative")
+            poll_interval: Seconds to wait between batch status checks
+        
+        Returns: Dict mapping bullet_id -> (Reasoning, List[ranked BulletCandidate objects])
+        
+        Raises:
+            RuntimeError: If a batch fails, expires, or is cancelled
+        """
+        self._use_ontology(ontology)
+        
+        selected = self._identify_bullets_to_adjust(resume, job_match)
+        if not selected.ids:
+            return {}
+        
+        # Duplicate bullets share one reasoning + candidates request
+        groups = selected.duplicate_groups()
+        bullets_to_adjust = {selected.ids[index]: selected.bullets[index] for index in groups}
+        project_context_map = dict(zip(selected.ids, selected.contexts))
+        project_name_map = dict(zip(selected.ids, selected.project_names))
+        allowed_job_skills = self._get_allowed_job_skills_for_user(job_match)
+        
+        # Reuse cached reasoning chains; only misses go into the batch
+        reasonings = {}
+        cache_entries = {}
+        if self.reasoning_cache is not None:
+            signature = self._reasoning_signature(job_match, allowed_job_skills)
+            reasonings, cache_entries = self._lookup_reasonings(bullets_to_adjust, signature)
+        pending = {bid: bullet for bid, bullet in bullets_to_adjust.items() if bid not in reasonings}
+        
+        # Batch 1: reasoning chains
+        reasoning_contents = self._run_batch(
+            {
+                f"reason::{bullet_id}": self._reasoning_request(bullet, job_match, allowed_job_skills)
+                for bullet_id, bullet in pending.items()
+            },
+            poll_interval,
+        )
+        for bullet_id in pending:
+            content = reasoning_contents.get(f"reason::{bullet_id}")
+            if content is not None:
+                reasonings[bullet_id] = self._parse_reasoning(content)
+                if self.reasoning_cache is not None:
+                    key, bullet_signature, embedding = cache_entries[bullet_id]
+                    self.reasoning_cache.put(key, bullet_signature, reasonings[bullet_id], embedding)
+        # Keep proposals in resume order
+        reasonings = {bid: reasonings[bid] for bid in bullets_to_adjust if bid in reasonings}
+        
+        # Batch 2: candidates built from each reasoning chain
+        candidate_contents = self._run_batch(
+            {
+                f"candidates::{bullet_id}": self._candidates_request(
+                    bullets_to_adjust[bullet_id], reasoning, job_match,
+                    project_context=project_context_map.get(bullet_id),
+                    project_name=project_name_map.get(bullet_id),
+                    rewrite_intent=rewrite_intent,
+                    allowed_job_skills=allowed_job_skills,
+                )
+                for bullet_id, reasoning in reasonings.items()
+            },
+            poll_interval,
+        )
+        
+        proposals = {}
+        for members in groups.values():
+            bullet_id = selected.ids[members[0]]
+            content = candidate_contents.get(f"candidates::{bullet_id}")
+            if bullet_id not in reasonings or content is None:
+                continue
+            candidates = self._parse_candidates(content, bullets_to_adjust[bullet_id], rewrite_intent)
+            for index in members:
+                proposals[selected.ids[index]] = (
+                    reasonings[bullet_id],
+                    self._rank_valid_candidates(
+                        selected.bullets[index],
+                        candidates if index == members[0] else self._copy_candidates(candidates, selected.bullets[index]),
+                        job_match,
+                        rewrite_intent,
+                        allowed_job_skills,
+                    ),
+                )
+        
+        # Keep proposals in resume order
+        return {bullet_id: proposals[bullet_id] for bullet_id in selected.ids if bullet_id in proposals}
+    
+    def _run_batch(self, requests: Dict[str, Dict[str, Any]], poll_interval: float) -> Dict[str, str]:
+        """Submit chat completion requests as one batch and wait for the results.
+        
+        Args:
+            requests: Mapping of custom_id -> chat completion arguments
+            poll_interval: Seconds to wait between batch status checks
+        
+        Returns:
+            Mapping of custom_id -> message content for successful requests
+        """
+        if not requests:
+            return {}
+        
+        lines = [
+            fast_json.dumps({"custom_id": custom_id, "method": "POST", "url": BATCH_ENDPOINT, "body": body})
+            for custom_id, body in requests.items()
+        ]
+        input_file = self.client.files.create(
+            file=("batch_input.jsonl", "\n".join(lines).encode("utf-8")),
+            purpose="batch",
+        )
+        batch = self.client.batches.create(
+            input_file_id=input_file.id,
+            endpoint=BATCH_ENDPOINT,
+            completion_window=BATCH_COMPLETION_WINDOW,
+        )
+        
+        while batch.status not in BATCH_TERMINAL_STATUSES:
+            time.sleep(poll_interval)
+            batch = self.client.batches.retrieve(batch.id)
+        
+        if batch.status != "completed":
+            raise RuntimeError(f"OpenAI batch {batch.id} ended with status '{batch.status}'")
+        if not batch.output_file_id:
+            return {}
+        
+        contents = {}
+        output = self.client.files.content(batch.output_file_id).text
+        for line in output.splitlines():
+            if not line.strip():
+                continue
+            result = fast_json.loads(line)
+            response = result.get("response") or {}
+            if result.get("error") or response.get("status_code") != 200:
+                continue
+            contents[result["custom_id"]] = response["body"]["choices"][0]["message"]["content"]
+        
+        return contents
+    
+    async def _generate_proposal_async(
+        self,
+        aclient: AsyncOpenAI,
+        semaphore: asyncio.Semaphore,
+        bullet: Bullet,
+        job_match: JobMatch,
+        project_context: Optional[List[str]] = None,
+        project_name: Optional[str] = None,
+        rewrite_intent: Optional[str] = None,
+        allowed_job_skills: Optional[List[str]] = None,
+        reasoning: Optional[Reasoning] = None,
+        cache_entry: Optional[List[Any]] = None,
+    ) -> Tuple[Reasoning, List[BulletCandidate]]:
+        """Generate reasoning and unranked candidates for one bullet.
+        
+        A reasoning already found in the cache is passed in and skips step 1.
+        Otherwise, cache_entry holds the [key, bullet signature, embedding] the newly
+        generated reasoning is stored under.
+        """
+        if allowed_job_skills is None:
             allowed_job_skills = self._get_allowed_job_skills_for_user(job_match)
-            valid_candidates = []
-            for candidate in candidates:
-                is_valid, errors = self.validator.validate(
-                    candidate, 
-                    bullet.text, 
-                    job_skills=allowed_job_skills if allowed_job_skills else None,
-                    rewrite_intent=rewrite_intent
+        
+        # Step 1: Generate reasoning chain
+        if reasoning is None:
+            async with semaphore:
+                response = await aclient.chat.completions.create(
+                    **self._reasoning_request(bullet, job_match, allowed_job_skills)
                 )
-                if is_valid:
-                    valid_candidates.append(candidate)
-                # Log errors for debugging if needed
-            
-            # Step 4: Rank candidates
-            ranked_candidates = self.scorer.rank_candidates(valid_candidates, bullet.text, job_match)
-            
-            # Step 5: Calculate risk levels
-            for candidate in ranked_candidates:
-                candidate.risk_level = self.scorer.calculate_risk_level(candidate, bullet.text)
-            
-            proposals[bullet_id] = (reasoning, ranked_candidates)
+            reasoning = self._parse_reasoning(response.choices[0].message.content)
+            if cache_entry is not None:
+                key, signature, embedding = cache_entry
+                self.reasoning_cache.put(key, signature, reasoning, embedding)
         
-        return proposals
+        # Step 2: Generate candidates with reasoning (pass project context if applicable)
+        async with semaphore:
+            candidates = await self._generate_candidates_with_reasoning_async(
+                aclient, bullet, reasoning, job_match, self.ontology,
+                project_context=project_context,
+                project_name=project_name,
+                rewrite_intent=rewrite_intent,
+                allowed_job_skills=allowed_job_skills,
+            )
+        
+        # Steps 3-5 (validate, rank, assess risk) run per bullet in the caller
+        return reasoning, candidates
     
-    def _identify_bullets_to_adjust(
-        self, resume: Resume, job_match: JobMatch
-    ) -> Dict[str, Bullet]:
-        """Identify which bullets need adjustment based on gap analysis."""
-        bullets_to_adjust = {}
+    def _rank_valid_candidates(
+        self,
+        bullet: Bullet,
+        candidates: Iterable[BulletCandidate],
+        job_match: JobMatch,
+        rewrite_intent: Optional[str] = None,
+        allowed_job_skills: Optional[List[str]] = None,
+        max_valid: Optional[int] = None,
+    ) -> List[BulletCandidate]:
+        """Validate, rank, and assign risk levels to candidates for a bullet.
         
-        # Check if there are missing skills that could be added
-        required_missing = job_match.skill_gaps.get("required_missing", [])
-        preferred_missing = job_match.skill_gaps.get("preferred_missing", [])
-        missing_skills = job_match.missing_skills or []
+        Args:
+            bullet: The original bullet
+            candidates: Candidates to rank; consumed lazily, so a generator
+                stops producing candidates once max_valid have passed validation
+            job_match: Job match information
+            rewrite_intent: Optional rewrite intent used for validation
+            allowed_job_skills: Precomputed allowed skills for job_match; computed when not provided
+            max_valid: Stop after this many valid candidates (None keeps all)
+        """
+        # Step 3: Validate and filter candidates
+        # Get allowed job skills for validation
+        if allowed_job_skills is None:
+            allowed_job_skills = self._get_allowed_job_skills_for_user(job_match)
+        job_skills = allowed_job_skills if allowed_job_skills else None
+        valid = (
+            candidate
+            for candidate in candidates
+            if self.validator.validate(candidate, bullet.text, job_skills=job_skills, rewrite_intent=rewrite_intent)[0]
+        )
+        valid_candidates = list(islice(valid, max_valid))
         
-        # If no gaps at all, no adjustments needed
-        if not required_missing and not preferred_missing and not missing_skills:
-            return bullets_to_adjust  # No adjustments needed
+        # Step 4: Rank candidates
+        ranked_candidates = self.scorer.rank_candidates(valid_candidates, bullet.text, job_match)
+        
+        # Step 5: Calculate risk levels
+        for candidate in ranked_candidates:
+            candidate.risk_level = self.scorer.calculate_risk_level(candidate, bullet.text)
+        
+        return ranked_candidates
+    
+    def _enumerate_bullets(self, resume: Resume) -> ResumeBullets:
+        """Flatten experience and project bullets with their ids and project context."""
+        resume_bullets = ResumeBullets()
         
-        # Find bullets that could be enhanced
         bullet_id = 0
         for exp_item in resume.experience:
             for bullet in exp_item.bullets:
-                bullet_key = f"exp_{exp_item.organization}_{bullet_id}"
-                # Check if bullet could be enhanced with missing skills
-                if self._bullet_can_be_enhanced(bullet, job_match, context=None):
-                    bullets_to_adjust[bullet_key] = bullet
+                resume_bullets.append(f"exp_{exp_item.organization}_{bullet_id}", bullet, None, None)
                 bullet_id += 1
         
         bullet_id = 0
         for project in resume.projects:
+            # Lowercased once per project rather than once per bullet
+            tech_stack_lower = [s.lower() for s in project.tech_stack]
             for bullet in project.bullets:
-                bullet_key = f"proj_{project.name}_{bullet_id}"
-                # For projects, pass the project's tech stack as context
-                # Only enhance if skills match the project's tech stack
-                if self._bullet_can_be_enhanced(bullet, job_match, context=project.tech_stack):
-                    bullets_to_adjust[bullet_key] = bullet
+                resume_bullets.append(
+                    f"proj_{project.name}_{bullet_id}", bullet, project.tech_stack, project.name,
+                    context_lower=tech_stack_lower,
+                )
                 bullet_id += 1
         
-        return bullets_to_adjust
+        return resume_bullets
+    
+    def _identify_bullets_to_adjust(
+        self, resume: Resume, job_match: JobMatch
+    ) -> ResumeBullets:
+        """Identify which bullets need adjustment based on gap analysis."""
+        selected = ResumeBullets()
+        
+        # Check if there are missing skills that could be added
+        missing = MissingSkillsView.from_job_match(job_match)
+        
+        # If no gaps at all, no adjustments needed
+        if not missing.has_gaps:
+            return selected  # No adjustments needed
+        
+        # Find bullets that could be enhanced. For projects, the project's tech
+        # stack is the context: only enhance if skills match it
+        resume_bullets = self._enumerate_bullets(resume)
+        for bullet_id, bullet, context, project_name, text_lower, context_lower in zip(
+            resume_bullets.ids,
+            resume_bullets.bullets,
+            resume_bullets.contexts,
+            resume_bullets.project_names,
+            resume_bullets.texts_lower,
+            resume_bullets.contexts_lower,
+        ):
+            if self._bullet_can_be_enhanced(
+                bullet, job_match, context=context, missing=missing,
+                text_lower=text_lower, context_lower=context_lower,
+            ):
+                selected.append(bullet_id, bullet, context, project_name, text_lower, context_lower)
+        
+        return selected
     
-    def _bullet_can_be_enhanced(self, bullet: Bullet, job_match: JobMatch, context: Optional[List[str]] = None) -> bool:
+    def _bullet_can_be_enhanced(
+        self,
+        bullet: Bullet,
+        job_match: JobMatch,
+        context: Optional[List[str]] = None,
+        missing: Optional[MissingSkillsView] = None,
+        text_lower: Optional[str] = None,
+        context_lower: Optional[List[str]] = None,
+    ) -> bool:
         """Check if a bullet can be enhanced with missing skills.
         
         Args:
             bullet: The bullet to check
             job_match: Job match information with missing skills
             context: Optional context (e.g., project tech stack) to restrict skill additions
+            missing: Optional precomputed skill gaps; derived from job_match when not provided
+            text_lower: Optional precomputed lowercased bullet text
+            context_lower: Optional precomputed lowercased context
         """
         # Get all missing skills (required, preferred, and general)
-        all_missing = []
-        all_missing.extend(job_match.skill_gaps.get("required_missing", [])[:5])
-        all_missing.extend(job_match.skill_gaps.get("preferred_missing", [])[:3])
-        all_missing.extend(job_match.missing_skills[:3])
+        if missing is None:
+            missing = MissingSkillsView.from_job_match(job_match)
+        all_missing = missing.candidates
         
         if not all_missing:
             return False
@@ -203,17 +839,17 @@ class ResumeRewriter:
         # For project bullets, only consider skills that match the project's tech stack
         if context is not None:
             # Context is a project's tech stack
-            context_lower = [s.lower() for s in context]
+            if context_lower is None:
+                context_lower = [s.lower() for s in context]
             # Filter missing skills to only those that match the project context
             relevant_missing = []
-            for skill in all_missing:
-                skill_lower = skill.lower()
+            for skill, skill_lower in all_missing:
                 # Check if skill matches any tech in the project
                 if any(tech in skill_lower or skill_lower in tech for tech in context_lower):
-                    relevant_missing.append(skill)
+                    relevant_missing.append((skill, skill_lower))
                 # Also check for related skills (e.g., Python -> NumPy, pandas)
                 elif self._skill_matches_context(skill, context_lower):
-                    relevant_missing.append(skill)
+                    relevant_missing.append((skill, skill_lower))
             
             if not relevant_missing:
                 return False  # No relevant skills for this project
@@ -224,17 +860,15 @@ class ResumeRewriter:
             return True
         
         # Check if any missing skills could fit in this bullet's context
-        bullet_text_lower = bullet.text.lower()
-        for missing_skill in all_missing:
-            skill_lower = missing_skill.lower()
+        bullet_text_lower = text_lower if text_lower is not None else bullet.text.lower()
+        for missing_skill, skill_lower in all_missing:
             # Check if skill is mentioned or if bullet context is relevant
             if skill_lower in bullet_text_lower or self._skill_relevant(missing_skill, bullet_text_lower):
                 return True
         
         # For experience bullets (no context), allow enhancement in technical contexts
         if context is None:
-            tech_keywords = ["develop", "build", "implement", "create", "design", "code", "program", "system", "software", "application"]
-            if any(keyword in bullet_text_lower for keyword in tech_keywords):
+            if _TECH_RE.search(bullet_text_lower):
                 # Technical bullets can often be enhanced with additional skills
                 return True
         
@@ -243,16 +877,8 @@ class ResumeRewriter:
     def _skill_matches_context(self, skill: str, context: List[str]) -> bool:
         """Check if a skill matches the project context (e.g., related technologies)."""
         skill_lower = skill.lower()
-        
-        # Related technology mappings
-        related_tech = {
-            "python": ["numpy", "pandas", "scikit-learn", "tensorflow", "pytorch", "matplotlib"],
-            "javascript": ["typescript", "node.js", "react", "vue", "angular"],
-            "java": ["spring", "maven", "gradle"],
-            "golang": ["go"],
-            "react": ["react native", "next.js"],
-            "node.js": ["express", "trpc", "graphql"],
-        }
+        # Technologies related to the skill itself, if it is a mapped key
+        related_to_skill = _RELATED_TECH.get(skill_lower)
         
         # Check if skill is related to any tech in context
         for tech in context:
@@ -261,41 +887,186 @@ class ResumeRewriter:
             if skill_lower in tech_lower or tech_lower in skill_lower:
                 return True
             # Check related technologies
-            for key, related in related_tech.items():
-                if key in tech_lower and skill_lower in related:
-                    return True
-                if skill_lower == key and any(r in tech_lower for r in related):
+            for key in _RELATED_TECH:
+                if key in tech_lower and (key, skill_lower) in _RELATED_PAIRS:
                     return True
+            if related_to_skill and any(r in tech_lower for r in related_to_skill):
+                return True
         
         return False
     
     def _skill_relevant(self, skill: str, bullet_text: str) -> bool:
         """Check if skill is relevant to bullet context."""
         # Simple heuristic: check for related keywords
-        tech_keywords = ["develop", "build", "implement", "create", "design", "code"]
-        return any(keyword in bullet_text for keyword in tech_keywords)
+        return _SKILL_CONTEXT_RE.search(bullet_text) is not None
     
     def _generate_reasoning(
-        self, bullet: Bullet, job_match: JobMatch, ontology: SkillOntology
+        self,
+        bullet: Bullet,
+        job_match: JobMatch,
+        ontology: SkillOntology,
+        allowed_job_skills: Optional[List[str]] = None,
     ) -> Reasoning:
         """Generate reasoning chain for bullet adjustment."""
-        prompt = self._build_reasoning_prompt(bullet, job_match)
+        if allowed_job_skills is None:
+            allowed_job_skills = self._get_allowed_job_skills_for_user(job_match)
         
-        response = self.client.chat.completions.create(
-            model="gpt-4o-mini",
+        if self.reasoning_cache is not None:
+            # A cache hit avoids both prompt construction and the API call
+            signature = self._reasoning_signature(job_match, allowed_job_skills)
+            reasonings, cache_entries = self._lookup_reasonings({"bullet": bullet}, signature)
+            if reasonings:
+                return reasonings["bullet"]
+        
+        response = self.client.chat.completions.create(**self._reasoning_request(bullet, job_match, allowed_job_skills))
+        reasoning = self._parse_reasoning(response.choices[0].message.content)
+        
+        if self.reasoning_cache is not None:
+            key, bullet_signature, embedding = cache_entries["bullet"]
+            self.reasoning_cache.put(key, bullet_signature, reasoning, embedding)
+        return reasoning
+    
+    def _cached_reasonings(
+        self, bullets: Dict[str, Bullet], signature: str
+    ) -> Tuple[Dict[str, Reasoning], Dict[str, List[Any]], List[str]]:
+        """Look up exact reasoning cache hits and stored bullet embeddings.
+        
+        Each bullet is looked up under the job signature narrowed to its own
+        skills, which its reasoning prompt lists alongside the text.
+        
+        Returns:
+            Tuple of (reasoning per cache hit, [cache key, bullet signature,
+            embedding or None] per miss, ids of misses that still need an
+            embedding)
+        """
+        reasonings = {}
+        cache_entries = {}
+        to_embed = []
+        for bullet_id, bullet in bullets.items():
+            bullet_signature = ReasoningCache.bullet_signature(signature, bullet.skills)
+            key = self.reasoning_cache.make_key(bullet.text, bullet_signature)
+            cached = self.reasoning_cache.get(key)
+            if cached is not None:
+                reasonings[bullet_id] = cached
+                continue
+            
+            embedding = None
+            if self.reasoning_cache.semantic:
+                embedding = self.reasoning_cache.get_embedding(bullet.text)
+                if embedding is None:
+                    to_embed.append(bullet_id)
+            cache_entries[bullet_id] = [key, bullet_signature, embedding]
+        
+        return reasonings, cache_entries, to_embed
+    
+    def _similar_reasonings(
+        self,
+        bullets: Dict[str, Bullet],
+        cache_entries: Dict[str, List[Any]],
+        new_embeddings: Dict[str, List[float]],
+    ) -> Dict[str, Reasoning]:
+        """Store new embeddings and resolve misses against similar cached bullets.
+        
+        Misses resolved here are removed from cache_entries.
+        """
+        for bullet_id, embedding in new_embeddings.items():
+            cache_entries[bullet_id][2] = embedding
+            self.reasoning_cache.put_embedding(bullets[bullet_id].text, embedding)
+        
+        reasonings = {}
+        if not self.reasoning_cache.semantic:
+            return reasonings
+        
+        for bullet_id, (key, bullet_signature, embedding) in list(cache_entries.items()):
+            similar = self.reasoning_cache.find_similar(bullet_signature, embedding)
+            if similar is not None:
+                reasonings[bullet_id] = similar
+                self.reasoning_cache.put(key, bullet_signature, similar, embedding)
+                del cache_entries[bullet_id]
+        
+        return reasonings
+    
+    def _embedding_request(self, bullets: Dict[str, Bullet], bullet_ids: List[str]) -> Dict[str, Any]:
+        """Build embedding arguments for several bullets in one request."""
+        return dict(
+            model=EMBEDDING_MODEL,
+            input=[ReasoningCache.normalize_text(bullets[bullet_id].text) for bullet_id in bullet_ids],
+        )
+    
+    def _lookup_reasonings(
+        self, bullets: Dict[str, Bullet], signature: str
+    ) -> Tuple[Dict[str, Reasoning], Dict[str, List[Any]]]:
+        """Resolve bullets against the reasoning cache.
+        
+        Bullets not yet embedded are embedded together in a single request.
+        
+        Returns:
+            Tuple of (reasoning per cached bullet, [cache key, bullet signature,
+            embedding] per remaining miss)
+        """
+        reasonings, cache_entries, to_embed = self._cached_reasonings(bullets, signature)
+        new_embeddings = {}
+        if to_embed:
+            response = self.client.embeddings.create(**self._embedding_request(bullets, to_embed))
+            new_embeddings = {bullet_id: item.embedding for bullet_id, item in zip(to_embed, response.data)}
+        reasonings.update(self._similar_reasonings(bullets, cache_entries, new_embeddings))
+        return reasonings, cache_entries
+    
+    async def _lookup_reasonings_async(
+        self, aclient: AsyncOpenAI, bullets: Dict[str, Bullet], signature: str
+    ) -> Tuple[Dict[str, Reasoning], Dict[str, List[Any]]]:
+        """Resolve bullets against the reasoning cache using the async client.
+        
+        See _lookup_reasonings() for details.
+        """
+        reasonings, cache_entries, to_embed = self._cached_reasonings(bullets, signature)
+        new_embeddings = {}
+        if to_embed:
+            response = await aclient.embeddings.create(**self._embedding_request(bullets, to_embed))
+            new_embeddings = {bullet_id: item.embedding for bullet_id, item in zip(to_embed, response.data)}
+        reasonings.update(self._similar_reasonings(bullets, cache_entries, new_embeddings))
+        return reasonings, cache_entries
+    
+    def _reasoning_signature(
+        self, job_match: JobMatch, allowed_job_skills: Optional[List[str]] = None
+    ) -> str:
+        """Signature of every job-side input that shapes the reasoning prompt."""
+        allowed_skills = allowed_job_skills
+        if allowed_skills is None:
+            allowed_skills = self._get_allowed_job_skills_for_user(job_match)
+        if not allowed_skills and self.user_skills:
+            allowed_skills = self._user_skill_names
+        return ReasoningCache.make_signature(
+            job_match.skill_gaps.get("required_missing", []) or [],
+            job_match.skill_gaps.get("preferred_missing", []) or [],
+            job_match.missing_skills or [],
+            job_match.matching_skills or [],
+            allowed_skills,
+            REASONING_MODEL,
+            REASONING_PROMPT_VERSION,
+        )
+    
+    def _reasoning_request(
+        self, bullet: Bullet, job_match: JobMatch, allowed_job_skills: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """Build chat completion arguments for reasoning generation."""
+        if allowed_job_skills is None:
+            allowed_job_skills = self._get_allowed_job_skills_for_user(job_match)
+        
+        return dict(
+            model=REASONING_MODEL,
             messages=[
-                {
-                    "role": "system",
-                    "content": "You are an expert resume writer. Think step-by-step about how to improve resume bullets to match job requirements."
-                },
-                {"role": "user", "content": prompt}
+                {"role": "system", "content": _REASONING_SYSTEM_MESSAGE},
+                {"role": "user", "content": self._build_reasoning_job_context(job_match, allowed_job_skills)},
+                {"role": "user", "content": self._build_reasoning_prompt(bullet)},
             ],
             response_format={"type": "json_object"},
             temperature=0,
         )
-        
-        import json
-        result = json.loads(response.choices[0].message.content)
+    
+    def _parse_reasoning(self, content: str) -> Reasoning:
+        """Parse a reasoning chain from a JSON completion."""
+        result = fast_json.loads(content)
         
         return Reasoning(
             problem_identification=result.get("problem_identification", ""),
@@ -306,71 +1077,64 @@ class ResumeRewriter:
             confidence_score=result.get("confidence_score", 0.5),
         )
     
-    def _build_reasoning_prompt(self, bullet: Bullet, job_match: JobMatch) -> str:
-        """Build prompt for reasoning generation."""
-        # Get allowed skills: intersection of user skills and job skills
-        allowed_skills = self._get_allowed_job_skills_for_user(job_match)
+    def _allowed_set_lower(self, allowed_skills: List[str]) -> FrozenSet[str]:
+        """Lowercased, stripped allowed skills, shared by both prompt builders.
         
+        A generate call passes the same allowed-skills list to every prompt,
+        so the set is rebuilt only when a different list is passed.
+        """
+        if self._allowed_lower is None or self._allowed_lower[0] is not allowed_skills:
+            self._allowed_lower = (allowed_skills, frozenset(s.lower().strip() for s in allowed_skills))
+        return self._allowed_lower[1]
+    
+    def _build_reasoning_job_context(self, job_match: JobMatch, allowed_skills: List[str]) -> str:
+        """Build the per-job part of the reasoning prompt, shared by every bullet."""
         # Filter missing skills to only those the user actually has AND are job-relevant
-        missing_skills_filtered = []
-        allowed_skills_lower = {s.lower().strip() for s in allowed_skills}
-        for skill in job_match.missing_skills[:10]:
-            skill_lower = skill.lower().strip()
-            if any(allowed.lower().strip() == skill_lower or 
-                   allowed.lower().strip() in skill_lower or 
-                   skill_lower in allowed.lower().strip() 
-                   for allowed in allowed_skills):
-                missing_skills_filtered.append(skill)
-        
-        # Filter required missing skills similarly
-        required_missing_filtered = []
-        for skill in job_match.skill_gaps.get("required_missing", [])[:10]:
-            skill_lower = skill.lower().strip()
-            if any(allowed.lower().strip() == skill_lower or 
-                   allowed.lower().strip() in skill_lower or 
-                   skill_lower in allowed.lower().strip() 
-                   for allowed in allowed_skills):
-                required_missing_filtered.append(skill)
-        
-        missing_skills_str = ", ".join(missing_skills_filtered) if missing_skills_filtered else "None (all covered by your skills)"
-        skill_gaps_str = ", ".join(required_missing_filtered) if required_missing_filtered else "None (all covered by your skills)"
-        
-        user_skills_note = ""
+        allowed_lower = self._allowed_set_lower(allowed_skills)
+        required_missing_filtered = _filter_to_allowed(
+            job_match.skill_gaps.get("required_missing", [])[:10], allowed_lower
+        )
+        # Required skills are already listed; don't repeat them
+        required_set = set(required_missing_filtered)
+        missing_skills_filtered = [
+            skill for skill in _filter_to_allowed(job_match.missing_skills[:10], allowed_lower)
+            if skill not in required_set
+        ]
+        
+        parts = [
+            "Job Requirements:\n- Missing Required Skills: ",
+            ", ".join(required_missing_filtered) if required_missing_filtered else "None (all covered by your skills)",
+            "\n- Other Skills Not in Resume: ",
+            ", ".join(missing_skills_filtered) if missing_skills_filtered else "None",
+            "\n- Matching Skills: ",
+            ", ".join(job_match.matching_skills[:10]),
+        ]
+        
         if allowed_skills:
             user_skills_list = sorted(allowed_skills)[:30]  # Show first 30
-            user_skills_note = f"\n\nCRITICAL CONSTRAINT: You may ONLY work with these verified skills from the user's Skills page that are ALSO job-relevant: {', '.join(user_skills_list)}. Do NOT suggest adding any skills that are not in this list. If a job requires a skill not in this list, acknowledge it but do NOT add it to the bullet."
+            parts += [
+                "\n\nCRITICAL CONSTRAINT: You may ONLY work with these verified skills from the user's Skills page that are ALSO job-relevant: ",
+                ", ".join(user_skills_list),
+                ". Do NOT suggest adding any skills that are not in this list. If a job requires a skill not in this list, acknowledge it but do NOT add it to the bullet.",
+            ]
         elif self.user_skills:
-            user_skills_set = self.user_skills.get_all_skill_names()
-            user_skills_list = sorted(list(user_skills_set))[:30]
-            user_skills_note = f"\n\nCRITICAL CONSTRAINT: You may ONLY work with these verified skills from the user's Skills page: {', '.join(user_skills_list)}. Do NOT suggest adding any skills that are not in this list. If a job requires a skill not in this list, acknowledge it but do NOT add it to the bullet."
+            user_skills_list = self._user_skill_names[:30]
+            parts += [
+                "\n\nCRITICAL CONSTRAINT: You may ONLY work with these verified skills from the user's Skills page: ",
+                ", ".join(user_skills_list),
+                ". Do NOT suggest adding any skills that are not in this list. If a job requires a skill not in this list, acknowledge it but do NOT add it to the bullet.",
+            ]
         
-        return f"""Analyze this resume bullet and job requirements to generate a reasoning chain for improvement.
-
-Current Bullet: {bullet.text}
-Skills in Bullet: {', '.join(bullet.skills)}
-
-Job Requirements:
-- Missing Required Skills: {skill_gaps_str}
-- Skills Not in Resume: {missing_skills_str}
-- Matching Skills: {', '.join(job_match.matching_skills[:10])}{user_skills_note}
-
-Think step-by-step and provide:
-1. problem_identification: What gap/issue prompted this change? (Only consider gaps that can be addressed with verified skills)
-2. analysis: How does current bullet compare to job requirements? (Focus on skills you can actually add)
-3. solution_approach: Why was this approach chosen? (Only use verified skills from the Skills page)
-4. evaluation: Why does this variation work better? (Without fabricating new skills)
-5. alternatives_considered: What other approaches were considered? (list)
-6. confidence_score: Confidence in this change (0.0-1.0)
-
-Return as JSON:
-{{
-    "problem_identification": "...",
-    "analysis": "...",
-    "solution_approach": "...",
-    "evaluation": "...",
-    "alternatives_considered": ["...", "..."],
-    "confidence_score": 0.85
-}}"""
+        return "".join(parts)
+    
+    def _build_reasoning_prompt(self, bullet: Bullet) -> str:
+        """Build the per-bullet part of the reasoning prompt."""
+        return "".join([
+            "Analyze this resume bullet against the job requirements above to generate a reasoning chain for improvement.\n\nCurrent Bullet: ",
+            bullet.text,
+            "\nSkills in Bullet: ",
+            ", ".join(bullet.skills),
+        ])
     
     def _generate_candidates_with_reasoning(
         self,
@@ -381,6 +1145,7 @@ Return as JSON:
         project_context: Optional[List[str]] = None,
         project_name: Optional[str] = None,
         rewrite_intent: Optional[str] = None,
+        allowed_job_skills: Optional[List[str]] = None,
     ) -> List[BulletCandidate]:
         """Generate bullet candidates with metadata based on reasoning.
         
@@ -392,64 +1157,145 @@ Return as JSON:
             project_context: Optional project tech stack to restrict skill additions
             project_name: Optional project name for user skills filtering
             rewrite_intent: Optional rewrite intent to guide generation
+            allowed_job_skills: Precomputed allowed skills for job_match; computed when not provided
         
         Returns:
             List of BulletCandidate objects with metadata
         """
-        prompt = self._build_candidate_prompt(bullet, reasoning, job_match, project_context=project_context, project_name=project_name, rewrite_intent=rewrite_intent)
+        response = self.client.chat.completions.create(**self._candidates_request(
+            bullet, reasoning, job_match,
+            project_context=project_context, project_name=project_name, rewrite_intent=rewrite_intent,
+            allowed_job_skills=allowed_job_skills,
+        ))
+        return self._parse_candidates(response.choices[0].message.content, bullet, rewrite_intent)
+    
+    async def _generate_candidates_with_reasoning_async(
+        self,
+        aclient: AsyncOpenAI,
+        bullet: Bullet,
+        reasoning: Reasoning,
+        job_match: JobMatch,
+        ontology: SkillOntology,
+        project_context: Optional[List[str]] = None,
+        project_name: Optional[str] = None,
+        rewrite_intent: Optional[str] = None,
+        allowed_job_skills: Optional[List[str]] = None,
+    ) -> List[BulletCandidate]:
+        """Generate bullet candidates using the async client.
         
-        system_message = "You are an expert resume writer. Generate bullet point candidates with detailed metadata including scores, diffs, and justifications. Maintain factual accuracy - do not fabricate experience."
+        See _generate_candidates_with_reasoning() for argument details.
+        """
+        response = await aclient.chat.completions.create(**self._candidates_request(
+            bullet, reasoning, job_match,
+            project_context=project_context, project_name=project_name, rewrite_intent=rewrite_intent,
+            allowed_job_skills=allowed_job_skills,
+        ))
+        return self._parse_candidates(response.choices[0].message.content, bullet, rewrite_intent)
+    
+    def _candidates_request(
+        self,
+        bullet: Bullet,
+        reasoning: Reasoning,
+        job_match: JobMatch,
+        project_context: Optional[List[str]] = None,
+        project_name: Optional[str] = None,
+        rewrite_intent: Optional[str] = None,
+        allowed_job_skills: Optional[List[str]] = None,
+    ) -> Dict[str, Any]:
+        """Build chat completion arguments for candidate generation."""
+        if allowed_job_skills is None:
+            allowed_job_skills = self._get_allowed_job_skills_for_user(job_match)
+        
+        # Project bullets with their own verified skills get a project-specific
+        # constraint; all others share the job-level allowed-skills constraint
+        project_skills = None
+        if self.user_skills and project_name:
+            project_skills = self.user_skills.get_skills_for_project(project_name)
+        
+        system_message = _CANDIDATE_SYSTEM_MESSAGE
         if self.user_skills:
-            system_message += " CRITICAL: You may ONLY use skills from the user's verified Skills page. Adding any skill not explicitly listed is STRICTLY FORBIDDEN and will result in rejection."
+            system_message += _CANDIDATE_SKILLS_RULE
+        
+        job_context = self._build_candidate_job_context(
+            job_match, allowed_job_skills, rewrite_intent,
+            include_allowed_constraint=bool(self.user_skills) and not project_skills,
+        )
+        prompt = self._build_candidate_prompt(
+            bullet, reasoning, job_match,
+            project_context=project_context,
+            project_skills=project_skills,
+            allowed_job_skills=allowed_job_skills,
+        )
         
-        response = self.client.chat.completions.create(
+        return dict(
             model="gpt-4o-mini",
             messages=[
-                {
-                    "role": "system",
-                    "content": system_message
-                },
-                {"role": "user", "content": prompt}
+                {"role": "system", "content": system_message},
+                {"role": "user", "content": job_context},
+                {"role": "user", "content": prompt},
             ],
             response_format={"type": "json_object"},
             temperature=0.7,  # Some creativity for variations
         )
+    
+    def _parse_candidates(
+        self, content: str, bullet: Bullet, rewrite_intent: Optional[str] = None
+    ) -> List[BulletCandidate]:
+        """Parse bullet candidates from a JSON completion."""
+        result = fast_json.loads(content)
+        candidates = list(self._iter_candidates(result.get("candidates", []), bullet, rewrite_intent))
         
-        import json
-        result = json.loads(response.choices[0].message.content)
-        candidates_data = result.get("candidates", [])
+        # Ensure we have at least one candidate
+        if not candidates:
+            # Fallback: create a candidate from original
+            candidates.append(BulletCandidate(
+                candidate_id=f"{bullet.text[:20]}_{uuid.uuid4().hex[:8]}",
+                text=bullet.text,
+                score={"job_skill_coverage": 0.0, "ats_keyword_gain": 0, "semantic_similarity": 1.0, "constraint_violations": 0},
+                diff_from_original={"added": [], "removed": []},
+                justification={"job_requirements_addressed": [], "skills_mapped": [], "why_this_version": "Original bullet"},
+                risk_level="low",
+                rewrite_intent=None,
+                composite_score=0.0,
+            ))
         
-        candidates = []
-        for i, cand_data in enumerate(candidates_data[:4]):
-            var_text = cand_data.get("text", "")
-            
+        return candidates
+    
+    @staticmethod
+    def _copy_candidates(candidates: List[BulletCandidate], bullet: Bullet) -> List[BulletCandidate]:
+        """Deep-copy a duplicate bullet's candidates, giving each a fresh candidate_id."""
+        candidate_prefix = f"{bullet.text[:20]}_"
+        return [
+            c.model_copy(update={"candidate_id": candidate_prefix + uuid.uuid4().hex[:8]}, deep=True)
+            for c in candidates
+        ]
+    
+    def _iter_candidates(
+        self, candidates_data: List[Dict[str, Any]], bullet: Bullet, rewrite_intent: Optional[str] = None
+    ) -> Iterator[BulletCandidate]:
+        """Lazily build BulletCandidate objects from parsed candidate JSON."""
+        candidate_prefix = f"{bullet.text[:20]}_"
+        for cand_data in islice(candidates_data, MAX_CANDIDATES_PER_BULLET):
+            get = cand_data.get
             # Validate bullet length
-            if len(var_text) > 150:
-                var_text = var_text[:147] + "..."
+            var_text = _truncate_bullet(get("text", ""))
             
             # Extract metadata
-            score = cand_data.get("score", {})
-            diff = cand_data.get("diff_from_original", {"added": [], "removed": []})
-            justification = cand_data.get("justification", {})
-            intent = cand_data.get("rewrite_intent", rewrite_intent)
+            score = get("score") or {}
+            diff = get("diff_from_original") or {}
+            justification = get("justification") or {}
+            intent = get("rewrite_intent", rewrite_intent)
             
-            # Create candidate
-            candidate = BulletCandidate(
-                candidate_id=f"{bullet.text[:20]}_{uuid.uuid4().hex[:8]}",
+            # Create candidate. Text is already truncated to the length limit
+            # and risk_level is fixed, so field validation is skipped; scores
+            # are coerced to float here as validation would have done.
+            candidate = BulletCandidate.model_construct(
+                candidate_id=candidate_prefix + uuid.uuid4().hex[:8],
                 text=var_text,
-                score={
-                    "job_skill_coverage": score.get("job_skill_coverage", 0.0),
-                    "ats_keyword_gain": score.get("ats_keyword_gain", 0),
-                    "semantic_similarity": score.get("semantic_similarity", 0.0),
-                    "constraint_violations": score.get("constraint_violations", 0),
-                },
-                diff_from_original={
-                    "added": diff.get("added", []),
-                    "removed": diff.get("removed", []),
-                },
+                score={key: float(score.get(key, default)) for key, default in _SCORE_DEFAULTS.items()},
+                diff_from_original={key: list(diff.get(key, [])) for key in _DIFF_KEYS},
                 justification={
-                    "job_requirements_addressed": justification.get("job_requirements_addressed", []),
-                    "skills_mapped": justification.get("skills_mapped", []),
+                    **{key: list(justification.get(key, [])) for key in _JUSTIFICATION_LIST_KEYS},
                     "why_this_version": justification.get("why_this_version", ""),
                 },
                 risk_level="medium",  # Will be calculated later
@@ -457,169 +1303,140 @@ Return as JSON:
                 composite_score=0.0,  # Will be calculated by scorer
             )
             
-            candidates.append(candidate)
+            yield candidate
+    
+    def _get_feedback_note(self) -> str:
+        """Get the user preference note, reloading feedback only when its file changes."""
+        try:
+            mtime = FEEDBACK_PATH.stat().st_mtime_ns
+        except OSError:
+            mtime = None
         
-        # Ensure we have at least one candidate
-        if not candidates:
-            # Fallback: create a candidate from original
-            candidates.append(BulletCandidate(
-                candidate_id=f"{bullet.text[:20]}_{uuid.uuid4().hex[:8]}",
-                text=bullet.text,
-                score={"job_skill_coverage": 0.0, "ats_keyword_gain": 0, "semantic_similarity": 1.0, "constraint_violations": 0},
-                diff_from_original={"added": [], "removed": []},
-                justification={"job_requirements_addressed": [], "skills_mapped": [], "why_this_version": "Original bullet"},
-                risk_level="low",
-                rewrite_intent=None,
-                composite_score=0.0,
-            ))
+        if self._feedback_note is None or self._feedback_note[0] != mtime:
+            try:
+                note = BulletFeedbackStore(FEEDBACK_PATH).preference_note()
+            except Exception:
+                note = ""
+            self._feedback_note = (mtime, note)
         
-        return candidates
+        return self._feedback_note[1]
     
-    def _build_candidate_prompt(
-        self, bullet: Bullet, reasoning: Reasoning, job_match: JobMatch, project_context: Optional[List[str]] = None, project_name: Optional[str] = None, rewrite_intent: Optional[str] = None
+    def _build_candidate_job_context(
+        self,
+        job_match: JobMatch,
+        allowed_skills: List[str],
+        rewrite_intent: Optional[str] = None,
+        include_allowed_constraint: bool = True,
     ) -> str:
-        """Build prompt for variation generation."""
-        from src.compilation.bullet_feedback import BulletFeedbackStore
+        """Build the per-job part of the candidate prompt, shared by every bullet.
         
-        # Get allowed skills: intersection of user skills and job skills
-        allowed_skills = self._get_allowed_job_skills_for_user(job_match)
+        Args:
+            job_match: Job match information
+            allowed_skills: Intersection of user skills and job skills
+            rewrite_intent: Optional rewrite intent to guide generation
+            include_allowed_constraint: Whether to restrict skills to allowed_skills here
+                (False when the bullet carries a project-specific constraint instead)
+        """
+        intent_label = rewrite_intent or "emphasize_skills"
         
-        context_note = ""
-        if project_context:
-            context_note = f"\n\nIMPORTANT - Project Context: This bullet is part of a project with tech stack: {', '.join(project_context)}. Only add skills that are relevant to this project's tech stack. Do NOT add unrelated skills (e.g., do not add Golang/Swift/Kotlin to a Python/ML project unless they are actually used in the project)."
+        # Filter job context to only show skills the user actually has AND are job-relevant
+        allowed_lower = self._allowed_set_lower(allowed_skills)
+        job_required_filtered = _filter_to_allowed(job_match.skill_gaps.get('required_missing', [])[:5], allowed_lower)
+        # Required skills are already listed; don't repeat them
+        required_set = set(job_required_filtered)
+        job_missing_filtered = [
+            skill for skill in _filter_to_allowed(job_match.missing_skills[:5], allowed_lower)
+            if skill not in required_set
+        ]
         
-        # Add user skills restriction if available - STRICT ENFORCEMENT
-        user_skills_note = ""
-        if self.user_skills:
-            # Get allowed skills for this project (if project_name provided)
-            if project_name:
-                project_skills = self.user_skills.get_skills_for_project(project_name)
-                # Intersect with job-relevant skills
-                if project_skills:
-                    # Filter to only skills that are both in project AND in allowed_skills
-                    project_allowed = [s for s in project_skills if s in allowed_skills or any(s.lower() == a.lower() for a in allowed_skills)]
-                    if project_allowed:
-                        user_skills_note = f"\n\n🚫 STRICT CONSTRAINT - Allowed Skills ONLY: You MUST ONLY use these verified skills for this project that are ALSO job-relevant: {', '.join(project_allowed)}. It is FORBIDDEN to add ANY skill not in this list. If a job requires a skill not listed here, you MUST NOT add it - instead, rephrase the bullet to emphasize skills you CAN use."
-                    else:
-                        # No intersection - use project skills but warn
-                        user_skills_note = f"\n\n🚫 STRICT CONSTRAINT - Allowed Skills ONLY: You MUST ONLY use these verified skills for this project: {', '.join(project_skills)}. It is FORBIDDEN to add ANY skill not in this list."
-                else:
-                    # No project-specific skills, use allowed job skills
-                    if allowed_skills:
-                        user_skills_note = f"\n\n🚫 STRICT CONSTRAINT - Allowed Skills ONLY: You MUST ONLY use these verified skills from the Skills page that are ALSO job-relevant: {', '.join(allowed_skills[:40])}. It is FORBIDDEN to add ANY skill not in this list."
-            else:
-                # For non-project bullets, use allowed job skills
-                if allowed_skills:
-                    user_skills_note = f"\n\n🚫 STRICT CONSTRAINT - Allowed Skills ONLY: You MUST ONLY use these verified skills from the Skills page that are ALSO job-relevant: {', '.join(allowed_skills[:40])}. It is FORBIDDEN to add ANY skill not in this list. If a job requires a skill not listed here, you MUST NOT add it - instead, rephrase the bullet to emphasize skills you CAN use."
+        parts = [
+            _CANDIDATE_FIELDS_INSTRUCTIONS,
+            intent_label,
+            _CANDIDATE_RULES_AND_FORMAT,
+            intent_label,
+            _CANDIDATE_PROMPT_END,
+            "\n\nJob Context (filtered to your verified skills only):\n- Required Skills You Can Address: ",
+            ", ".join(job_required_filtered) if job_required_filtered else _NO_FILTERED_SKILLS,
+            "\n- Other Missing Skills You Can Address: ",
+            ", ".join(job_missing_filtered) if job_missing_filtered else "None",
+            "\n- Matching Skills: ",
+            ", ".join(job_match.matching_skills[:5]),
+        ]
         
-        # Filter job context to only show skills the user actually has AND are job-relevant
-        job_missing_filtered = []
-        job_required_filtered = []
-        allowed_skills_lower = {s.lower().strip() for s in allowed_skills}
-        for skill in job_match.missing_skills[:5]:
-            skill_lower = skill.lower().strip()
-            if any(allowed.lower().strip() == skill_lower or 
-                   allowed.lower().strip() in skill_lower or 
-                   skill_lower in allowed.lower().strip() 
-                   for allowed in allowed_skills):
-                job_missing_filtered.append(skill)
-        for skill in job_match.skill_gaps.get('required_missing', [])[:5]:
-            skill_lower = skill.lower().strip()
-            if any(allowed.lower().strip() == skill_lower or 
-                   allowed.lower().strip() in skill_lower or 
-                   skill_lower in allowed.lower().strip() 
-                   for allowed in allowed_skills):
-                job_required_filtered.append(skill)
-
         # Incorporate simple user preference note based on past feedback
-        feedback_note = ""
-        try:
-            store = BulletFeedbackStore()
-            note = store.preference_note()
-            if note:
-                feedback_note = f"\\n\\nUSER PREFERENCES: {note}"
-        except Exception:
-            feedback_note = ""
+        note = self._get_feedback_note()
+        if note:
+            parts += ["\n\nUSER PREFERENCES: ", note]
         
         # Build intent-specific guidance
-        intent_guidance = ""
-        if rewrite_intent == "reword_only":
-            intent_guidance = "\n\n🚫 CRITICAL: REWORD-ONLY MODE - You MUST NOT add any new skills. You may ONLY reword the existing bullet text to improve clarity, strength, or readability. The set of skills mentioned in the bullet must remain EXACTLY the same. Preserve all existing skills and do not introduce any new technical terms or skill names."
-        elif rewrite_intent == "emphasize_skills":
-            intent_guidance = "\n\nFocus: Emphasize required/preferred skills from the job description. Add skill keywords naturally, but ONLY from the allowed skills list."
-        elif rewrite_intent == "more_technical":
-            intent_guidance = "\n\nFocus: Make the bullet more technical and specific. Use precise technical terminology, but ONLY from the allowed skills list."
-        elif rewrite_intent == "more_concise":
-            intent_guidance = "\n\nFocus: Make the bullet more concise while preserving key information. Remove unnecessary words. Do not add new skills unless they are in the allowed list."
-        elif rewrite_intent == "conservative":
-            intent_guidance = "\n\nFocus: Conservative rewrite - minimal changes, only add skills that clearly fit the context AND are in the allowed skills list. Avoid scope expansion."
-        
-        return f"""Generate 4 bullet candidates with detailed metadata based on the reasoning chain.
-
-Original Bullet: {bullet.text}
-Current Skills: {', '.join(bullet.skills)}{context_note}{user_skills_note}{intent_guidance}
-
-Reasoning:
-- Problem: {reasoning.problem_identification}
-- Analysis: {reasoning.analysis}
-- Solution Approach: {reasoning.solution_approach}
-- Evaluation: {reasoning.evaluation}
-- Alternatives: {', '.join(reasoning.alternatives_considered[:3])}
-
-Job Context (filtered to your verified skills only):
-- Missing Skills You Can Address: {', '.join(job_missing_filtered) if job_missing_filtered else 'None - focus on emphasizing existing skills'}
-- Required Skills You Can Address: {', '.join(job_required_filtered) if job_required_filtered else 'None - focus on emphasizing existing skills'}
-- Matching Skills: {', '.join(job_match.matching_skills[:5])}
-{feedback_note}
-
-For each candidate, provide:
-1. text: The bullet text (≤150 characters)
-2. score: Object with:
-   - job_skill_coverage: 0.0-1.0 (how well it covers required/preferred skills)
-   - ats_keyword_gain: integer (number of new ATS keywords added)
-   - semantic_similarity: 0.0-1.0 (how similar to original meaning)
-   - constraint_violations: integer (number of constraint violations, 0 is best)
-3. diff_from_original: Object with:
-   - added: List of words/phrases added
-   - removed: List of words/phrases removed
-4. justification: Object with:
-   - job_requirements_addressed: List of job requirements this addresses
-   - skills_mapped: List of skills mentioned/added
-   - why_this_version: Brief explanation
-5. rewrite_intent: "{rewrite_intent or 'emphasize_skills'}"
-
-Each candidate must:
-- Be ≤150 characters
-- Maintain factual accuracy (no fabrication)
-- Include ONLY skills from the verified Skills page list (if provided)
-- Have one clear claim per bullet
-- For project bullets: Only use skills that match the project's tech stack AND are in your Skills page
-- NEVER add skills that are not in the allowed skills list - this is STRICTLY FORBIDDEN
-- If a job requires a skill you don't have, rephrase to emphasize skills you DO have instead of adding new ones
-
-Return as JSON:
-{{
-    "candidates": [
-        {{
-            "text": "...",
-            "score": {{
-                "job_skill_coverage": 0.85,
-                "ats_keyword_gain": 3,
-                "semantic_similarity": 0.90,
-                "constraint_violations": 0
-            }},
-            "diff_from_original": {{
-                "added": ["Linux", "pipelines"],
-                "removed": []
-            }},
-            "justification": {{
-                "job_requirements_addressed": ["Linux experience", "Automation"],
-                "skills_mapped": ["Python", "Linux", "Automation"],
-                "why_this_version": "Maximizes required skill coverage without introducing new experience claims"
-            }},
-            "rewrite_intent": "{rewrite_intent or 'emphasize_skills'}"
-        }},
-        ...
-    ]
-}}"""
-
+        parts.append(_INTENT_GUIDANCE.get(rewrite_intent, ""))
+        
+        # Add user skills restriction - STRICT ENFORCEMENT
+        if include_allowed_constraint and allowed_skills:
+            parts += [
+                "\n\n🚫 STRICT CONSTRAINT - Allowed Skills ONLY: You MUST ONLY use these verified skills from the Skills page that are ALSO job-relevant: ",
+                ", ".join(allowed_skills[:40]),
+                ". It is FORBIDDEN to add ANY skill not in this list. If a job requires a skill not listed here, you MUST NOT add it - instead, rephrase the bullet to emphasize skills you CAN use.",
+            ]
+        
+        return "".join(parts)
+    
+    def _build_candidate_prompt(
+        self,
+        bullet: Bullet,
+        reasoning: Reasoning,
+        job_match: JobMatch,
+        project_context: Optional[List[str]] = None,
+        project_skills: Optional[List[str]] = None,
+        allowed_job_skills: Optional[List[str]] = None,
+    ) -> str:
+        """Build the per-bullet part of the candidate prompt."""
+        parts = [
+            "Generate the candidates for this bullet.\n\nOriginal Bullet: ",
+            bullet.text,
+            "\nCurrent Skills: ",
+            ", ".join(bullet.skills),
+        ]
+        
+        if project_context:
+            parts += [
+                "\n\nIMPORTANT - Project Context: This bullet is part of a project with tech stack: ",
+                ", ".join(project_context),
+                ". Only add skills that are relevant to this project's tech stack. Do NOT add unrelated skills (e.g., do not add Golang/Swift/Kotlin to a Python/ML project unless they are actually used in the project).",
+            ]
+        
+        if project_skills:
+            # Intersect the project's verified skills with job-relevant skills
+            allowed_skills = allowed_job_skills
+            if allowed_skills is None:
+                allowed_skills = self._get_allowed_job_skills_for_user(job_match)
+            allowed_set = set(allowed_skills)
+            allowed_casefold = {a.lower() for a in allowed_skills}
+            project_allowed = [s for s in project_skills if s in allowed_set or s.lower() in allowed_casefold]
+            if project_allowed:
+                parts += [
+                    "\n\n🚫 STRICT CONSTRAINT - Allowed Skills ONLY: You MUST ONLY use these verified skills for this project that are ALSO job-relevant: ",
+                    ", ".join(project_allowed),
+                    ". It is FORBIDDEN to add ANY skill not in this list. If a job requires a skill not listed here, you MUST NOT add it - instead, rephrase the bullet to emphasize skills you CAN use.",
+                ]
+            else:
+                # No intersection - use project skills but warn
+                parts += [
+                    "\n\n🚫 STRICT CONSTRAINT - Allowed Skills ONLY: You MUST ONLY use these verified skills for this project: ",
+                    ", ".join(project_skills),
+                    ". It is FORBIDDEN to add ANY skill not in this list.",
+                ]
+        
+        parts += [
+            "\n\nReasoning:\n- Problem: ",
+            reasoning.problem_identification,
+            "\n- Analysis: ",
+            reasoning.analysis,
+            "\n- Solution Approach: ",
+            reasoning.solution_approach,
+            "\n- Evaluation: ",
+            reasoning.evaluation,
+            "\n- Alternatives: ",
+            ", ".join(reasoning.alternatives_considered[:3]),
+        ]
+        return "".join(parts)
@@ -1,30 +1,678 @@
 """Database interface for ATS pipeline."""
 
-import json
+import logging
 import sqlite3
+import threading
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field, fields
 from datetime import datetime
+from functools import cached_property, lru_cache
+from itertools import islice
 from pathlib import Path
-from typing import List, Optional, Dict
+from typing import Dict, Iterable, Iterator, List, Optional, Union
 
 from src.models.resume import Resume, Reasoning
 from src.models.job import JobPosting, JobSkills, JobMatch
 from src.models.resume import Justification
-from .schema import create_tables
+from src.utils import fast_json
+from . import pool
+from .schema import create_job_unique_indexes
+
+
+logger = logging.getLogger(__name__)
+
+# INSERT ... RETURNING needs SQLite 3.35+
+if sqlite3.sqlite_version_info < (3, 35, 0):
+    raise ImportError(f"SQLite 3.35 or newer is required, found {sqlite3.sqlite_version}")
+
+
+# Write transactions between PRAGMA optimize runs, so planner statistics
+# keep up with table growth on long-lived connections
+_OPTIMIZE_INTERVAL = 1000
+
+# Parsed resumes kept per Database, keyed by (id, updated_at)
+_RESUME_CACHE_SIZE = 256
+
+
+# SQLite 3.45+ stores JSON columns in its binary JSONB format; json() reads
+# back both JSONB and rows written as text by older versions. The change is
+# one-way: a database written under 3.45+ cannot be read back by an older
+# SQLite, and raw SQL reading these columns gets bytes unless it wraps them
+# in json() (see _json_column)
+JSONB_AVAILABLE = sqlite3.sqlite_version_info >= (3, 45, 0)
+_JSON_PARAM = "jsonb(?)" if JSONB_AVAILABLE else "?"
+
+
+def _json_column(name: str) -> str:
+    """Select expression returning a JSON column as text."""
+    return f"json({name}) AS {name}" if JSONB_AVAILABLE else name
+
+
+_JOB_COLUMNS = ", ".join([
+    "id", "company", "title", "location", "description", "source_url", "date_posted",
+    _json_column("job_skills_json"), "status", "created_at", "date_applied", "notes",
+    "contact_name", "contact_info", "interview_dates", "offer_outcome",
+])
+
+_SELECT_JOB_SQL = f"SELECT {_JOB_COLUMNS} FROM jobs WHERE id = ?"
+
+# Only the columns get_job turns into a JobPosting
+_SELECT_JOB_POSTING_SQL = "SELECT company, title, location, description, source_url, date_posted FROM jobs WHERE id = ?"
+
+_SELECT_ALL_JOBS_SQL = f"SELECT {_JOB_COLUMNS} FROM jobs ORDER BY created_at DESC"
+
+_SELECT_JOB_SKILLS_SQL = f"SELECT {_json_column('job_skills_json')} FROM jobs WHERE id = ?"
+
+_SELECT_RESUME_JSON_SQL = f"SELECT {_json_column('resume_json')} FROM resumes WHERE id = ?"
+
+# Resume cache keys: (id, updated_at) of one resume, or of the most recent one
+_SELECT_RESUME_VERSION_SQL = "SELECT id, updated_at FROM resumes WHERE id = ?"
+
+_SELECT_LATEST_RESUME_VERSION_SQL = "SELECT id, updated_at FROM resumes ORDER BY updated_at DESC LIMIT 1"
+
+_SELECT_JOB_STATUS_SQL = "SELECT status FROM jobs WHERE id = ?"
+
+_UPDATE_JOB_STATUS_SQL = "UPDATE jobs SET status = ? WHERE id = ?"
+
+_SELECT_JOB_MATCH_SQL = f"""
+    SELECT job_id, fit_score, {_json_column('match_details_json')}
+    FROM job_matches WHERE id = ?
+"""
+
+# Local time with milliseconds, generated by SQLite; compares correctly
+# against the datetime.now() values older rows were written with
+_NOW_SQL = "strftime('%Y-%m-%d %H:%M:%f', 'now', 'localtime')"
+
+_SELECT_JOB_RESUME_VERSIONS_SQL = """
+    SELECT id, updated_at, file_path, is_customized, created_at
+    FROM resumes
+    WHERE job_id = ?
+    ORDER BY created_at DESC
+"""
+
+_INSERT_RESUME_SQL = f"""
+    INSERT INTO resumes (version, resume_json, file_path, job_id, is_customized, updated_at)
+    VALUES (?, {_JSON_PARAM}, ?, ?, ?, {_NOW_SQL})
+    RETURNING id
+"""
+
+# Buffered (durable=False) writes are flushed once this many rows are
+# pending, or this long after the first one, whichever comes first
+_WRITE_BUFFER_MAX_ROWS = 100
+_WRITE_BUFFER_FLUSH_SECONDS = 0.01
+
+# Rows save_jobs commits per transaction, so a large import does not grow
+# the WAL unboundedly
+_BULK_CHUNK_ROWS = 5000
+
+_INSERT_JOB_SQL = f"""
+    INSERT INTO jobs (company, title, location, description, source_url, date_posted, job_skills_json, status,
+                      date_applied, notes, contact_name, contact_info, interview_dates, offer_outcome)
+    VALUES (?, ?, ?, ?, ?, ?, {_JSON_PARAM}, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT DO NOTHING
+    RETURNING id
+"""
+
+_UPDATE_DUPLICATE_JOB_SQL = f"""
+    UPDATE jobs
+    SET location = ?, description = ?, source_url = ?, date_posted = ?,
+        job_skills_json = {_JSON_PARAM}, status = ?, date_applied = ?, notes = ?,
+        contact_name = ?, contact_info = ?, interview_dates = ?, offer_outcome = ?
+    WHERE id = (
+        SELECT id FROM jobs
+        WHERE (source_url = ? AND source_url != '')
+           OR (LOWER(company) = LOWER(?) AND LOWER(title) = LOWER(?))
+        ORDER BY source_url IS ? DESC
+        LIMIT 1
+    )
+    RETURNING id
+"""
+
+# Served entirely from idx_job_matches_job_created
+_SELECT_LATEST_FIT_SCORE_SQL = """
+    SELECT fit_score FROM job_matches
+    WHERE job_id = ?
+    ORDER BY created_at DESC
+    LIMIT 1
+"""
+
+# Served entirely from the partial idx_job_matches_job_customized
+_SELECT_CUSTOMIZED_RESUME_IDS_SQL = """
+    SELECT resume_id FROM job_matches
+    WHERE job_id = ? AND resume_customized_for_job = 1
+    ORDER BY created_at DESC
+"""
+
+_INSERT_JOB_MATCH_SQL = f"""
+    INSERT INTO job_matches (job_id, resume_id, fit_score, match_details_json, resume_customized_for_job)
+    VALUES (?, ?, ?, {_JSON_PARAM}, ?)
+    RETURNING id
+"""
+
+_INSERT_JOB_MATCH_SKILL_SQL = """
+    INSERT INTO job_match_skills (match_id, kind, position, skill)
+    VALUES (?, ?, ?, ?)
+"""
+
+_SELECT_JOB_MATCH_SKILLS_SQL = """
+    SELECT kind, skill FROM job_match_skills
+    WHERE match_id = ?
+    ORDER BY kind, position
+"""
+
+# Prefix of job_match_skills kinds holding JobMatch.skill_gaps entries
+_GAP_KIND_PREFIX = "gap:"
+
+_INSERT_APPLICATION_SQL = f"""
+    INSERT INTO applications (job_id, resume_id, status, applied_at, notes)
+    VALUES (?, ?, ?, {_NOW_SQL}, ?)
+    RETURNING id
+"""
+
+# Count, mean, range and median of completed time-to-apply durations; the
+# median averages the middle one or two rows of the sorted durations
+_TIME_TO_APPLY_STATS_SQL = """
+    WITH durations AS (
+        SELECT duration_seconds FROM time_to_apply WHERE duration_seconds IS NOT NULL
+    )
+    SELECT
+        COUNT(*) AS count,
+        AVG(duration_seconds) AS avg_seconds,
+        MIN(duration_seconds) AS min_seconds,
+        MAX(duration_seconds) AS max_seconds,
+        (
+            SELECT AVG(duration_seconds) FROM (
+                SELECT duration_seconds FROM durations
+                ORDER BY duration_seconds
+                LIMIT 2 - (SELECT COUNT(*) FROM durations) % 2
+                OFFSET ((SELECT COUNT(*) FROM durations) - 1) / 2
+            )
+        ) AS median_seconds
+    FROM durations
+"""
+
+# Ranked missing skills, keyed by get_missing_skills_ranked's `by`
+_MISSING_SKILLS_RANKED_SQL = {
+    by: f"""
+        SELECT skill_name, frequency_count, required_count, preferred_count,
+               general_count, priority_score
+        FROM missing_skills_aggregation
+        ORDER BY {order}
+        LIMIT ?
+    """
+    for by, order in (
+        ('frequency', "frequency_count DESC, priority_score DESC"),
+        ('priority', "priority_score DESC, frequency_count DESC"),
+    )
+}
+
+_INSERT_EVENT_SQL = f"""
+    INSERT INTO analytics_events (event_type, metadata_json, created_at)
+    VALUES (?, ?, {_NOW_SQL})
+    RETURNING id
+"""
+
+_INSERT_BULLET_CHANGE_SQL = """
+    INSERT INTO bullet_changes (
+        resume_id, bullet_id, original_text, new_text,
+        justification_json, reasoning_json,
+        selected_variation_index, approved_by_human
+    )
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+    RETURNING id
+"""
+
+
+def _job_details(
+    job: JobPosting,
+    job_skills: Optional[JobSkills],
+    status: Optional[str],
+    date_applied: Optional[datetime] = None,
+    notes: Optional[str] = None,
+    contact_name: Optional[str] = None,
+    contact_info: Optional[str] = None,
+    interview_dates: Optional[str] = None,
+    offer_outcome: Optional[str] = None,
+) -> tuple:
+    """Build the _INSERT_JOB_SQL parameters that follow company and title."""
+    return (
+        job.location,
+        job.description,
+        job.source_url,
+        job.date_posted,
+        job_skills.model_dump_json() if job_skills else None,
+        status or 'New',
+        date_applied,
+        notes,
+        contact_name,
+        contact_info,
+        interview_dates,
+        offer_outcome,
+    )
+
+
+def _match_skill_rows(job_match: JobMatch) -> List[tuple]:
+    """Flatten a match's skill lists into (kind, position, skill) rows."""
+    lists = [("missing", job_match.missing_skills), ("matching", job_match.matching_skills)]
+    lists.extend((_GAP_KIND_PREFIX + category, skills) for category, skills in job_match.skill_gaps.items())
+    return [
+        (kind, position, skill)
+        for kind, skills in lists
+        for position, skill in enumerate(skills)
+    ]
+
+
+def _application_params(
+    job_id: int,
+    resume_id: int,
+    status: str = "pending",
+    notes: Optional[str] = None,
+) -> tuple:
+    """Build the _INSERT_APPLICATION_SQL parameters for one application."""
+    return (job_id, resume_id, status, notes)
+
+
+def _bullet_change_params(
+    resume_id: int,
+    bullet_id: str,
+    original_text: str,
+    new_text: str,
+    justification: Justification,
+    reasoning: Optional[Reasoning] = None,
+    selected_variation_index: Optional[int] = None,
+    approved_by_human: bool = False,
+) -> tuple:
+    """Serialize one bullet change into _INSERT_BULLET_CHANGE_SQL parameters."""
+    return (
+        resume_id,
+        bullet_id,
+        original_text,
+        new_text,
+        justification.model_dump_json(),
+        reasoning.model_dump_json() if reasoning else None,
+        selected_variation_index,
+        approved_by_human,
+    )
+
+
+@dataclass
+class _WriteBuffer:
+    """Rows waiting to be inserted, grouped by INSERT statement.
+    
+    Job-match entries are (params, skill_rows) pairs, since their skill rows
+    are inserted alongside them.
+    """
+    
+    rows: Dict[str, List[tuple]] = field(default_factory=dict)
+    count: int = 0
+    timer: Optional[threading.Timer] = None
+
+
+class _RowAccess:
+    """Dict-style access for row dataclasses, for callers written against dict rows."""
+    
+    __slots__ = ()
+    
+    def __getitem__(self, key: str):
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+    
+    def __setitem__(self, key: str, value) -> None:
+        setattr(self, key, value)
+    
+    def __contains__(self, key: str) -> bool:
+        return hasattr(self, key)
+    
+    def get(self, key: str, default=None):
+        return getattr(self, key, default)
+    
+    def asdict(self) -> dict:
+        return asdict(self)
+    
+    @classmethod
+    def columns(cls) -> str:
+        """SELECT column list in field order, so rows unpack positionally."""
+        return ", ".join(f.name for f in fields(cls))
+
+
+@dataclass(slots=True)
+class JobRow(_RowAccess):
+    """A list_jobs row."""
+    
+    id: int
+    company: str
+    title: str
+    location: Optional[str]
+    description: Optional[str]  # None when listed without descriptions
+    date_posted: Optional[str]
+    status: Optional[str]
+    created_at: Optional[str]
+    date_applied: Optional[str]
+    notes: Optional[str]
+    contact_name: Optional[str]
+    contact_info: Optional[str]
+    interview_dates: Optional[str]
+    offer_outcome: Optional[str]
+
+
+@dataclass(slots=True)
+class BulletChangeRow(_RowAccess):
+    """A bullet_changes row."""
+    
+    id: int
+    resume_id: Optional[int]
+    bullet_id: str
+    original_text: str
+    new_text: str
+    justification_json: str
+    reasoning_json: Optional[str]
+    selected_variation_index: Optional[int]
+    approved_by_human: Optional[int]
+    created_at: Optional[str]
+    
+    @property
+    def justification(self) -> Justification:
+        """The change's Justification, parsed from justification_json."""
+        return Justification.model_validate_json(self.justification_json)
+    
+    @property
+    def reasoning(self) -> Optional[Reasoning]:
+        """The change's Reasoning, parsed from reasoning_json, or None."""
+        return Reasoning.model_validate_json(self.reasoning_json) if self.reasoning_json else None
+
+
+@dataclass(slots=True)
+class ApplicationRow(_RowAccess):
+    """An applications row."""
+    
+    id: int
+    job_id: Optional[int]
+    resume_id: Optional[int]
+    status: Optional[str]
+    applied_at: Optional[str]
+    notes: Optional[str]
+    created_at: Optional[str]
+
+
+@dataclass(slots=True)
+class JobSummaryRow(_RowAccess):
+    """A list_jobs_summary row."""
+    
+    id: int
+    company: str
+    title: str
+    location: Optional[str]
+    status: Optional[str]
+    created_at: Optional[str]
+
+
+@dataclass(slots=True)
+class ResumeMetaRow(_RowAccess):
+    """A list_resume_meta_for_job row."""
+    
+    id: int
+    version: int
+    name: Optional[str]  # Read from the stored JSON by SQLite, without parsing the resume
+    file_path: Optional[str]
+    is_customized: Optional[int]
+    created_at: Optional[str]
+
+
+_LIST_JOBS_SQL = f"SELECT {JobRow.columns()} FROM jobs ORDER BY created_at DESC"
+
+# Same row shape without reading the (often multi-KB) description text
+_LIST_JOBS_WITHOUT_DESCRIPTION_SQL = _LIST_JOBS_SQL.replace(" description,", " NULL AS description,", 1)
+
+_LIST_JOBS_SUMMARY_SQL = f"SELECT {JobSummaryRow.columns()} FROM jobs ORDER BY created_at DESC"
+
+_LIST_RESUME_META_SQL = f"""
+    SELECT {ResumeMetaRow.columns().replace(", name,", ", json_extract(resume_json, '$.name') AS name,", 1)}
+    FROM resumes
+    WHERE job_id = ?
+    ORDER BY created_at DESC
+"""
+
+# Inserts a bullet change and returns the full row it created
+_INSERT_BULLET_CHANGE_ROW_SQL = _INSERT_BULLET_CHANGE_SQL.replace("RETURNING id", f"RETURNING {BulletChangeRow.columns()}")
+
+_SELECT_BULLET_CHANGES_SQL = f"""
+    SELECT {BulletChangeRow.columns()} FROM bullet_changes
+    WHERE resume_id = ?
+    ORDER BY created_at DESC
+"""
+
+_SELECT_APPLICATIONS_SQL = f"SELECT {ApplicationRow.columns()} FROM applications ORDER BY created_at DESC"
+
+_SELECT_JOB_APPLICATIONS_SQL = f"""
+    SELECT {ApplicationRow.columns()} FROM applications
+    WHERE job_id = ?
+    ORDER BY created_at DESC
+"""
+
+
+class JobRecord(dict):
+    """A jobs row as a dict whose 'job_skills' entry is parsed on first access.
+    
+    Screens that never read job_skills skip the JobSkills validation entirely.
+    """
+    
+    @cached_property
+    def job_skills(self) -> Optional[JobSkills]:
+        """JobSkills parsed from job_skills_json, or None if absent or invalid."""
+        job_skills_json = dict.get(self, "job_skills_json")
+        if job_skills_json:
+            try:
+                return JobSkills.model_validate_json(job_skills_json)
+            except ValueError:
+                pass
+        return None
+    
+    def __missing__(self, key):
+        if key == "job_skills" and self.job_skills is not None:
+            return self.job_skills
+        raise KeyError(key)
+    
+    def __contains__(self, key) -> bool:
+        if key == "job_skills":
+            return self.job_skills is not None
+        return dict.__contains__(self, key)
+    
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
 
 
 class Database:
-    """Database interface for storing resumes, jobs, matches, and changes."""
+    """Database interface for storing resumes, jobs, matches, and changes.
     
-    def __init__(self, db_path: str = "ats_pipeline.db"):
-        """Initialize database connection."""
+    Writes go through the single read-write connection ``conn``, each in an
+    explicit BEGIN IMMEDIATE transaction (see _write_tx); reads borrow one of
+    a pool of read-only connections, which WAL mode lets run while a write is
+    in progress. Every Database opened on the same file in this process
+    shares those connections and the write lock (see src.db.pool), so opening
+    one per session or command does not reopen the file.
+    """
+    
+    def __init__(self, db_path: str = "ats_pipeline.db", fast_mode: bool = True):
+        """Initialize database connection.
+        
+        Args:
+            db_path: SQLite database file, or ":memory:"
+            fast_mode: With False, every commit is fsynced (synchronous=FULL);
+                the default synchronous=NORMAL may lose the last commits on
+                power loss but never corrupts the database
+        """
         self.db_path = Path(db_path)
-        self.conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
-        self.conn.row_factory = sqlite3.Row
-        create_tables(self.conn)
+        # Resolved now, so a later working-directory change cannot point
+        # the read pool at a different file
+        self._pool = pool.acquire(str(db_path))
+        self.conn = self._pool.conn
+        self._write_lock = self._pool.write_lock
+        self._read_connection = self._pool.reader
+        with self._write_lock:
+            # The writer is shared, so FULL applies to every Database on
+            # this file from now on
+            if not fast_mode:
+                self.conn.execute("PRAGMA synchronous=FULL")
+            # No-op once the indexes exist; while duplicate jobs block them,
+            # _upsert_job finds duplicates by query instead
+            self._missing_job_indexes = create_job_unique_indexes(self.conn)
+        if self._missing_job_indexes:
+            logger.warning(
+                "Duplicate jobs prevent %s; run deduplicate_jobs() to remove them",
+                ", ".join(self._missing_job_indexes),
+            )
+        self._buffer = _WriteBuffer()
+        self._buffer_lock = threading.Lock()
+        self._commit_count = 0
+        self._parsed_resume = lru_cache(maxsize=_RESUME_CACHE_SIZE)(self._load_resume)
     
     def close(self):
-        """Close database connection."""
-        self.conn.close()
+        """Close database connection.
+        
+        The shared connections are closed once no other Database on the file
+        uses them, even if flushing buffered writes fails; the flush error is
+        then re-raised.
+        """
+        try:
+            self.flush()
+        finally:
+            pool.release(self._pool)
+    
+    @cached_property
+    def _trackers(self) -> Optional[tuple]:
+        """(EventTracker, TimeToApplyTracker) for this database, created on first use.
+        
+        Imported here rather than at module level so the database loads
+        without the analytics package; None if the trackers are unavailable,
+        since analytics must never make a save fail.
+        """
+        try:
+            from src.analytics.event_tracker import EventTracker
+            from src.analytics.time_tracker import TimeToApplyTracker
+            
+            return EventTracker(self), TimeToApplyTracker(self)
+        except Exception:
+            return None
+    
+    @contextmanager
+    def _write_tx(self) -> Iterator[sqlite3.Connection]:
+        """Run the enclosed writes in one transaction on the write connection.
+        
+        BEGIN IMMEDIATE takes the write lock up front, so a competing writer
+        waits out busy_timeout at BEGIN instead of failing with SQLITE_BUSY
+        halfway through. Nested calls join the enclosing transaction.
+        """
+        with self._write_lock:
+            if self.conn.in_transaction:
+                yield self.conn
+                return
+            self.conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield self.conn
+            except BaseException:
+                self.conn.execute("ROLLBACK")
+                raise
+            self.conn.execute("COMMIT")
+            self._commit_count += 1
+            if self._commit_count % _OPTIMIZE_INTERVAL == 0:
+                self.conn.execute("PRAGMA optimize")
+    
+    @contextmanager
+    def bulk(self) -> Iterator[sqlite3.Connection]:
+        """Group every write made inside the block into one transaction.
+        
+        Saves inside the block commit together when it exits, or not at all
+        if it raises. Reads inside the block go through the read-only pool
+        and do not see the block's uncommitted writes.
+        
+        Raw SQL writes belong on the yielded connection too: ``conn`` runs in
+        autocommit mode, so committing it directly would commit whatever
+        transaction another thread has open.
+        
+        Buffered (durable=False) saves are not flushed into the block's
+        transaction, where a rollback would lose them; the outermost block
+        flushes them once it has committed.
+        """
+        with self._write_lock:
+            outermost = not self.conn.in_transaction
+            with self._write_tx() as conn:
+                yield conn
+            if outermost:
+                self.flush()
+    
+    def flush(self) -> None:
+        """Commit all buffered writes in a single transaction.
+        
+        If the transaction fails the rows are put back in the buffer, ahead
+        of any buffered since, for the next flush to retry. Inside a bulk()
+        block nothing is flushed until the block exits.
+        """
+        # _write_lock is always taken before _buffer_lock: a flush waiting
+        # out a bulk() block must not hold up saves made inside that block
+        with self._write_lock:
+            # Holding _write_lock, an open transaction is this thread's own
+            # bulk() block; flushing into it would tie the rows to its outcome
+            if self.conn.in_transaction:
+                return
+            with self._buffer_lock:
+                buffer = self._buffer
+                if buffer.timer is not None:
+                    buffer.timer.cancel()
+                self._buffer = _WriteBuffer()
+            if not buffer.rows:
+                return
+            try:
+                with self._write_tx():
+                    for sql, rows in buffer.rows.items():
+                        if sql == _INSERT_JOB_MATCH_SQL:
+                            # Skill rows need each match's ID
+                            for params, skill_rows in rows:
+                                self._insert_job_match(params, skill_rows)
+                        else:
+                            self.conn.executemany(sql, rows)
+            except BaseException:
+                with self._buffer_lock:
+                    newer = self._buffer
+                    for sql, rows in newer.rows.items():
+                        buffer.rows.setdefault(sql, []).extend(rows)
+                    buffer.count += newer.count
+                    buffer.timer = newer.timer
+                    self._buffer = buffer
+                raise
+    
+    def _flush_in_background(self) -> None:
+        """Timer callback for flush(); failures are logged, as nobody awaits the timer."""
+        try:
+            self.flush()
+        except Exception:
+            logger.exception("Flushing buffered writes failed; rows kept for the next flush")
+    
+    def _insert_job_match(self, params: tuple, skill_rows: List[tuple]) -> int:
+        """Insert a job match and its skill rows; the caller commits."""
+        match_id = self.conn.execute(_INSERT_JOB_MATCH_SQL, params).fetchone()[0]
+        self.conn.executemany(
+            _INSERT_JOB_MATCH_SKILL_SQL, [(match_id,) + skill_row for skill_row in skill_rows]
+        )
+        return match_id
+    
+    def _buffer_write(self, sql: str, params: tuple) -> None:
+        """Queue a row for the next flush instead of committing it now."""
+        with self._buffer_lock:
+            buffer = self._buffer
+            buffer.rows.setdefault(sql, []).append(params)
+            buffer.count += 1
+            if buffer.count < _WRITE_BUFFER_MAX_ROWS:
+                if buffer.timer is None:
+                    buffer.timer = threading.Timer(_WRITE_BUFFER_FLUSH_SECONDS, self._flush_in_background)
+                    buffer.timer.daemon = True
+                    buffer.timer.start()
+                return
+        self.flush()
     
     def save_resume(
         self, 
@@ -41,36 +689,45 @@ class Database:
             job_id: Optional job ID this resume was customized for
             is_customized: Whether this resume was customized for a specific job
         """
-        cursor = self.conn.cursor()
         resume_json = resume.model_dump_json()
         
-        cursor.execute("""
-            INSERT INTO resumes (version, resume_json, file_path, job_id, is_customized, updated_at)
-            VALUES (?, ?, ?, ?, ?, ?)
-        """, (resume.version, resume_json, file_path, job_id, is_customized, datetime.now()))
-        
-        self.conn.commit()
-        return cursor.lastrowid
+        with self._write_tx() as conn:
+            row = conn.execute(
+                _INSERT_RESUME_SQL, (resume.version, resume_json, file_path, job_id, is_customized)
+            ).fetchone()
+        return row["id"]
     
     def get_resume(self, resume_id: int) -> Optional[Resume]:
         """Get resume by ID."""
-        cursor = self.conn.cursor()
-        cursor.execute("SELECT resume_json FROM resumes WHERE id = ?", (resume_id,))
-        row = cursor.fetchone()
+        with self._read_connection() as conn:
+            row = conn.execute(_SELECT_RESUME_VERSION_SQL, (resume_id,)).fetchone()
         
         if row:
-            return Resume.model_validate_json(row["resume_json"])
+            return self._cached_resume(row["id"], row["updated_at"])
         return None
     
     def get_latest_resume(self) -> Optional[Resume]:
         """Get the most recent resume."""
-        cursor = self.conn.cursor()
-        cursor.execute("""
-            SELECT resume_json FROM resumes
-            ORDER BY updated_at DESC
-            LIMIT 1
-        """)
-        row = cursor.fetchone()
+        with self._read_connection() as conn:
+            row = conn.execute(_SELECT_LATEST_RESUME_VERSION_SQL).fetchone()
+        
+        if row:
+            return self._cached_resume(row["id"], row["updated_at"])
+        return None
+    
+    def _cached_resume(self, resume_id: int, updated_at) -> Optional[Resume]:
+        """Return a copy of a resume, parsing its JSON only once per version.
+        
+        Copies are cheaper than re-validating the JSON and keep callers that
+        edit the returned resume from changing the cached one.
+        """
+        resume = self._parsed_resume(resume_id, updated_at)
+        return resume.model_copy(deep=True) if resume else None
+    
+    def _load_resume(self, resume_id: int, updated_at) -> Optional[Resume]:
+        """Parse a stored resume; cached per (resume_id, updated_at) in __init__."""
+        with self._read_connection() as conn:
+            row = conn.execute(_SELECT_RESUME_JSON_SQL, (resume_id,)).fetchone()
         
         if row:
             return Resume.model_validate_json(row["resume_json"])
@@ -78,13 +735,8 @@ class Database:
     
     def get_latest_resume_id(self) -> Optional[int]:
         """Get the ID of the most recent resume."""
-        cursor = self.conn.cursor()
-        cursor.execute("""
-            SELECT id FROM resumes
-            ORDER BY updated_at DESC
-            LIMIT 1
-        """)
-        row = cursor.fetchone()
+        with self._read_connection() as conn:
+            row = conn.execute(_SELECT_LATEST_RESUME_VERSION_SQL).fetchone()
         
         if row:
             return row["id"]
@@ -104,7 +756,8 @@ class Database:
     ) -> int:
         """Save job posting to database. Returns job ID.
         
-        Checks for duplicates by company+title or source_url before inserting.
+        A job matching an existing one by source_url or company+title
+        (case-insensitive) updates that job instead of inserting a duplicate.
         
         Args:
             job: JobPosting model
@@ -117,96 +770,101 @@ class Database:
             interview_dates: Optional interview dates
             offer_outcome: Optional offer/outcome
         """
-        cursor = self.conn.cursor()
-        
-        # Check for existing job by company+title or source_url
-        existing_job_id = None
-        if job.source_url:
-            cursor.execute("""
-                SELECT id FROM jobs WHERE source_url = ? LIMIT 1
-            """, (job.source_url,))
-            row = cursor.fetchone()
-            if row:
-                existing_job_id = row["id"]
-        
-        if not existing_job_id:
-            cursor.execute("""
-                SELECT id FROM jobs 
-                WHERE LOWER(company) = LOWER(?) AND LOWER(title) = LOWER(?)
-                LIMIT 1
-            """, (job.company, job.title))
-            row = cursor.fetchone()
-            if row:
-                existing_job_id = row["id"]
-        
-        # If job exists, update it instead of creating duplicate
-        if existing_job_id:
-            job_skills_json = job_skills.model_dump_json() if job_skills else None
-            job_status = status or 'New'
-            
-            cursor.execute("""
-                UPDATE jobs 
-                SET location = ?, description = ?, source_url = ?, date_posted = ?, 
-                    job_skills_json = ?, status = ?, date_applied = ?, notes = ?,
-                    contact_name = ?, contact_info = ?, interview_dates = ?, offer_outcome = ?
-                WHERE id = ?
-            """, (
-                job.location,
-                job.description,
-                job.source_url,
-                job.date_posted,
-                job_skills_json,
-                job_status,
-                date_applied,
-                notes,
-                contact_name,
-                contact_info,
-                interview_dates,
-                offer_outcome,
-                existing_job_id,
-            ))
-            self.conn.commit()
-            return existing_job_id
-        
-        # Create new job
-        job_skills_json = job_skills.model_dump_json() if job_skills else None
-        job_status = status or 'New'
-        
-        cursor.execute("""
-            INSERT INTO jobs (company, title, location, description, source_url, date_posted, job_skills_json, status,
-                           date_applied, notes, contact_name, contact_info, interview_dates, offer_outcome)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
-            job.company,
-            job.title,
-            job.location,
-            job.description,
-            job.source_url,
-            job.date_posted,
-            job_skills_json,
-            job_status,
-            date_applied,
-            notes,
-            contact_name,
-            contact_info,
-            interview_dates,
-            offer_outcome,
-        ))
-        
-        self.conn.commit()
-        job_id = cursor.lastrowid
-        
-        # Track event and start time-to-apply tracking
-        try:
-            from src.analytics.event_tracker import EventTracker
-            from src.analytics.time_tracker import TimeToApplyTracker
+        with self._write_tx() as conn:
+            job_id, inserted = self._upsert_job(
+                conn,
+                job,
+                _job_details(
+                    job,
+                    job_skills,
+                    status,
+                    date_applied,
+                    notes,
+                    contact_name,
+                    contact_info,
+                    interview_dates,
+                    offer_outcome,
+                ),
+            )
+        if inserted:
+            self._track_job_added(job_id, job)
+        return job_id
+    
+    def save_jobs(
+        self,
+        jobs: Iterable[tuple],
+        status: Optional[str] = None,
+    ) -> List[int]:
+        """Save many job postings, committing every _BULK_CHUNK_ROWS jobs.
+        
+        Duplicates update the existing job, as in save_job.
+        
+        Args:
+            jobs: (JobPosting, Optional[JobSkills]) pairs; may be a generator
+            status: Optional status for newly inserted jobs (defaults to 'New')
             
-            event_tracker = EventTracker(self)
-            time_tracker = TimeToApplyTracker(self)
+        Returns:
+            Job IDs, in input order
+        """
+        job_ids = []
+        jobs = iter(jobs)
+        while True:
+            chunk = list(islice(jobs, _BULK_CHUNK_ROWS))
+            if not chunk:
+                return job_ids
+            added = []
+            with self._write_tx() as conn:
+                for job, job_skills in chunk:
+                    job_id, inserted = self._upsert_job(conn, job, _job_details(job, job_skills, status))
+                    job_ids.append(job_id)
+                    if inserted:
+                        added.append((job_id, job))
+            for job_id, job in added:
+                self._track_job_added(job_id, job)
+    
+    def _upsert_job(self, conn: sqlite3.Connection, job: JobPosting, details: tuple) -> tuple:
+        """Insert a job, or update the job it duplicates; the caller commits.
+        
+        Args:
+            conn: Write connection, inside a transaction
+            job: JobPosting model
+            details: Remaining column values, from _job_details
             
+        Returns:
+            (job_id, inserted) where inserted is False for a duplicate
+        """
+        if self._missing_job_indexes:
+            # Without both unique indexes ON CONFLICT cannot see duplicates,
+            # so update a matching job first and insert only if none exists
+            row = conn.execute(
+                _UPDATE_DUPLICATE_JOB_SQL,
+                details + (job.source_url, job.company, job.title, job.source_url),
+            ).fetchone()
+            if row is not None:
+                return row["id"], False
+        
+        # Insert, skipping rows that collide with an existing job's
+        # source_url or company+title (see create_job_unique_indexes)
+        row = conn.execute(_INSERT_JOB_SQL, (job.company, job.title) + details).fetchone()
+        if row is not None:
+            return row["id"], True
+        # Duplicate: update the existing job instead, preferring a
+        # source_url match over a company+title match
+        row = conn.execute(
+            _UPDATE_DUPLICATE_JOB_SQL,
+            details + (job.source_url, job.company, job.title, job.source_url),
+        ).fetchone()
+        return row["id"], False
+    
+    def _track_job_added(self, job_id: int, job: JobPosting) -> None:
+        """Record a job_added event and start time-to-apply tracking."""
+        if self._trackers is None:
+            return
+        event_tracker, time_tracker = self._trackers
+        try:
             # Track job_added event
             event_tracker.track_event(
-                EventTracker.EVENT_JOB_ADDED,
+                event_tracker.EVENT_JOB_ADDED,
                 metadata={'job_id': job_id, 'company': job.company, 'title': job.title}
             )
             
@@ -215,14 +873,11 @@ class Database:
         except Exception:
             # Don't fail if analytics tracking fails
             pass
-        
-        return job_id
     
     def get_job(self, job_id: int) -> Optional[JobPosting]:
         """Get job posting by ID."""
-        cursor = self.conn.cursor()
-        cursor.execute("SELECT * FROM jobs WHERE id = ?", (job_id,))
-        row = cursor.fetchone()
+        with self._read_connection() as conn:
+            row = conn.execute(_SELECT_JOB_POSTING_SQL, (job_id,)).fetchone()
         
         if row:
             return JobPosting(
@@ -236,61 +891,72 @@ class Database:
         return None
     
     def get_job_full(self, job_id: int) -> Optional[dict]:
-        """Get full job record including all columns as a dictionary."""
-        cursor = self.conn.cursor()
-        cursor.execute("SELECT * FROM jobs WHERE id = ?", (job_id,))
-        row = cursor.fetchone()
+        """Get full job record including all columns as a dictionary.
+        
+        This is the all-columns read, including description and
+        job_skills_json; get_job and list_jobs_summary read only what they
+        return.
+        """
+        with self._read_connection() as conn:
+            row = conn.execute(_SELECT_JOB_SQL, (job_id,)).fetchone()
         if row:
             return dict(row)
         return None
     
     def get_job_skills(self, job_id: int) -> Optional[JobSkills]:
         """Get job skills for a job."""
-        cursor = self.conn.cursor()
-        cursor.execute("SELECT job_skills_json FROM jobs WHERE id = ?", (job_id,))
-        row = cursor.fetchone()
+        with self._read_connection() as conn:
+            row = conn.execute(_SELECT_JOB_SKILLS_SQL, (job_id,)).fetchone()
         
         if row and row["job_skills_json"]:
             return JobSkills.model_validate_json(row["job_skills_json"])
         return None
     
-    def list_jobs(self) -> List[dict]:
-        """List all jobs."""
-        cursor = self.conn.cursor()
-        cursor.execute("""
-            SELECT id, company, title, location, description, date_posted, status, created_at,
-                   date_applied, notes, contact_name, contact_info, interview_dates, offer_outcome
-            FROM jobs
-            ORDER BY created_at DESC
-        """)
-        return [dict(row) for row in cursor.fetchall()]
+    def iter_jobs(self, include_description: bool = True) -> Iterator[JobRow]:
+        """Yield jobs newest first, streaming rows from the cursor.
+        
+        Args:
+            include_description: Load each job's description; when False the
+                description is None, for list views that only show the
+                other columns
+        """
+        with self._read_connection() as conn:
+            for row in conn.execute(_LIST_JOBS_SQL if include_description else _LIST_JOBS_WITHOUT_DESCRIPTION_SQL):
+                yield JobRow(*row)
+    
+    def list_jobs(self, include_description: bool = True) -> List[JobRow]:
+        """List all jobs; see iter_jobs."""
+        return list(self.iter_jobs(include_description))
+    
+    def list_jobs_summary(self) -> List[JobSummaryRow]:
+        """List jobs with only the columns list views display."""
+        with self._read_connection() as conn:
+            return [JobSummaryRow(*row) for row in conn.execute(_LIST_JOBS_SUMMARY_SQL)]
+    
+    def get_job_with_skills(self, job_id: int) -> Optional[JobRecord]:
+        """Get full job record with job_skills loaded on access."""
+        with self._read_connection() as conn:
+            row = conn.execute(_SELECT_JOB_SQL, (job_id,)).fetchone()
+        if row:
+            return JobRecord(row)
+        return None
     
     def update_job_status(self, job_id: int, status: str) -> None:
         """Update job status."""
         # Get old status for tracking
-        cursor = self.conn.cursor()
-        cursor.execute("SELECT status FROM jobs WHERE id = ?", (job_id,))
-        old_status_row = cursor.fetchone()
-        old_status = old_status_row['status'] if old_status_row else None
-        
-        cursor.execute("""
-            UPDATE jobs
-            SET status = ?
-            WHERE id = ?
-        """, (status, job_id))
-        self.conn.commit()
+        with self._write_tx() as conn:
+            old_status_row = conn.execute(_SELECT_JOB_STATUS_SQL, (job_id,)).fetchone()
+            old_status = old_status_row['status'] if old_status_row else None
+            conn.execute(_UPDATE_JOB_STATUS_SQL, (status, job_id))
         
         # Track event and complete time-to-apply if status changed to "Applied"
+        if self._trackers is None:
+            return
+        event_tracker, time_tracker = self._trackers
         try:
-            from src.analytics.event_tracker import EventTracker
-            from src.analytics.time_tracker import TimeToApplyTracker
-            
-            event_tracker = EventTracker(self)
-            time_tracker = TimeToApplyTracker(self)
-            
             # Track status change event
             event_tracker.track_event(
-                EventTracker.EVENT_JOB_STATUS_CHANGED,
+                event_tracker.EVENT_JOB_STATUS_CHANGED,
                 metadata={
                     'job_id': job_id,
                     'old_status': old_status,
@@ -307,84 +973,76 @@ class Database:
     
     def delete_job(self, job_id: int) -> None:
         """Delete a job and all associated data."""
-        cursor = self.conn.cursor()
-        # Delete related records first (foreign key constraints)
-        cursor.execute("DELETE FROM contacts WHERE job_id = ?", (job_id,))
-        cursor.execute("DELETE FROM applications WHERE job_id = ?", (job_id,))
-        cursor.execute("DELETE FROM job_matches WHERE job_id = ?", (job_id,))
-        # Delete the job
-        cursor.execute("DELETE FROM jobs WHERE id = ?", (job_id,))
-        self.conn.commit()
+        # One transaction: all rows go, or none do if a statement fails
+        with self._write_tx():
+            # Delete related records first (foreign key constraints)
+            self.conn.execute(
+                "DELETE FROM job_match_skills WHERE match_id IN (SELECT id FROM job_matches WHERE job_id = ?)",
+                (job_id,),
+            )
+            for table in ("contacts", "applications", "job_matches"):
+                self.conn.execute(f"DELETE FROM {table} WHERE job_id = ?", (job_id,))
+            # Delete the job
+            self.conn.execute("DELETE FROM jobs WHERE id = ?", (job_id,))
     
     def deduplicate_jobs(self) -> dict:
-        """Remove duplicate jobs, keeping the most recent one for each company+title combination.
+        """Remove duplicate jobs, keeping the most recent one of each.
+        
+        Jobs duplicate each other when they share a company+title
+        (case-insensitive) or a non-empty source_url, the keys of the unique
+        indexes save_job relies on; both are rebuilt afterwards.
         
         Returns:
             Dictionary with counts: {'removed': int, 'kept': int}
         """
-        cursor = self.conn.cursor()
-        
-        # Find duplicates by company+title (case-insensitive)
-        cursor.execute("""
-            SELECT company, title, COUNT(*) as count, GROUP_CONCAT(id) as ids
-            FROM jobs
-            GROUP BY LOWER(company), LOWER(title)
-            HAVING COUNT(*) > 1
-        """)
-        duplicates = cursor.fetchall()
-        
         removed = 0
-        kept = 0
-        
-        for row in duplicates:
-            company = row["company"]
-            title = row["title"]
-            ids = [int(id_str) for id_str in row["ids"].split(",")]
-            
-            # Keep the most recent job (highest ID, assuming auto-increment)
-            # Or keep the one with the most complete data
-            ids_sorted = sorted(ids, reverse=True)
-            keep_id = ids_sorted[0]
-            remove_ids = ids_sorted[1:]
-            
-            # For each duplicate to remove, merge any important data into the kept job
-            # then delete the duplicate
-            for remove_id in remove_ids:
-                # Transfer job_matches to kept job if needed
-                cursor.execute("""
-                    UPDATE job_matches SET job_id = ? WHERE job_id = ?
-                """, (keep_id, remove_id))
+        with self._write_tx():
+            self.conn.execute("DROP TABLE IF EXISTS temp.job_keepers")
+            self.conn.execute("CREATE TEMP TABLE job_keepers (id INTEGER PRIMARY KEY)")
+            # Collapsing company+title groups first can only shrink the
+            # source_url groups, so one pass per key removes every duplicate
+            for partition, where in (
+                ("LOWER(company), LOWER(title)", ""),
+                ("source_url", "WHERE source_url IS NOT NULL AND source_url != ''"),
+            ):
+                # Pair every duplicate with the most recent job in its group
+                # (highest ID, assuming auto-increment)
+                self.conn.execute("DROP TABLE IF EXISTS temp.job_duplicates")
+                self.conn.execute(f"""
+                    CREATE TEMP TABLE job_duplicates AS
+                    SELECT id, keep_id FROM (
+                        SELECT id, MAX(id) OVER (PARTITION BY {partition}) AS keep_id
+                        FROM jobs {where}
+                    )
+                    WHERE id != keep_id
+                """)
+                removed += self.conn.execute("SELECT COUNT(*) FROM job_duplicates").fetchone()[0]
+                self.conn.execute("INSERT OR IGNORE INTO job_keepers SELECT keep_id FROM job_duplicates")
                 
-                # Transfer contacts to kept job
-                cursor.execute("""
-                    UPDATE contacts SET job_id = ? WHERE job_id = ?
-                """, (keep_id, remove_id))
-                
-                # Transfer applications to kept job
-                cursor.execute("""
-                    UPDATE applications SET job_id = ? WHERE job_id = ?
-                """, (keep_id, remove_id))
-                
-                # Delete the duplicate job
-                cursor.execute("DELETE FROM jobs WHERE id = ?", (remove_id,))
-                removed += 1
+                # Transfer job_matches, contacts and applications to the kept
+                # job, then delete the duplicates
+                for table in ("job_matches", "contacts", "applications"):
+                    self.conn.execute(f"""
+                        UPDATE {table}
+                        SET job_id = (SELECT keep_id FROM job_duplicates WHERE job_duplicates.id = {table}.job_id)
+                        WHERE job_id IN (SELECT id FROM job_duplicates)
+                    """)
+                self.conn.execute("DELETE FROM jobs WHERE id IN (SELECT id FROM job_duplicates)")
+                self.conn.execute("DROP TABLE temp.job_duplicates")
             
-            kept += 1
+            # A job kept in the first pass may itself be removed in the second
+            kept = self.conn.execute(
+                "SELECT COUNT(*) FROM job_keepers WHERE id IN (SELECT id FROM jobs)"
+            ).fetchone()[0]
+            self.conn.execute("DROP TABLE temp.job_keepers")
+            self._missing_job_indexes = create_job_unique_indexes(self.conn)
         
-        self.conn.commit()
         return {'removed': removed, 'kept': kept}
     
     def get_latest_job_match_fit_score(self, job_id: int) -> Optional[float]:
         """Get the latest fit score for a job from job_matches table."""
-        cursor = self.conn.cursor()
-        cursor.execute("""
-            SELECT fit_score
-            FROM job_matches
-            WHERE job_id = ?
-            ORDER BY created_at DESC
-            LIMIT 1
-        """, (job_id,))
-        row = cursor.fetchone()
+        with self._read_connection() as conn:
+            row = conn.execute(_SELECT_LATEST_FIT_SCORE_SQL, (job_id,)).fetchone()
         if row:
             return row["fit_score"]
         return None
@@ -394,34 +1052,57 @@ class Database:
         job_match: JobMatch, 
         job_id: int, 
         resume_id: int, 
-        resume_customized_for_job: bool = False
-    ) -> int:
-        """Save job match to database. Returns match ID."""
-        cursor = self.conn.cursor()
+        resume_customized_for_job: bool = False,
+        durable: bool = True,
+    ) -> Optional[int]:
+        """Save job match to database. Returns match ID.
+        
+        Args:
+            job_match: JobMatch model
+            job_id: Job the match was computed for
+            resume_id: Resume the match was computed against
+            resume_customized_for_job: Whether the resume was tailored to the job
+            durable: Commit immediately; when False the row is buffered until
+                the next flush() and None is returned instead of an ID
+        """
+        # Skill lists go to job_match_skills; the JSON keeps the free-text
+        # recommendations and the gap categories (which may be empty)
         match_details = {
-            "skill_gaps": job_match.skill_gaps,
-            "missing_skills": job_match.missing_skills,
-            "matching_skills": job_match.matching_skills,
             "recommendations": job_match.recommendations,
+            "skill_gap_categories": list(job_match.skill_gaps),
         }
-        match_details_json = json.dumps(match_details)
+        match_details_json = fast_json.dumps(match_details)
+        params = (job_id, resume_id, job_match.fit_score, match_details_json, resume_customized_for_job)
+        skill_rows = _match_skill_rows(job_match)
         
-        cursor.execute("""
-            INSERT INTO job_matches (job_id, resume_id, fit_score, match_details_json, resume_customized_for_job)
-            VALUES (?, ?, ?, ?, ?)
-        """, (job_id, resume_id, job_match.fit_score, match_details_json, resume_customized_for_job))
+        if not durable:
+            self._buffer_write(_INSERT_JOB_MATCH_SQL, (params, skill_rows))
+            return None
         
-        self.conn.commit()
-        return cursor.lastrowid
+        with self._write_tx():
+            return self._insert_job_match(params, skill_rows)
     
     def get_job_match(self, match_id: int) -> Optional[JobMatch]:
         """Get job match by ID."""
-        cursor = self.conn.cursor()
-        cursor.execute("SELECT * FROM job_matches WHERE id = ?", (match_id,))
-        row = cursor.fetchone()
+        with self._read_connection() as conn:
+            row = conn.execute(_SELECT_JOB_MATCH_SQL, (match_id,)).fetchone()
+            skill_rows = conn.execute(_SELECT_JOB_MATCH_SKILLS_SQL, (match_id,)).fetchall() if row else []
         
         if row:
-            match_details = json.loads(row["match_details_json"])
+            match_details = fast_json.loads(row["match_details_json"])
+            if "skill_gap_categories" in match_details:
+                # Skill lists are stored in job_match_skills; older matches
+                # keep them in the JSON
+                skill_gaps = {category: [] for category in match_details["skill_gap_categories"]}
+                lists = {"missing": [], "matching": []}
+                for kind, skill in skill_rows:
+                    if kind.startswith(_GAP_KIND_PREFIX):
+                        skill_gaps.setdefault(kind[len(_GAP_KIND_PREFIX):], []).append(skill)
+                    else:
+                        lists[kind].append(skill)
+                match_details.update(
+                    skill_gaps=skill_gaps, missing_skills=lists["missing"], matching_skills=lists["matching"]
+                )
             return JobMatch(
                 job_id=row["job_id"],
                 fit_score=row["fit_score"],
@@ -442,42 +1123,68 @@ class Database:
         reasoning: Optional[Reasoning] = None,
         selected_variation_index: Optional[int] = None,
         approved_by_human: bool = False,
-    ) -> int:
-        """Save bullet change to database. Returns change ID."""
-        cursor = self.conn.cursor()
-        justification_json = justification.model_dump_json()
-        reasoning_json = reasoning.model_dump_json() if reasoning else None
-        
-        cursor.execute("""
-            INSERT INTO bullet_changes (
-                resume_id, bullet_id, original_text, new_text,
-                justification_json, reasoning_json,
-                selected_variation_index, approved_by_human
-            )
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
+        durable: bool = True,
+        return_row: bool = False,
+    ) -> Union[int, BulletChangeRow, None]:
+        """Save bullet change to database. Returns change ID.
+        
+        With return_row=True the saved row (as get_bullet_changes would load
+        it) is returned instead, read back by the insert itself. With
+        durable=False the change is buffered until the next flush() and None
+        is returned; the two cannot be combined, as a buffered change has no
+        row yet.
+        
+        Raises:
+            ValueError: If both return_row and durable=False are given
+        """
+        if return_row and not durable:
+            raise ValueError("return_row=True requires durable=True")
+        
+        params = _bullet_change_params(
             resume_id,
             bullet_id,
             original_text,
             new_text,
-            justification_json,
-            reasoning_json,
+            justification,
+            reasoning,
             selected_variation_index,
             approved_by_human,
-        ))
+        )
+        
+        if not durable:
+            self._buffer_write(_INSERT_BULLET_CHANGE_SQL, params)
+            return None
+        
+        if return_row:
+            with self._write_tx() as conn:
+                return BulletChangeRow(*conn.execute(_INSERT_BULLET_CHANGE_ROW_SQL, params).fetchone())
         
-        self.conn.commit()
-        return cursor.lastrowid
+        with self._write_tx() as conn:
+            row = conn.execute(_INSERT_BULLET_CHANGE_SQL, params).fetchone()
+        return row["id"]
+    
+    def save_bullet_changes(self, changes: Iterable[tuple]) -> List[int]:
+        """Save many bullet changes in a single transaction.
+        
+        Args:
+            changes: Tuples of save_bullet_change arguments, in order
+                (resume_id, bullet_id, original_text, new_text, justification,
+                reasoning, selected_variation_index, approved_by_human); the
+                trailing optional arguments may be omitted
+            
+        Returns:
+            IDs of the saved changes, in input order
+        """
+        rows = [_bullet_change_params(*change) for change in changes]
+        # executemany discards RETURNING rows, so insert one at a time inside
+        # the single transaction to collect the IDs
+        with self._write_tx():
+            return [self.conn.execute(_INSERT_BULLET_CHANGE_SQL, row).fetchone()[0] for row in rows]
     
-    def get_bullet_changes(self, resume_id: int) -> List[dict]:
+    def get_bullet_changes(self, resume_id: int) -> List[BulletChangeRow]:
         """Get all bullet changes for a resume."""
-        cursor = self.conn.cursor()
-        cursor.execute("""
-            SELECT * FROM bullet_changes
-            WHERE resume_id = ?
-            ORDER BY created_at DESC
-        """, (resume_id,))
-        return [dict(row) for row in cursor.fetchall()]
+        with self._read_connection() as conn:
+            return [BulletChangeRow(*row) for row in conn.execute(_SELECT_BULLET_CHANGES_SQL, (resume_id,))]
     
     def save_application(
         self,
@@ -485,91 +1192,94 @@ class Database:
         resume_id: int,
         status: str = "pending",
         notes: Optional[str] = None,
-    ) -> int:
-        """Save application to database. Returns application ID."""
-        cursor = self.conn.cursor()
+        durable: bool = True,
+    ) -> Optional[int]:
+        """Save application to database. Returns application ID.
+        
+        With durable=False the application is buffered until the next flush()
+        and None is returned instead of an ID.
+        """
+        params = _application_params(job_id, resume_id, status, notes)
+        
+        if not durable:
+            self._buffer_write(_INSERT_APPLICATION_SQL, params)
+            return None
         
-        cursor.execute("""
-            INSERT INTO applications (job_id, resume_id, status, applied_at, notes)
-            VALUES (?, ?, ?, ?, ?)
-        """, (job_id, resume_id, status, datetime.now(), notes))
+        with self._write_tx() as conn:
+            row = conn.execute(_INSERT_APPLICATION_SQL, params).fetchone()
+        return row["id"]
+    
+    def save_applications(self, applications: Iterable[tuple]) -> List[int]:
+        """Save many applications in a single transaction.
         
-        self.conn.commit()
-        return cursor.lastrowid
+        Args:
+            applications: Tuples of save_application arguments, in order
+                (job_id, resume_id, status, notes); status and notes may be
+                omitted
+            
+        Returns:
+            IDs of the saved applications, in input order
+        """
+        rows = [_application_params(*application) for application in applications]
+        # As in save_bullet_changes, one execute per row to collect the IDs
+        with self._write_tx():
+            return [self.conn.execute(_INSERT_APPLICATION_SQL, row).fetchone()[0] for row in rows]
     
-    def get_applications(self, job_id: Optional[int] = None) -> List[dict]:
+    def get_applications(self, job_id: Optional[int] = None) -> List[ApplicationRow]:
         """Get applications, optionally filtered by job_id."""
-        cursor = self.conn.cursor()
-        
-        if job_id:
-            cursor.execute("""
-                SELECT * FROM applications
-                WHERE job_id = ?
-                ORDER BY created_at DESC
-            """, (job_id,))
-        else:
-            cursor.execute("""
-                SELECT * FROM applications
-                ORDER BY created_at DESC
-            """)
-        
-        return [dict(row) for row in cursor.fetchall()]
+        with self._read_connection() as conn:
+            if job_id:
+                rows = conn.execute(_SELECT_JOB_APPLICATIONS_SQL, (job_id,))
+            else:
+                rows = conn.execute(_SELECT_APPLICATIONS_SQL)
+            return [ApplicationRow(*row) for row in rows]
     
     def get_resumes_for_job(self, job_id: int) -> List[int]:
         """Get resume IDs customized for a specific job."""
-        cursor = self.conn.cursor()
-        cursor.execute("""
-            SELECT resume_id FROM job_matches
-            WHERE job_id = ? AND resume_customized_for_job = 1
-            ORDER BY created_at DESC
-        """, (job_id,))
-        return [row[0] for row in cursor.fetchall()]
+        with self._read_connection() as conn:
+            return [row[0] for row in conn.execute(_SELECT_CUSTOMIZED_RESUME_IDS_SQL, (job_id,))]
+    
+    def list_resume_meta_for_job(self, job_id: int) -> List[ResumeMetaRow]:
+        """List resumes for a job, newest first, without loading their content."""
+        with self._read_connection() as conn:
+            return [ResumeMetaRow(*row) for row in conn.execute(_LIST_RESUME_META_SQL, (job_id,))]
     
     def get_resumes_by_job_id(self, job_id: int) -> List[dict]:
-        """Get all resumes for a specific job from the resumes table."""
-        cursor = self.conn.cursor()
-        cursor.execute("""
-            SELECT id, resume_json, file_path, is_customized, created_at
-            FROM resumes
-            WHERE job_id = ?
-            ORDER BY created_at DESC
-        """, (job_id,))
-        rows = cursor.fetchall()
+        """Get all resumes for a specific job from the resumes table.
+        
+        Rows whose resume fails to parse are logged and skipped. Use
+        list_resume_meta_for_job when the resume content is not needed.
+        """
+        with self._read_connection() as conn:
+            rows = conn.execute(_SELECT_JOB_RESUME_VERSIONS_SQL, (job_id,)).fetchall()
         resumes = []
         for row in rows:
             try:
-                resume = Resume.model_validate_json(row["resume_json"])
-                resumes.append({
-                    'id': row['id'],
-                    'resume': resume,
-                    'file_path': row.get('file_path'),
-                    'is_customized': row.get('is_customized', False),
-                    'created_at': row.get('created_at')
-                })
-            except:
+                resume = self._cached_resume(row["id"], row["updated_at"])
+            except ValueError:
+                logger.exception("Skipping unreadable resume %s for job %s", row["id"], job_id)
                 continue
+            resumes.append({
+                'id': row['id'],
+                'resume': resume,
+                'file_path': row['file_path'],
+                'is_customized': bool(row['is_customized']),
+                'created_at': row['created_at'],
+            })
         return resumes
     
-    def get_all_jobs(self) -> List[dict]:
-        """Get all jobs from database with job_skills loaded."""
-        cursor = self.conn.cursor()
-        cursor.execute("""
-            SELECT * FROM jobs
-            ORDER BY created_at DESC
-        """)
-        jobs = []
-        for row in cursor.fetchall():
-            job_dict = dict(row)
-            # Ensure description is included (it should be from SELECT *)
-            # Load job skills if available
-            if job_dict.get("job_skills_json"):
-                try:
-                    job_skills = JobSkills.model_validate_json(job_dict["job_skills_json"])
-                    job_dict["job_skills"] = job_skills
-                except:
-                    pass
-            jobs.append(job_dict)
-        return jobs
+    def iter_all_jobs(self) -> Iterator[JobRecord]:
+        """Yield jobs newest first, streaming rows from the cursor.
+        
+        Each job's 'job_skills' is parsed on first access.
+        """
+        with self._read_connection() as conn:
+            for row in conn.execute(_SELECT_ALL_JOBS_SQL):
+                yield JobRecord(row)
+    
+    def get_all_jobs(self) -> List[JobRecord]:
+        """Get all jobs from database; each job's 'job_skills' is parsed on first access."""
+        return list(self.iter_all_jobs())
     
     def track_event(self, event_type: str, metadata: Optional[Dict] = None) -> int:
         """Track an analytics event.
@@ -581,17 +1291,11 @@ class Database:
         Returns:
             Event ID
         """
-        import json
-        metadata_json = json.dumps(metadata) if metadata else None
-        
-        cursor = self.conn.cursor()
-        cursor.execute("""
-            INSERT INTO analytics_events (event_type, metadata_json, created_at)
-            VALUES (?, ?, ?)
-        """, (event_type, metadata_json, datetime.now()))
+        metadata_json = fast_json.dumps(metadata) if metadata else None
         
-        self.conn.commit()
-        return cursor.lastrowid
+        with self._write_tx() as conn:
+            row = conn.execute(_INSERT_EVENT_SQL, (event_type, metadata_json)).fetchone()
+        return row["id"]
     
     def get_time_to_apply_stats(self) -> Dict:
         """Get time-to-apply statistics.
@@ -599,41 +1303,15 @@ class Database:
         Returns:
             Dictionary with stats
         """
-        cursor = self.conn.cursor()
-        cursor.execute("""
-            SELECT 
-                COUNT(*) as count,
-                AVG(duration_seconds) as avg_seconds,
-                MIN(duration_seconds) as min_seconds,
-                MAX(duration_seconds) as max_seconds
-            FROM time_to_apply
-            WHERE duration_seconds IS NOT NULL
-        """)
-        
-        result = cursor.fetchone()
-        
-        # Calculate median
-        cursor.execute("""
-            SELECT duration_seconds
-            FROM time_to_apply
-            WHERE duration_seconds IS NOT NULL
-            ORDER BY duration_seconds
-        """)
-        durations = [row['duration_seconds'] for row in cursor.fetchall()]
-        median_seconds = None
-        if durations:
-            n = len(durations)
-            if n % 2 == 0:
-                median_seconds = (durations[n//2 - 1] + durations[n//2]) / 2
-            else:
-                median_seconds = durations[n//2]
+        with self._read_connection() as conn:
+            result = conn.execute(_TIME_TO_APPLY_STATS_SQL).fetchone()
         
         return {
             'count': result['count'] if result else 0,
             'average_seconds': result['avg_seconds'] if result and result['avg_seconds'] else None,
             'min_seconds': result['min_seconds'] if result else None,
             'max_seconds': result['max_seconds'] if result else None,
-            'median_seconds': median_seconds,
+            'median_seconds': result['median_seconds'] if result else None,
         }
     
     def get_missing_skills_ranked(
@@ -650,26 +1328,9 @@ class Database:
         Returns:
             List of skill dictionaries
         """
-        cursor = self.conn.cursor()
-        
-        if by == 'frequency':
-            cursor.execute("""
-                SELECT skill_name, frequency_count, required_count, preferred_count, 
-                       general_count, priority_score
-                FROM missing_skills_aggregation
-                ORDER BY frequency_count DESC, priority_score DESC
-                LIMIT ?
-            """, (limit,))
-        else:
-            cursor.execute("""
-                SELECT skill_name, frequency_count, required_count, preferred_count, 
-                       general_count, priority_score
-                FROM missing_skills_aggregation
-                ORDER BY priority_score DESC, frequency_count DESC
-                LIMIT ?
-            """, (limit,))
-        
-        return [dict(row) for row in cursor.fetchall()]
+        sql = _MISSING_SKILLS_RANKED_SQL.get(by, _MISSING_SKILLS_RANKED_SQL['priority'])
+        with self._read_connection() as conn:
+            return [dict(row) for row in conn.execute(sql, (limit,))]
     
     def update_missing_skills_aggregation(self) -> int:
         """Update the missing skills aggregation cache.
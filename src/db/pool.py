@@ -0,0 +1,156 @@
+"""Process-wide SQLite connections, shared by every Database on the same file."""
+
+import os
+import queue
+import sqlite3
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, Optional
+
+from .schema import create_tables
+
+
+# Connection pragmas: WAL lets readers run alongside a writer and, with
+# synchronous=NORMAL, turns each commit into an append instead of an fsync
+_CONNECTION_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-65536",  # 64 MiB page cache
+    "PRAGMA busy_timeout=5000",
+    # Bounds the ANALYZE run by PRAGMA optimize to a sample of each index
+    "PRAGMA analysis_limit=400",
+)
+
+# Prepared statements kept per connection (sqlite3 default is 128)
+_CACHED_STATEMENTS = 256
+
+# Memory-mapped I/O size; applied separately since some platforms reject it
+_MMAP_SIZE = 268435456  # 256 MiB
+
+# Read-only connections serving get_*/list_* queries alongside the writer
+_READ_POOL_SIZE = os.cpu_count() or 4
+
+
+def _configure_connection(conn: sqlite3.Connection, read_only: bool = False) -> None:
+    """Apply performance pragmas to a new connection."""
+    for pragma in _CONNECTION_PRAGMAS:
+        # The journal mode is a property of the database file, set by the writer
+        if read_only and pragma.startswith("PRAGMA journal_mode"):
+            continue
+        conn.execute(pragma)
+    try:
+        conn.execute(f"PRAGMA mmap_size={_MMAP_SIZE}")
+    except sqlite3.DatabaseError:
+        pass
+
+
+class ConnectionPool:
+    """One read-write connection and up to _READ_POOL_SIZE read-only ones for a database file.
+
+    Every write must hold write_lock, which serializes the transactions of all
+    Database instances sharing the pool on its single writer.
+    """
+
+    def __init__(self, db_path: str):
+        """Open the write connection and create the schema.
+
+        Args:
+            db_path: Resolved database file path, or ":memory:"
+        """
+        self.db_path = db_path
+        self.conn = sqlite3.connect(
+            db_path,
+            check_same_thread=False,
+            cached_statements=_CACHED_STATEMENTS,
+            # Transactions are opened explicitly by Database._write_tx
+            isolation_level=None,
+        )
+        self.conn.row_factory = sqlite3.Row
+        _configure_connection(self.conn)
+        create_tables(self.conn)
+        self.write_lock = threading.RLock()
+        # In-memory databases are private to their connection, so reads
+        # share the writer there
+        self.readers: Optional[queue.Queue] = None if db_path == ":memory:" else queue.Queue()
+        self._reader_uri = None if self.readers is None else f"{Path(db_path).as_uri()}?mode=ro"
+        self._reader_count = 0
+        self._readers_lock = threading.Lock()
+        self.users = 0
+
+    @contextmanager
+    def reader(self) -> Iterator[sqlite3.Connection]:
+        """Borrow a read-only connection, opening one if all are busy."""
+        if self.readers is None:
+            yield self.conn
+            return
+
+        try:
+            conn = self.readers.get_nowait()
+        except queue.Empty:
+            conn = None
+            with self._readers_lock:
+                if self._reader_count < _READ_POOL_SIZE:
+                    self._reader_count += 1
+                    conn = sqlite3.connect(
+                        self._reader_uri,
+                        uri=True,
+                        check_same_thread=False,
+                        cached_statements=_CACHED_STATEMENTS,
+                    )
+                    conn.row_factory = sqlite3.Row
+                    _configure_connection(conn, read_only=True)
+            if conn is None:
+                conn = self.readers.get()
+        try:
+            yield conn
+        finally:
+            self.readers.put(conn)
+
+    def close(self) -> None:
+        """Close every connection, refreshing planner statistics first."""
+        try:
+            # Refresh statistics for tables whose usage warrants it
+            self.conn.execute("PRAGMA optimize")
+        finally:
+            if self.readers is not None:
+                while not self.readers.empty():
+                    self.readers.get_nowait().close()
+            self.conn.close()
+
+
+_pools: Dict[str, ConnectionPool] = {}
+_pools_lock = threading.Lock()
+
+
+def acquire(db_path: str) -> ConnectionPool:
+    """Get the pool for a database file, opening it on first use.
+
+    Paths are resolved, so relative and absolute names of one file share a
+    pool. Each ":memory:" database is private and gets a pool of its own.
+    Every acquire() must be paired with a release().
+    """
+    if db_path == ":memory:":
+        pool = ConnectionPool(db_path)
+        pool.users = 1
+        return pool
+
+    key = str(Path(db_path).resolve())
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            pool = _pools[key] = ConnectionPool(key)
+        pool.users += 1
+        return pool
+
+
+def release(pool: ConnectionPool) -> None:
+    """Give back a pool from acquire(), closing it once no Database uses it."""
+    with _pools_lock:
+        pool.users -= 1
+        if pool.users:
+            return
+        if _pools.get(pool.db_path) is pool:
+            del _pools[pool.db_path]
+    pool.close()
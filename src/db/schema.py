@@ -2,194 +2,269 @@
 
 import sqlite3
 from pathlib import Path
+from typing import List
+
+
+# Stored in PRAGMA user_version once create_tables has run; bump it whenever
+# the DDL below changes so existing databases pick the change up
+SCHEMA_VERSION = 2
+
+
+# Columns these lack in older databases are added by _add_missing_columns
+_TABLES_SQL = """
+-- Resumes table
+CREATE TABLE IF NOT EXISTS resumes (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    version INTEGER NOT NULL,
+    resume_json TEXT NOT NULL,
+    file_path TEXT,
+    job_id INTEGER,
+    is_customized BOOLEAN DEFAULT 0,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (job_id) REFERENCES jobs(id)
+);
+
+-- Jobs table
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    company TEXT NOT NULL,
+    title TEXT NOT NULL,
+    location TEXT,
+    description TEXT NOT NULL,
+    source_url TEXT,
+    date_posted TIMESTAMP,
+    job_skills_json TEXT,
+    status TEXT DEFAULT 'New',
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Job matches table
+CREATE TABLE IF NOT EXISTS job_matches (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    job_id INTEGER,
+    resume_id INTEGER,
+    fit_score REAL NOT NULL,
+    match_details_json TEXT,
+    resume_customized_for_job BOOLEAN DEFAULT 0,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (job_id) REFERENCES jobs(id),
+    FOREIGN KEY (resume_id) REFERENCES resumes(id)
+);
+
+-- Skills of each job match, one row per skill so they can be aggregated
+-- in SQL; kind is 'missing', 'matching' or 'gap:<category>'
+CREATE TABLE IF NOT EXISTS job_match_skills (
+    match_id INTEGER NOT NULL,
+    kind TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    skill TEXT NOT NULL,
+    FOREIGN KEY (match_id) REFERENCES job_matches(id)
+);
+
+-- Bullet changes table (with reasoning_json)
+CREATE TABLE IF NOT EXISTS bullet_changes (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    resume_id INTEGER,
+    bullet_id TEXT NOT NULL,
+    original_text TEXT NOT NULL,
+    new_text TEXT NOT NULL,
+    justification_json TEXT NOT NULL,
+    reasoning_json TEXT,
+    selected_variation_index INTEGER,
+    approved_by_human BOOLEAN DEFAULT 0,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (resume_id) REFERENCES resumes(id)
+);
+
+-- Applications table
+CREATE TABLE IF NOT EXISTS applications (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    job_id INTEGER,
+    resume_id INTEGER,
+    status TEXT DEFAULT 'pending',
+    applied_at TIMESTAMP,
+    notes TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (job_id) REFERENCES jobs(id),
+    FOREIGN KEY (resume_id) REFERENCES resumes(id)
+);
+
+-- Contacts table
+CREATE TABLE IF NOT EXISTS contacts (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    job_id INTEGER,
+    name TEXT,
+    email TEXT,
+    phone TEXT,
+    linkedin TEXT,
+    notes TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (job_id) REFERENCES jobs(id)
+);
+
+-- Analytics events table
+CREATE TABLE IF NOT EXISTS analytics_events (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    event_type TEXT NOT NULL,
+    metadata_json TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Time-to-apply tracking
+CREATE TABLE IF NOT EXISTS time_to_apply (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    job_id INTEGER NOT NULL,
+    created_at TIMESTAMP NOT NULL,
+    applied_at TIMESTAMP,
+    duration_seconds INTEGER,
+    FOREIGN KEY (job_id) REFERENCES jobs(id)
+);
+
+-- Missing skills aggregation cache
+CREATE TABLE IF NOT EXISTS missing_skills_aggregation (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    skill_name TEXT NOT NULL,
+    frequency_count INTEGER DEFAULT 0,
+    required_count INTEGER DEFAULT 0,
+    preferred_count INTEGER DEFAULT 0,
+    general_count INTEGER DEFAULT 0,
+    priority_score REAL DEFAULT 0.0,
+    last_updated TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    UNIQUE(skill_name)
+);
+"""
+# Indexes are created after the column migrations, since some cover
+# migrated columns
+_INDEXES_SQL = """
+-- Covers "latest match for a job" lookups without a sort; replaces the
+-- plain job_id index it extends
+DROP INDEX IF EXISTS idx_job_matches_job_id;
+CREATE INDEX IF NOT EXISTS idx_job_matches_job_created ON job_matches(job_id, created_at DESC, fit_score);
+CREATE INDEX IF NOT EXISTS idx_job_matches_resume_id ON job_matches(resume_id);
+-- Covers get_resumes_for_job: customized matches only, newest first
+CREATE INDEX IF NOT EXISTS idx_job_matches_job_customized ON job_matches(job_id, created_at DESC, resume_id)
+    WHERE resume_customized_for_job = 1;
+CREATE INDEX IF NOT EXISTS idx_job_match_skills_match_id ON job_match_skills(match_id);
+CREATE INDEX IF NOT EXISTS idx_job_match_skills_kind_skill ON job_match_skills(kind, skill);
+CREATE INDEX IF NOT EXISTS idx_resumes_job_created ON resumes(job_id, created_at DESC) WHERE job_id IS NOT NULL;
+-- Latest-resume lookups seek the first entry instead of sorting
+CREATE INDEX IF NOT EXISTS idx_resumes_updated ON resumes(updated_at DESC);
+-- Per-resume and per-job listings come back newest first; these replace
+-- the plain foreign-key indexes they extend
+DROP INDEX IF EXISTS idx_bullet_changes_resume_id;
+CREATE INDEX IF NOT EXISTS idx_bullet_changes_resume_created ON bullet_changes(resume_id, created_at DESC);
+DROP INDEX IF EXISTS idx_applications_job_id;
+CREATE INDEX IF NOT EXISTS idx_applications_job_created ON applications(job_id, created_at DESC);
+CREATE INDEX IF NOT EXISTS idx_applications_resume_id ON applications(resume_id);
+-- Events of one type, newest first; replaces the plain event_type index
+DROP INDEX IF EXISTS idx_analytics_events_event_type;
+CREATE INDEX IF NOT EXISTS idx_analytics_events_type_created ON analytics_events(event_type, created_at DESC);
+CREATE INDEX IF NOT EXISTS idx_analytics_events_created_at ON analytics_events(created_at);
+CREATE INDEX IF NOT EXISTS idx_time_to_apply_job_id ON time_to_apply(job_id);
+-- Sorted, null-free durations for the time-to-apply median
+CREATE INDEX IF NOT EXISTS idx_time_to_apply_duration ON time_to_apply(duration_seconds)
+    WHERE duration_seconds IS NOT NULL;
+-- UNIQUE(skill_name) already indexes skill_name; the priority index walks
+-- get_missing_skills_ranked's default order without a sort
+DROP INDEX IF EXISTS idx_missing_skills_skill_name;
+DROP INDEX IF EXISTS idx_missing_skills_priority_score;
+CREATE INDEX IF NOT EXISTS idx_missing_skills_priority_desc ON missing_skills_aggregation(priority_score DESC, frequency_count DESC);
+"""
 
 
 def create_tables(conn: sqlite3.Connection) -> None:
-    """Create all database tables."""
-    cursor = conn.cursor()
-    
-    # Resumes table
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS resumes (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            version INTEGER NOT NULL,
-            resume_json TEXT NOT NULL,
-            file_path TEXT,
-            job_id INTEGER,
-            is_customized BOOLEAN DEFAULT 0,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            FOREIGN KEY (job_id) REFERENCES jobs(id)
-        )
-    """)
-    
-    # Add new columns if they don't exist (for existing databases)
-    for column in ["file_path", "job_id", "is_customized"]:
-        try:
-            cursor.execute(f"ALTER TABLE resumes ADD COLUMN {column} {('TEXT' if column == 'file_path' else 'INTEGER' if column == 'job_id' else 'BOOLEAN DEFAULT 0')}")
-        except sqlite3.OperationalError:
-            pass  # Column already exists
-    
-    # Jobs table
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS jobs (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            company TEXT NOT NULL,
-            title TEXT NOT NULL,
-            location TEXT,
-            description TEXT NOT NULL,
-            source_url TEXT,
-            date_posted TIMESTAMP,
-            job_skills_json TEXT,
-            status TEXT DEFAULT 'New',
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        )
-    """)
+    """Create all database tables.
     
-    # Add status column if it doesn't exist (for existing databases)
-    try:
-        cursor.execute("ALTER TABLE jobs ADD COLUMN status TEXT DEFAULT 'New'")
-    except sqlite3.OperationalError:
-        pass  # Column already exists
+    A database already at SCHEMA_VERSION is left as is, so reopening one
+    skips the DDL and column probes entirely; so is one stamped by a newer
+    build, which this one must not downgrade. Otherwise tables and indexes
+    are each created by one executescript() call.
+    """
+    if conn.execute("PRAGMA user_version").fetchone()[0] >= SCHEMA_VERSION:
+        return
     
-    # Add Google Sheets columns if they don't exist
-    google_sheets_columns = [
-        ("date_applied", "TIMESTAMP"),
-        ("notes", "TEXT"),
-        ("contact_name", "TEXT"),
-        ("contact_info", "TEXT"),
-        ("interview_dates", "TEXT"),
-        ("offer_outcome", "TEXT"),
-    ]
-    for column_name, column_type in google_sheets_columns:
-        try:
-            cursor.execute(f"ALTER TABLE jobs ADD COLUMN {column_name} {column_type}")
-        except sqlite3.OperationalError:
-            pass  # Column already exists
-    
-    # Job matches table
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS job_matches (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            job_id INTEGER,
-            resume_id INTEGER,
-            fit_score REAL NOT NULL,
-            match_details_json TEXT,
-            resume_customized_for_job BOOLEAN DEFAULT 0,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            FOREIGN KEY (job_id) REFERENCES jobs(id),
-            FOREIGN KEY (resume_id) REFERENCES resumes(id)
-        )
-    """)
-    
-    # Bullet changes table (with reasoning_json)
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS bullet_changes (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            resume_id INTEGER,
-            bullet_id TEXT NOT NULL,
-            original_text TEXT NOT NULL,
-            new_text TEXT NOT NULL,
-            justification_json TEXT NOT NULL,
-            reasoning_json TEXT,
-            selected_variation_index INTEGER,
-            approved_by_human BOOLEAN DEFAULT 0,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            FOREIGN KEY (resume_id) REFERENCES resumes(id)
-        )
-    """)
-    
-    # Applications table
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS applications (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            job_id INTEGER,
-            resume_id INTEGER,
-            status TEXT DEFAULT 'pending',
-            applied_at TIMESTAMP,
-            notes TEXT,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            FOREIGN KEY (job_id) REFERENCES jobs(id),
-            FOREIGN KEY (resume_id) REFERENCES resumes(id)
-        )
-    """)
+    cursor = conn.cursor()
+    # WAL is stored in the database file, so databases created here keep it
+    # on every later connection; it cannot be switched inside a transaction
+    if not conn.in_transaction:
+        cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.executescript(_TABLES_SQL)
+    _add_missing_columns(cursor)
+    cursor.executescript(_INDEXES_SQL)
+    # Duplicate jobs may block these; Database retries them on every open
+    create_job_unique_indexes(conn)
     
-    # Contacts table
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS contacts (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            job_id INTEGER,
-            name TEXT,
-            email TEXT,
-            phone TEXT,
-            linkedin TEXT,
-            notes TEXT,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            FOREIGN KEY (job_id) REFERENCES jobs(id)
-        )
-    """)
+    # Planner statistics; analysis_limit samples large indexes instead of
+    # scanning them so this stays cheap
+    cursor.execute("PRAGMA analysis_limit=400")
+    cursor.execute("ANALYZE")
     
-    # Analytics events table
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS analytics_events (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            event_type TEXT NOT NULL,
-            metadata_json TEXT,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        )
-    """)
+    cursor.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+    conn.commit()
+
+
+# Columns added after their table was first created, as (table, column, type)
+_ADDED_COLUMNS = [
+    ("resumes", "file_path", "TEXT"),
+    ("resumes", "job_id", "INTEGER"),
+    ("resumes", "is_customized", "BOOLEAN DEFAULT 0"),
+    ("jobs", "status", "TEXT DEFAULT 'New'"),
+    # Google Sheets columns
+    ("jobs", "date_applied", "TIMESTAMP"),
+    ("jobs", "notes", "TEXT"),
+    ("jobs", "contact_name", "TEXT"),
+    ("jobs", "contact_info", "TEXT"),
+    ("jobs", "interview_dates", "TEXT"),
+    ("jobs", "offer_outcome", "TEXT"),
+    # Evidence tracking columns
+    ("missing_skills_aggregation", "job_evidence_json", "TEXT"),
+    ("missing_skills_aggregation", "resume_coverage", "TEXT"),
+    ("missing_skills_aggregation", "is_generic", "BOOLEAN DEFAULT 0"),
+    ("missing_skills_aggregation", "decomposition_json", "TEXT"),
+]
+
+
+def _add_missing_columns(cursor: sqlite3.Cursor) -> None:
+    """Add columns introduced after a table was first created.
     
-    # Time-to-apply tracking
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS time_to_apply (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            job_id INTEGER NOT NULL,
-            created_at TIMESTAMP NOT NULL,
-            applied_at TIMESTAMP,
-            duration_seconds INTEGER,
-            FOREIGN KEY (job_id) REFERENCES jobs(id)
-        )
-    """)
+    Existing columns are read once per table from PRAGMA table_info, so only
+    the ALTERs an older database actually needs are run.
+    """
+    existing = {}
+    for table, column, column_type in _ADDED_COLUMNS:
+        if table not in existing:
+            existing[table] = {row[1] for row in cursor.execute(f"PRAGMA table_info({table})")}
+        if column not in existing[table]:
+            cursor.execute(f"ALTER TABLE {table} ADD COLUMN {column} {column_type}")
+
+
+# Unique job indexes save_job relies on, by name
+_JOB_UNIQUE_INDEXES = {
+    "idx_jobs_source_url": """
+        CREATE UNIQUE INDEX IF NOT EXISTS idx_jobs_source_url ON jobs(source_url)
+        WHERE source_url IS NOT NULL AND source_url != ''
+    """,
+    "idx_jobs_company_title": "CREATE UNIQUE INDEX IF NOT EXISTS idx_jobs_company_title ON jobs(LOWER(company), LOWER(title))",
+}
+
+
+def create_job_unique_indexes(conn: sqlite3.Connection) -> List[str]:
+    """Create the unique indexes save_job relies on to detect duplicate jobs.
     
-    # Missing skills aggregation cache
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS missing_skills_aggregation (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            skill_name TEXT NOT NULL,
-            frequency_count INTEGER DEFAULT 0,
-            required_count INTEGER DEFAULT 0,
-            preferred_count INTEGER DEFAULT 0,
-            general_count INTEGER DEFAULT 0,
-            priority_score REAL DEFAULT 0.0,
-            last_updated TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            UNIQUE(skill_name)
-        )
-    """)
+    Jobs are unique by source_url (when set) and by case-insensitive
+    company+title. Each index is created independently, so duplicates on
+    one key do not hold back the other.
     
-    # Add evidence tracking columns if they don't exist
-    evidence_columns = [
-        ("job_evidence_json", "TEXT"),
-        ("resume_coverage", "TEXT"),
-        ("is_generic", "BOOLEAN DEFAULT 0"),
-        ("decomposition_json", "TEXT"),
-    ]
-    for column_name, column_type in evidence_columns:
+    Returns:
+        Names of the indexes existing duplicate jobs prevented; they are
+        created once Database.deduplicate_jobs() has removed the duplicates,
+        and until then save_job looks duplicates up without them
+    """
+    missing = []
+    for name, sql in _JOB_UNIQUE_INDEXES.items():
         try:
-            cursor.execute(f"ALTER TABLE missing_skills_aggregation ADD COLUMN {column_name} {column_type}")
-        except sqlite3.OperationalError:
-            pass  # Column already exists
-    
-    # Create indexes
-    cursor.execute("CREATE INDEX IF NOT EXISTS idx_job_matches_job_id ON job_matches(job_id)")
-    cursor.execute("CREATE INDEX IF NOT EXISTS idx_job_matches_resume_id ON job_matches(resume_id)")
-    cursor.execute("CREATE INDEX IF NOT EXISTS idx_bullet_changes_resume_id ON bullet_changes(resume_id)")
-    cursor.execute("CREATE INDEX IF NOT EXISTS idx_applications_job_id ON applications(job_id)")
-    cursor.execute("CREATE INDEX IF NOT EXISTS idx_applications_resume_id ON applications(resume_id)")
-    cursor.execute("CREATE INDEX IF NOT EXISTS idx_analytics_events_event_type ON analytics_events(event_type)")
-    cursor.execute("CREATE INDEX IF NOT EXISTS idx_analytics_events_created_at ON analytics_events(created_at)")
-    cursor.execute("CREATE INDEX IF NOT EXISTS idx_time_to_apply_job_id ON time_to_apply(job_id)")
-    cursor.execute("CREATE INDEX IF NOT EXISTS idx_missing_skills_skill_name ON missing_skills_aggregation(skill_name)")
-    cursor.execute("CREATE INDEX IF NOT EXISTS idx_missing_skills_priority_score ON missing_skills_aggregation(priority_score)")
-    
-    conn.commit()
-
+            conn.execute(sql)
+        except sqlite3.IntegrityError:
+            missing.append(name)
+    return missing
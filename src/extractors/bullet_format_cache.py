@@ -0,0 +1,87 @@
+"""Persistent cache of AI-formatted project bullets."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+import time
+from pathlib import Path
+from typing import List, Optional
+
+
+CACHE_PATH = Path("data/bullet_format_cache.db")
+
+# Cached bullets older than this are formatted again
+DEFAULT_TTL_SECONDS = 30 * 24 * 60 * 60
+
+
+class BulletFormatCache:
+    """Cache formatted bullets keyed by the model and prompt that produced them.
+
+    Keying on the rendered prompt means any change to the project's bullets,
+    name, tech stack or description, or to the prompt template itself, misses
+    the cache instead of returning stale bullets.
+    """
+
+    def __init__(self, path: Path = CACHE_PATH, ttl_seconds: Optional[float] = DEFAULT_TTL_SECONDS):
+        """Initialize cache.
+
+        Args:
+            path: SQLite file backing the cache (created on first use)
+            ttl_seconds: Age after which cached bullets are ignored, or None
+                to keep them indefinitely
+        """
+        self.path = Path(path)
+        self.ttl_seconds = ttl_seconds
+        self._conn: Optional[sqlite3.Connection] = None
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS bullet_format_cache (
+                    hash TEXT PRIMARY KEY,
+                    bullets_json TEXT NOT NULL,
+                    created_at REAL NOT NULL
+                )
+            """)
+            self._conn.commit()
+        return self._conn
+
+    def close(self) -> None:
+        """Close the underlying connection."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    @staticmethod
+    def make_key(model: str, prompt: str) -> str:
+        """Hash a model name and rendered prompt into a cache key."""
+        payload = f"{model}\x00{prompt}"
+        return hashlib.blake2b(payload.encode("utf-8"), digest_size=32).hexdigest()
+
+    def get(self, key: str) -> Optional[List[str]]:
+        """Return the cached bullets for a key, if present and not expired."""
+        if self.ttl_seconds is None:
+            row = self.conn.execute(
+                "SELECT bullets_json FROM bullet_format_cache WHERE hash = ?", (key,)
+            ).fetchone()
+        else:
+            row = self.conn.execute(
+                "SELECT bullets_json FROM bullet_format_cache WHERE hash = ? AND created_at >= ?",
+                (key, time.time() - self.ttl_seconds),
+            ).fetchone()
+        if row:
+            return json.loads(row[0])
+        return None
+
+    def put(self, key: str, bullets: List[str]) -> None:
+        """Store formatted bullets under their key."""
+        self.conn.execute(
+            "INSERT OR REPLACE INTO bullet_format_cache (hash, bullets_json, created_at) VALUES (?, ?, ?)",
+            (key, json.dumps(bullets), time.time()),
+        )
+        self.conn.commit()
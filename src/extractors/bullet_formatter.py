@@ -2,9 +2,33 @@
 
 import json
 import os
+from functools import lru_cache
 from typing import List, Optional
 from openai import OpenAI
 
+from src.extractors.bullet_format_cache import BulletFormatCache
+
+
+MODEL = "gpt-4o-mini"
+
+# Markdown emphasis and code characters stripped from model output
+_MARKDOWN_STRIP = str.maketrans("", "", "*`")
+
+SYSTEM_MESSAGE = (
+    "You are a professional resume writer specializing in technical resumes. "
+    "Format bullets to be concise, action-oriented, and professional."
+)
+
+
+@lru_cache(maxsize=None)
+def _shared_client(api_key: str) -> OpenAI:
+    """OpenAI client shared by every formatter using api_key.
+    
+    Creating a client builds a new HTTP connection pool, so formatters
+    created per request reuse one instead.
+    """
+    return OpenAI(api_key=api_key)
+
 
 class BulletFormatter:
     """Format raw project bullets into professional resume bullets using AI."""
@@ -50,10 +74,46 @@ Examples of BAD bullets (to avoid):
 - "Overfitting and underfitting patterns" (not a sentence, no action)
 """
     
-    def __init__(self):
-        """Initialize bullet formatter."""
+    # Verbs a fallback bullet may already start with
+    ACTION_VERBS = (
+        "Built", "Developed", "Implemented", "Created", "Designed", "Trained",
+        "Applied", "Evaluated", "Improved", "Optimized", "Integrated", "Deployed",
+    )
+    
+    # Filled in by str.format per call; everything else is built once here
+    PROMPT_TEMPLATE = """You are formatting project bullets for a professional resume. Convert the raw bullet points below into well-formatted resume bullets.
+
+""" + BULLET_STRUCTURE + """
+
+Project Name: {project_name}
+Technologies Used: {tech_stack}
+{description}
+
+Raw Bullets to Format:
+{raw_bullets}
+
+Format each bullet point following the structure above. Convert technical details, feature lists, and descriptions into action-oriented resume bullets.
+
+Return a JSON object with a "bullets" array containing the formatted bullets:
+{{"bullets": ["bullet 1", "bullet 2", "bullet 3", ...]}}
+
+Requirements:
+- Each bullet must be a complete sentence starting with an action verb
+- Include relevant technologies naturally in the sentence
+- Maximum 5-6 bullets (prioritize the most impactful ones)
+- Each bullet should be 15-25 words
+- Use past tense for completed projects
+"""
+    
+    def __init__(self, cache: Optional[BulletFormatCache] = None):
+        """Initialize bullet formatter.
+        
+        Pass a BulletFormatCache to reuse bullets already formatted for the
+        same project inputs instead of calling the model again.
+        """
         api_key = os.getenv("OPENAI_API_KEY")
-        self.client = OpenAI(api_key=api_key) if api_key else None
+        self.client = _shared_client(api_key) if api_key else None
+        self.cache = cache
     
     def format_bullets(
         self,
@@ -94,41 +154,24 @@ Examples of BAD bullets (to avoid):
         description: Optional[str] = None,
     ) -> List[str]:
         """Format bullets using AI."""
+        prompt = self.PROMPT_TEMPLATE.format(
+            project_name=project_name,
+            tech_stack=", ".join(tech_stack) if tech_stack else "various technologies",
+            description=f"\nProject Description: {description}" if description else "",
+            raw_bullets="\n".join(f"- {bullet}" for bullet in raw_bullets[:15]),
+        )
         
-        tech_stack_str = ", ".join(tech_stack) if tech_stack else "various technologies"
-        description_text = f"\nProject Description: {description}" if description else ""
+        cache_key = None
+        if self.cache is not None:
+            cache_key = self.cache.make_key(MODEL, prompt)
+            cached = self.cache.get(cache_key)
+            if cached:
+                return cached
         
-        prompt = f"""You are formatting project bullets for a professional resume. Convert the raw bullet points below into well-formatted resume bullets.
-
-{self.BULLET_STRUCTURE}
-
-Project Name: {project_name}
-Technologies Used: {tech_stack_str}
-{description_text}
-
-Raw Bullets to Format:
-{chr(10).join(f"- {bullet}" for bullet in raw_bullets[:15])}
-
-Format each bullet point following the structure above. Convert technical details, feature lists, and descriptions into action-oriented resume bullets.
-
-Return a JSON object with a "bullets" array containing the formatted bullets:
-{{"bullets": ["bullet 1", "bullet 2", "bullet 3", ...]}}
-
-Requirements:
-- Each bullet must be a complete sentence starting with an action verb
-- Include relevant technologies naturally in the sentence
-- Maximum 5-6 bullets (prioritize the most impactful ones)
-- Each bullet should be 15-25 words
-- Use past tense for completed projects
-"""
-
         response = self.client.chat.completions.create(
-            model="gpt-4o-mini",
+            model=MODEL,
             messages=[
-                {
-                    "role": "system",
-                    "content": "You are a professional resume writer specializing in technical resumes. Format bullets to be concise, action-oriented, and professional.",
-                },
+                {"role": "system", "content": SYSTEM_MESSAGE},
                 {"role": "user", "content": prompt},
             ],
             response_format={"type": "json_object"},
@@ -153,9 +196,8 @@ Requirements:
                 formatted = []
                 for b in bullets[:6]:  # Limit to 6
                     if b:
-                        bullet_text = str(b).strip()
                         # Remove markdown formatting if present
-                        bullet_text = bullet_text.replace('**', '').replace('*', '').replace('`', '')
+                        bullet_text = str(b).strip().translate(_MARKDOWN_STRIP)
                         if bullet_text and len(bullet_text) > 10:  # Minimum meaningful length
                             # Ensure it ends with period
                             if not bullet_text.endswith('.'):
@@ -163,6 +205,8 @@ Requirements:
                             formatted.append(bullet_text)
                 
                 if formatted:
+                    if cache_key is not None:
+                        self.cache.put(cache_key, formatted)
                     return formatted
         except Exception:
             pass
@@ -177,12 +221,6 @@ Requirements:
     ) -> List[str]:
         """Fallback formatting without AI - basic improvements."""
         formatted = []
-        action_verbs = [
-            "Built", "Developed", "Implemented", "Created", "Designed", "Trained",
-            "Applied", "Evaluated", "Improved", "Optimized", "Integrated", "Deployed"
-        ]
-        
-        tech_stack_lower = [t.lower() for t in tech_stack]
         
         for bullet in raw_bullets[:6]:
             bullet = bullet.strip()
@@ -190,27 +228,25 @@ Requirements:
                 continue
             
             # Skip if it's too short or looks like a configuration
-            if len(bullet) < 15 or "→" in bullet or ":" in bullet and len(bullet.split(":")) == 2:
+            if len(bullet) < 15 or "→" in bullet or bullet.count(":") == 1:
                 continue
             
             # Check if it already starts with an action verb
-            starts_with_verb = any(bullet.startswith(verb) for verb in action_verbs)
-            
-            if not starts_with_verb:
+            if not bullet.startswith(self.ACTION_VERBS):
                 # Try to add an action verb
                 bullet_lower = bullet.lower()
                 if "train" in bullet_lower or "model" in bullet_lower:
-                    bullet = f"Trained {bullet.lower()}"
+                    bullet = f"Trained {bullet_lower}"
                 elif "build" in bullet_lower or "create" in bullet_lower:
-                    bullet = f"Built {bullet.lower()}"
+                    bullet = f"Built {bullet_lower}"
                 elif "implement" in bullet_lower:
-                    bullet = f"Implemented {bullet.lower()}"
+                    bullet = f"Implemented {bullet_lower}"
                 elif "evaluat" in bullet_lower or "test" in bullet_lower:
-                    bullet = f"Evaluated {bullet.lower()}"
+                    bullet = f"Evaluated {bullet_lower}"
                 elif "visualiz" in bullet_lower or "plot" in bullet_lower:
-                    bullet = f"Visualized {bullet.lower()}"
+                    bullet = f"Visualized {bullet_lower}"
                 else:
-                    bullet = f"Developed {bullet.lower()}"
+                    bullet = f"Developed {bullet_lower}"
             
             # Ensure it's a sentence (ends with period)
             if not bullet.endswith('.'):
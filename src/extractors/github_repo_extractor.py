@@ -4,6 +4,7 @@ from typing import Optional, List
 from src.extractors.github_api import GitHubAPIClient
 from src.extractors.readme_parser import ReadmeParser
 from src.extractors.dependency_parser import DependencyParser
+from src.extractors.bullet_format_cache import BulletFormatCache
 from src.extractors.bullet_formatter import BulletFormatter
 from src.models.resume import ProjectItem, Bullet
 
@@ -33,7 +34,7 @@ class GitHubRepoExtractor:
         self.readme_parser = ReadmeParser()
         self.dependency_parser = DependencyParser()
         try:
-            self.bullet_formatter = BulletFormatter()
+            self.bullet_formatter = BulletFormatter(cache=BulletFormatCache())
         except ValueError:
             # If OpenAI API key not available, bullet formatter will be None
             self.bullet_formatter = None
@@ -21,7 +21,7 @@ from src.gui.job_helpers import auto_match_skills
 def render_job_list(db: Database):
     """Render jobs table and return selected job."""
     try:
-        jobs = db.list_jobs()
+        jobs = db.list_jobs(include_description=False)
     except Exception as e:
         st.error(f"Error loading jobs: {e}")
         import traceback
@@ -78,7 +78,8 @@ def render_job_list(db: Database):
                         job_match = matcher.match_job(resume, job_skills)
                         resume_id = db.get_latest_resume_id()
                         if resume_id:
-                            db.save_job_match(job_match, job_id, resume_id)
+                            db.save_job_match(job_match, job_id, resume_id, durable=False)
+                db.flush()
                 st.session_state['refreshing_jobs'] = False
                 st.success("Fit scores refreshed!")
                 st.rerun()
@@ -112,9 +113,10 @@ def render_job_list(db: Database):
                     fit_scores[job_id] = job_match.fit_score
                     resume_id = db.get_latest_resume_id()
                     if resume_id:
-                        db.save_job_match(job_match, job_id, resume_id)
+                        db.save_job_match(job_match, job_id, resume_id, durable=False)
                 else:
                     fit_scores[job_id] = 0.0
+        db.flush()
     else:
         for job in jobs:
             fit_scores[job.get('id')] = 0.0
@@ -149,7 +151,7 @@ def render_job_list(db: Database):
                         company=job.get('company', ''),
                         title=job.get('title', ''),
                         location=job.get('location'),
-                        description=job.get('description', ''),
+                        description=job.get('description') or '',
                         source_url=job.get('source_url'),
                     )
                     resume_path = resume_manager.get_resume_by_job(job_obj)
@@ -310,7 +312,7 @@ def render_job_list(db: Database):
             company=selected_job.get('company', ''),
             title=selected_job.get('title', ''),
             location=selected_job.get('location'),
-            description=selected_job.get('description', ''),
+            description=selected_job.get('description') or '',
             source_url=selected_job.get('source_url'),
         )
         resume_path = resume_manager.get_resume_by_job(job_obj)
@@ -354,7 +354,7 @@ def render_resumes_page(db: Database):
     st.divider()
     
     # Get all jobs
-    all_jobs = db.get_all_jobs()
+    all_jobs = db.list_jobs_summary()
     
     if not all_jobs:
         st.info("No jobs added yet. Add a job from the Jobs page to generate resumes.")
@@ -373,7 +373,7 @@ def render_resumes_page(db: Database):
         job_title = job.get('title', 'Unknown')
         
         # Get resumes for this job from database
-        db_resumes = db.get_resumes_by_job_id(job_id)
+        db_resumes = db.list_resume_meta_for_job(job_id)
         
         if db_resumes:
             resumes_by_job[job_id] = {
@@ -395,15 +395,14 @@ def render_resumes_page(db: Database):
                 
                 # Display each resume for this job
                 for resume_data in db_resumes:
-                    resume = resume_data['resume']
                     resume_id = resume_data['id']
                     file_path = resume_data.get('file_path')
                     
                     col1, col2 = st.columns([3, 1])
                     with col1:
                         st.write(f"**Resume ID:** {resume_id}")
-                        st.write(f"**Name:** {resume.name}")
-                        st.write(f"**Version:** {resume.version}")
+                        st.write(f"**Name:** {resume_data['name']}")
+                        st.write(f"**Version:** {resume_data['version']}")
                         if resume_data.get('is_customized'):
                             st.write("**Customized for this job**")
                         
@@ -35,12 +35,9 @@ class ResumeReuseChecker:
         Returns:
             Tuple of (resume_id, Resume, fit_score, similarity_score) if found, None otherwise
         """
-        # Get all jobs from database
-        all_jobs_data = self.db.get_all_jobs()
-        
-        # Convert to (job_id, JobSkills) tuples
+        # Convert jobs to (job_id, JobSkills) tuples, streaming them from the database
         all_jobs = []
-        for job_data in all_jobs_data:
+        for job_data in self.db.iter_all_jobs():
             job_id = job_data.get('id')
             if not job_id:
                 continue  # Skip if no ID
@@ -167,10 +167,10 @@ class SheetSyncService:
         title = row.get('Job Title', '').strip()
         source_url = row.get('Job Link / Source', '').strip()
         
-        # Try to find by company + title
-        all_jobs = self.db.get_all_jobs()
-        for job in all_jobs:
-            # get_all_jobs() returns dictionaries
+        # Stream jobs, stopping at the first company + title match; a
+        # source_url match is only used if no company + title match exists
+        url_match = None
+        for job in self.db.iter_all_jobs():
             job_company = job.get('company', '').strip() if job.get('company') else ''
             job_title = job.get('title', '').strip() if job.get('title') else ''
             job_id = job.get('id')
@@ -179,17 +179,13 @@ class SheetSyncService:
                 job_company.lower() == company.lower() and 
                 job_title.lower() == title.lower()):
                 return {'id': job_id, 'job': job}
-        
-        # Try to find by source_url if available
-        if source_url:
-            for job in all_jobs:
+            
+            if source_url and url_match is None:
                 job_source_url = job.get('source_url', '').strip() if job.get('source_url') else ''
-                job_id = job.get('id')
-                
                 if job_source_url and job_source_url == source_url:
-                    return {'id': job_id, 'job': job}
+                    url_match = {'id': job_id, 'job': job}
         
-        return None
+        return url_match
     
     def _update_job_from_sheet(self, job_id: int, row: Dict[str, str]):
         """Update existing job with sheet data.
@@ -299,28 +295,26 @@ class SheetSyncService:
             elif 'linkedin.com' in contact_info.lower():
                 linkedin = contact_info
         
-        # Check if contact already exists
-        cursor = self.db.conn.cursor()
-        cursor.execute("""
-            SELECT id FROM contacts WHERE job_id = ?
-        """, (job_id,))
-        existing = cursor.fetchone()
-        
-        if existing:
-            # Update existing contact
-            cursor.execute("""
-                UPDATE contacts 
-                SET name = ?, email = ?, phone = ?, linkedin = ?, notes = ?
-                WHERE job_id = ?
-            """, (contact_name or None, email, phone, linkedin, row.get('Notes'), job_id))
-        else:
-            # Create new contact
-            cursor.execute("""
-                INSERT INTO contacts (job_id, name, email, phone, linkedin, notes)
-                VALUES (?, ?, ?, ?, ?, ?)
-            """, (job_id, contact_name or None, email, phone, linkedin, row.get('Notes')))
-        
-        self.db.conn.commit()
+        # Check and write in one transaction, serialized with the database's
+        # other writers
+        with self.db.bulk() as conn:
+            existing = conn.execute("""
+                SELECT id FROM contacts WHERE job_id = ?
+            """, (job_id,)).fetchone()
+            
+            if existing:
+                # Update existing contact
+                conn.execute("""
+                    UPDATE contacts 
+                    SET name = ?, email = ?, phone = ?, linkedin = ?, notes = ?
+                    WHERE job_id = ?
+                """, (contact_name or None, email, phone, linkedin, row.get('Notes'), job_id))
+            else:
+                # Create new contact
+                conn.execute("""
+                    INSERT INTO contacts (job_id, name, email, phone, linkedin, notes)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                """, (job_id, contact_name or None, email, phone, linkedin, row.get('Notes')))
     
     def _save_application(self, job_id: int, row: Dict[str, str]):
         """Save application information to applications table.
@@ -356,28 +350,26 @@ class SheetSyncService:
             elif 'withdraw' in outcome:
                 status = 'withdrawn'
         
-        # Check if application already exists
-        cursor = self.db.conn.cursor()
-        cursor.execute("""
-            SELECT id FROM applications WHERE job_id = ?
-        """, (job_id,))
-        existing = cursor.fetchone()
-        
-        if existing:
-            # Update existing application
-            cursor.execute("""
-                UPDATE applications 
-                SET status = ?, applied_at = ?, notes = ?
-                WHERE job_id = ?
-            """, (status, applied_at, row.get('Notes'), job_id))
-        else:
-            # Create new application
-            cursor.execute("""
-                INSERT INTO applications (job_id, status, applied_at, notes)
-                VALUES (?, ?, ?, ?)
-            """, (job_id, status, applied_at, row.get('Notes')))
-        
-        self.db.conn.commit()
+        # Check and write in one transaction, serialized with the database's
+        # other writers
+        with self.db.bulk() as conn:
+            existing = conn.execute("""
+                SELECT id FROM applications WHERE job_id = ?
+            """, (job_id,)).fetchone()
+            
+            if existing:
+                # Update existing application
+                conn.execute("""
+                    UPDATE applications 
+                    SET status = ?, applied_at = ?, notes = ?
+                    WHERE job_id = ?
+                """, (status, applied_at, row.get('Notes'), job_id))
+            else:
+                # Create new application
+                conn.execute("""
+                    INSERT INTO applications (job_id, status, applied_at, notes)
+                    VALUES (?, ?, ?, ?)
+                """, (job_id, status, applied_at, row.get('Notes')))
     
     def push_to_sheet(self, sheet_name: str = "Sheet1") -> Dict[str, int]:
         """Push all jobs from database to Google Sheets.
@@ -0,0 +1,82 @@
+"""Aho-Corasick automaton for multi-pattern substring matching."""
+
+from bisect import bisect_right
+from collections import deque
+from typing import Dict, Iterable, Iterator, List, Sequence, Tuple
+
+
+# Joins texts for a single scan; never appears inside skill names, so
+# matches cannot straddle two entries
+SEPARATOR = "\x00"
+
+
+class AhoCorasick:
+    """Find every occurrence of a set of patterns in one pass over a text."""
+
+    def __init__(self, patterns: Iterable[str]):
+        """Build the automaton.
+
+        Args:
+            patterns: Patterns to match; empty patterns are ignored
+        """
+        self.patterns: List[str] = list(patterns)
+        goto: List[Dict[str, int]] = [{}]
+        output: List[List[int]] = [[]]
+
+        # Trie of all patterns
+        for index, pattern in enumerate(self.patterns):
+            if not pattern:
+                continue
+            node = 0
+            for char in pattern:
+                next_node = goto[node].get(char)
+                if next_node is None:
+                    next_node = len(goto)
+                    goto[node][char] = next_node
+                    goto.append({})
+                    output.append([])
+                node = next_node
+            output[node].append(index)
+
+        # Failure links, breadth-first so shallower links are ready first
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, next_node in goto[node].items():
+                queue.append(next_node)
+                state = fail[node]
+                while state and char not in goto[state]:
+                    state = fail[state]
+                fail[next_node] = goto[state].get(char, 0)
+                output[next_node] = output[next_node] + output[fail[next_node]]
+
+        self._goto = goto
+        self._fail = fail
+        self._output = output
+
+    def iter_matches(self, text: str) -> Iterator[Tuple[int, int]]:
+        """Yield (end_position, pattern_index) for every match in text."""
+        goto, fail, output = self._goto, self._fail, self._output
+        node = 0
+        for position, char in enumerate(text):
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            for index in output[node]:
+                yield position, index
+
+
+def join_with_offsets(texts: Sequence[str]) -> Tuple[str, List[int]]:
+    """Join texts with SEPARATOR, returning the joined text and each entry's start offset."""
+    starts = []
+    offset = 0
+    for text in texts:
+        starts.append(offset)
+        offset += len(text) + len(SEPARATOR)
+    return SEPARATOR.join(texts), starts
+
+
+def entry_at(starts: List[int], position: int) -> int:
+    """Index of the joined entry containing position."""
+    return bisect_right(starts, position) - 1
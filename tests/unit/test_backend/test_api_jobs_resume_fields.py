@@ -51,8 +51,8 @@ def test_list_jobs_includes_resume_fields(client, mock_db):
     mock_db.list_jobs.return_value = [sample_job_dict]
     mock_db.get_job_skills.return_value = None
     
-    # Mock get_resumes_by_job_id to return empty list (no resumes)
-    mock_db.get_resumes_by_job_id = Mock(return_value=[])
+    # Mock list_resume_meta_for_job to return empty list (no resumes)
+    mock_db.list_resume_meta_for_job = Mock(return_value=[])
     
     response = client.get("/api/v1/jobs")
     assert response.status_code == 200
@@ -80,8 +80,8 @@ def test_list_jobs_with_resume(client, mock_db):
     mock_db.list_jobs.return_value = [sample_job_dict]
     mock_db.get_job_skills.return_value = None
     
-    # Mock get_resumes_by_job_id to return a resume
-    mock_db.get_resumes_by_job_id = Mock(return_value=[{"id": 5}])
+    # Mock list_resume_meta_for_job to return a resume
+    mock_db.list_resume_meta_for_job = Mock(return_value=[{"id": 5}])
     
     response = client.get("/api/v1/jobs")
     assert response.status_code == 200
@@ -0,0 +1,95 @@
+"""Tests for the persistent reasoning cache."""
+
+import pytest
+
+from src.compilation.reasoning_cache import ReasoningCache
+from src.models.resume import Reasoning
+
+
+@pytest.fixture
+def reasoning():
+    return Reasoning(
+        problem_identification="Missing Docker",
+        analysis="No container tooling mentioned",
+        solution_approach="Mention Docker",
+        evaluation="Covers a required skill",
+        confidence_score=0.7,
+    )
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = ReasoningCache(path=tmp_path / "cache.db")
+    yield cache
+    cache.close()
+
+
+@pytest.fixture
+def signature():
+    job_signature = ReasoningCache.make_signature(["Docker"], [], ["Docker"], ["Python"], ["docker"], "gpt-4o-mini", 1)
+    return ReasoningCache.bullet_signature(job_signature, ["Python"])
+
+
+def test_exact_key_ignores_case_and_whitespace(cache, signature):
+    """Normalized bullet text produces the same key."""
+    assert cache.make_key("Built  APIs in Python", signature) == cache.make_key("built apis in python ", signature)
+    other = ReasoningCache.make_signature(["Kubernetes"], [], [], [], [], "gpt-4o-mini", 1)
+    assert cache.make_key("Built APIs", signature) != cache.make_key("Built APIs", other)
+
+
+@pytest.mark.parametrize("model, prompt_version, bullet_skills", [
+    ("gpt-4o", 1, ["Python"]),
+    ("gpt-4o-mini", 2, ["Python"]),
+    ("gpt-4o-mini", 1, ["Go"]),
+    ("gpt-4o-mini", 1, []),
+])
+def test_key_covers_model_prompt_version_and_bullet_skills(cache, signature, model, prompt_version, bullet_skills):
+    """Changing the model, prompt version or bullet skills misses the cache."""
+    job_signature = ReasoningCache.make_signature(["Docker"], [], ["Docker"], ["Python"], ["docker"], model, prompt_version)
+    other = ReasoningCache.bullet_signature(job_signature, bullet_skills)
+    assert cache.make_key("Built APIs", signature) != cache.make_key("Built APIs", other)
+
+
+def test_put_and_get_round_trip(cache, signature, reasoning):
+    """Stored reasoning is returned for the same key and persists across instances."""
+    key = cache.make_key("Built APIs", signature)
+    assert cache.get(key) is None
+
+    cache.put(key, signature, reasoning)
+    assert cache.get(key) == reasoning
+
+    reopened = ReasoningCache(path=cache.path)
+    assert reopened.get(key) == reasoning
+    reopened.close()
+
+
+def test_find_similar_respects_threshold_and_signature(cache, signature, reasoning):
+    """Semantic lookups only match close embeddings under the same signature."""
+    cache.put(cache.make_key("Built APIs", signature), signature, reasoning, embedding=[1.0, 0.0, 0.0])
+
+    assert cache.find_similar(signature, [0.99, 0.05, 0.0]) == reasoning
+    assert cache.find_similar(signature, [0.5, 0.5, 0.5]) is None
+    other = ReasoningCache.make_signature(["Kubernetes"], [], [], [], [], "gpt-4o-mini", 1)
+    assert cache.find_similar(other, [1.0, 0.0, 0.0]) is None
+    job_signature = ReasoningCache.make_signature(["Docker"], [], ["Docker"], ["Python"], ["docker"], "gpt-4o-mini", 1)
+    other_skills = ReasoningCache.bullet_signature(job_signature, ["Go"])
+    assert cache.find_similar(other_skills, [1.0, 0.0, 0.0]) is None
+
+
+def test_semantic_lookup_can_be_disabled(tmp_path, signature, reasoning):
+    """A None threshold turns off embedding lookups."""
+    cache = ReasoningCache(path=tmp_path / "cache.db", similarity_threshold=None)
+    cache.put(cache.make_key("Built APIs", signature), signature, reasoning, embedding=[1.0, 0.0])
+
+    assert not cache.semantic
+    assert cache.find_similar(signature, [1.0, 0.0]) is None
+    cache.close()
+
+
+def test_embeddings_stored_by_normalized_text(cache):
+    """Bullet embeddings are reused for text differing only in case and spacing."""
+    assert cache.get_embedding("Built APIs") is None
+
+    cache.put_embedding("Built APIs", [0.5, 0.25, 1.0])
+
+    assert cache.get_embedding("built  apis ") == [0.5, 0.25, 1.0]
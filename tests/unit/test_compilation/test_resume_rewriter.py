@@ -0,0 +1,353 @@
+"""Tests for ResumeRewriter using a stubbed OpenAI client."""
+
+import asyncio
+import json
+import os
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from src.compilation.reasoning_cache import ReasoningCache
+from src.compilation.resume_rewriter import ResumeRewriter
+from src.models.resume import Resume, ExperienceItem, Bullet
+from src.models.job import JobMatch
+from src.models.skills import UserSkills, UserSkill
+
+
+REASONING_JSON = json.dumps({
+    "problem_identification": "Missing Docker",
+    "analysis": "Bullet does not mention containers",
+    "solution_approach": "Mention Docker",
+    "evaluation": "Covers a required skill",
+    "confidence_score": 0.8,
+})
+
+CANDIDATES_JSON = json.dumps({
+    "candidates": [
+        {
+            "text": "Developed web applications deployed with Docker",
+            "score": {"job_skill_coverage": 0.9, "semantic_similarity": 0.8},
+            "diff_from_original": {"added": ["Docker"], "removed": []},
+        },
+    ]
+})
+
+
+class FakeCompletions:
+    """Async chat.completions stub that records peak concurrency."""
+
+    def __init__(self):
+        self.calls = []
+        self.in_flight = 0
+        self.peak_in_flight = 0
+
+    async def create(self, **kwargs):
+        self.calls.append(kwargs)
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        prompt = kwargs["messages"][-1]["content"]
+        content = CANDIDATES_JSON if "candidates" in prompt else REASONING_JSON
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+
+
+class FakeEmbeddings:
+    """Async embeddings stub returning a fixed vector per input."""
+
+    def __init__(self):
+        self.calls = []
+
+    async def create(self, model, input):
+        self.calls.append(input)
+        return SimpleNamespace(data=[SimpleNamespace(embedding=[1.0, 0.0]) for _ in input])
+
+
+class FakeAsyncOpenAI:
+    """Async context manager standing in for AsyncOpenAI."""
+
+    def __init__(self, completions, embeddings=None):
+        self.chat = SimpleNamespace(completions=completions)
+        self.embeddings = embeddings
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return None
+
+
+@pytest.fixture
+def completions():
+    return FakeCompletions()
+
+
+@pytest.fixture
+def embeddings():
+    return FakeEmbeddings()
+
+
+@pytest.fixture
+def rewriter(completions, embeddings):
+    user_skills = UserSkills(skills=[UserSkill(name="Docker", category="DevOps")])
+    with patch(
+        "src.compilation.resume_rewriter.AsyncOpenAI",
+        side_effect=lambda **kwargs: FakeAsyncOpenAI(completions, embeddings),
+    ):
+        yield ResumeRewriter(api_key="test-key", user_skills=user_skills, max_concurrency=2)
+
+
+@pytest.fixture
+def resume():
+    bullets = [Bullet(text=f"Developed web application number {i}", skills=["Python"]) for i in range(5)]
+    return Resume(
+        name="Test User",
+        experience=[
+            ExperienceItem(
+                organization="Org",
+                role="Engineer",
+                location="Remote",
+                start_date="2020",
+                bullets=bullets,
+            )
+        ],
+    )
+
+
+@pytest.fixture
+def job_match():
+    return JobMatch(
+        fit_score=0.5,
+        skill_gaps={"required_missing": ["Docker"], "preferred_missing": []},
+        missing_skills=["Docker"],
+        matching_skills=["Python"],
+    )
+
+
+def test_generate_variations_returns_ranked_candidates(rewriter, completions, resume, job_match):
+    """Every adjustable bullet gets a reasoning and ranked candidates."""
+    proposals = rewriter.generate_variations(resume, job_match)
+
+    assert list(proposals) == [f"exp_Org_{i}" for i in range(5)]
+    reasoning, candidates = proposals["exp_Org_0"]
+    assert reasoning.problem_identification == "Missing Docker"
+    assert [c.text for c in candidates] == ["Developed web applications deployed with Docker"]
+    assert candidates[0].composite_score > 0
+    # One reasoning and one candidate request per bullet
+    assert len(completions.calls) == 10
+
+
+def test_generate_variations_bounds_concurrency(rewriter, completions, resume, job_match):
+    """No more than max_concurrency requests are in flight at once."""
+    rewriter.generate_variations(resume, job_match)
+
+    assert 1 < completions.peak_in_flight <= 2
+
+
+def test_generate_variations_inside_running_event_loop(rewriter, resume, job_match):
+    """The sync wrapper works when called from async code (e.g. FastAPI endpoints)."""
+
+    async def call_from_async():
+        return rewriter.generate_variations(resume, job_match)
+
+    proposals = asyncio.run(call_from_async())
+    assert len(proposals) == 5
+
+
+def test_allowed_skills_computed_once_per_run(rewriter, resume, job_match):
+    """Allowed job skills are computed once per call, not per bullet and prompt."""
+    with patch.object(
+        rewriter, "_get_allowed_job_skills_for_user", wraps=rewriter._get_allowed_job_skills_for_user
+    ) as allowed:
+        rewriter.generate_variations(resume, job_match)
+
+    assert allowed.call_count == 1
+
+
+def test_requests_share_per_job_prompt_prefix(rewriter, completions, resume, job_match):
+    """Only the last message differs between bullets, so the prefix is cacheable."""
+    rewriter.generate_variations(resume, job_match)
+
+    reasoning_calls = [c for c in completions.calls if "candidates" not in c["messages"][-1]["content"]]
+    candidate_calls = [c for c in completions.calls if "candidates" in c["messages"][-1]["content"]]
+    for calls in (reasoning_calls, candidate_calls):
+        assert len(calls) == 5
+        assert all(c["messages"][:-1] == calls[0]["messages"][:-1] for c in calls)
+        assert len({c["messages"][-1]["content"] for c in calls}) == 5
+
+
+def test_duplicate_bullets_share_one_request(rewriter, completions, resume, job_match):
+    """Identical bullets are generated once, with their own candidate IDs."""
+    resume.experience[0].bullets[1] = Bullet(text="Developed web application number 0", skills=["Python"])
+
+    proposals = rewriter.generate_variations(resume, job_match)
+
+    assert list(proposals) == [f"exp_Org_{i}" for i in range(5)]
+    assert proposals["exp_Org_0"][0] is proposals["exp_Org_1"][0]
+    first, copy = proposals["exp_Org_0"][1], proposals["exp_Org_1"][1]
+    assert first[0] is not copy[0]
+    assert [c.text for c in first] == [c.text for c in copy]
+    assert not {c.candidate_id for c in first} & {c.candidate_id for c in copy}
+    # Four distinct bullets -> four reasoning and four candidate requests
+    assert len(completions.calls) == 8
+
+
+def test_punctuation_variants_are_not_shared(rewriter, completions, resume, job_match):
+    """Bullets differing only in punctuation, like C++ and C#, get their own requests."""
+    resume.experience[0].bullets[0] = Bullet(text="Built C++ services", skills=[])
+    resume.experience[0].bullets[1] = Bullet(text="Built C# services", skills=[])
+
+    rewriter.generate_variations(resume, job_match)
+
+    assert len(completions.calls) == 10
+
+
+def test_duplicate_text_with_different_skills_is_not_shared(rewriter, completions, resume, job_match):
+    """Bullets with the same text but different skills get their own requests."""
+    resume.experience[0].bullets[1] = Bullet(text="Developed web application number 0", skills=["SQL"])
+
+    proposals = rewriter.generate_variations(resume, job_match)
+
+    assert proposals["exp_Org_0"][0] is not proposals["exp_Org_1"][0]
+    assert len(completions.calls) == 10
+
+
+def test_allowed_skills_keep_case_variants(rewriter, job_match):
+    """User skill names differing only in case or spacing are all allowed."""
+    # UserSkills normalizes its names; other skill sources may not
+    rewriter.user_skills = SimpleNamespace(get_all_skill_names=lambda: {"Docker", "docker "})
+
+    assert sorted(rewriter._get_allowed_job_skills_for_user(job_match)) == ["Docker", "docker "]
+
+
+def test_rank_valid_candidates_stops_at_max_valid(rewriter, job_match):
+    """Candidates are consumed lazily and generation stops once enough are valid."""
+    bullet = Bullet(text="Developed web application number 0", skills=["Python"])
+    candidates_data = [{"text": f"Developed web application {i} with Docker"} for i in range(4)]
+    produced = []
+
+    def candidates():
+        for candidate in rewriter._iter_candidates(candidates_data, bullet):
+            produced.append(candidate)
+            yield candidate
+
+    ranked = rewriter._rank_valid_candidates(bullet, candidates(), job_match, max_valid=2)
+
+    assert len(ranked) == 2
+    assert len(produced) == 2
+
+
+class FakeBatchClient:
+    """Sync client stub implementing the files/batches calls used by the Batch API path."""
+
+    def __init__(self):
+        self.uploads = {}
+        self.outputs = {}
+        self.files = SimpleNamespace(create=self._create_file, content=self._file_content)
+        self.batches = SimpleNamespace(create=self._create_batch, retrieve=self._retrieve_batch)
+
+    def _create_file(self, file, purpose):
+        file_id = f"file-{len(self.uploads)}"
+        self.uploads[file_id] = file[1].decode("utf-8")
+        return SimpleNamespace(id=file_id)
+
+    def _file_content(self, file_id):
+        return SimpleNamespace(text=self.outputs[file_id])
+
+    def _create_batch(self, input_file_id, endpoint, completion_window):
+        batch_id = f"batch-{input_file_id}"
+        lines = []
+        for line in self.uploads[input_file_id].splitlines():
+            request = json.loads(line)
+            prompt = request["body"]["messages"][-1]["content"]
+            content = CANDIDATES_JSON if "candidates" in prompt else REASONING_JSON
+            lines.append(json.dumps({
+                "custom_id": request["custom_id"],
+                "response": {"status_code": 200, "body": {"choices": [{"message": {"content": content}}]}},
+                "error": None,
+            }))
+        self.outputs[f"out-{batch_id}"] = "\n".join(lines)
+        return SimpleNamespace(id=batch_id, status="validating", output_file_id=None)
+
+    def _retrieve_batch(self, batch_id):
+        return SimpleNamespace(id=batch_id, status="completed", output_file_id=f"out-{batch_id}")
+
+
+def test_generate_variations_batch(rewriter, resume, job_match):
+    """Batch mode submits one reasoning batch and one candidate batch."""
+    rewriter.client = FakeBatchClient()
+
+    proposals = rewriter.generate_variations_batch(resume, job_match, poll_interval=0)
+
+    assert len(rewriter.client.uploads) == 2
+    assert len(proposals) == 5
+    reasoning, candidates = proposals["exp_Org_3"]
+    assert reasoning.confidence_score == 0.8
+    assert candidates[0].text == "Developed web applications deployed with Docker"
+
+
+def test_reasoning_cache_skips_repeat_reasoning_calls(rewriter, completions, resume, job_match, tmp_path):
+    """A second run over the same bullets reuses cached reasoning chains."""
+    rewriter.reasoning_cache = ReasoningCache(path=tmp_path / "cache.db", similarity_threshold=None)
+
+    rewriter.generate_variations(resume, job_match)
+    first_run_calls = len(completions.calls)
+    rewriter.generate_variations(resume, job_match)
+
+    # Only candidate requests are repeated
+    assert first_run_calls == 10
+    assert len(completions.calls) - first_run_calls == 5
+    rewriter.reasoning_cache.close()
+
+
+def test_reasoning_cache_separates_bullet_skills(rewriter, completions, resume, job_match, tmp_path):
+    """A cached reasoning is not reused for the same text with different skills."""
+    rewriter.reasoning_cache = ReasoningCache(path=tmp_path / "cache.db", similarity_threshold=None)
+
+    rewriter.generate_variations(resume, job_match)
+    first_run_calls = len(completions.calls)
+    resume.experience[0].bullets[0] = Bullet(text="Developed web application number 0", skills=["SQL"])
+    rewriter.generate_variations(resume, job_match)
+
+    # Five candidate requests plus one reasoning request for the changed bullet
+    assert len(completions.calls) - first_run_calls == 6
+    rewriter.reasoning_cache.close()
+
+
+def test_feedback_note_reloaded_only_when_file_changes(rewriter, tmp_path, monkeypatch):
+    """The preference note is cached until the feedback file is rewritten."""
+    feedback_path = tmp_path / "bullet_feedback.json"
+    monkeypatch.setattr("src.compilation.resume_rewriter.FEEDBACK_PATH", feedback_path)
+    assert rewriter._get_feedback_note() == ""
+
+    feedback_path.write_text(json.dumps({"entries": [{"action": "accepted", "rewrite_intent": None, "length": 80}]}))
+    note = rewriter._get_feedback_note()
+    assert "80 characters" in note
+
+    with patch("src.compilation.resume_rewriter.BulletFeedbackStore") as store_cls:
+        assert rewriter._get_feedback_note() == note
+        store_cls.assert_not_called()
+
+    feedback_path.write_text(json.dumps({"entries": [{"action": "accepted", "rewrite_intent": None, "length": 120}]}))
+    stat = feedback_path.stat()
+    os.utime(feedback_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert "120 characters" in rewriter._get_feedback_note()
+
+
+def test_semantic_cache_embeds_all_bullets_in_one_request(rewriter, completions, embeddings, resume, job_match, tmp_path):
+    """Cache misses are embedded together, and stored embeddings are not re-requested."""
+    rewriter.reasoning_cache = ReasoningCache(path=tmp_path / "cache.db", similarity_threshold=0.99)
+
+    rewriter.generate_variations(resume, job_match)
+
+    assert len(embeddings.calls) == 1
+    assert len(embeddings.calls[0]) == 5
+    assert len(completions.calls) == 10
+
+    job_match.matching_skills = ["Python", "Flask"]
+    rewriter.generate_variations(resume, job_match)
+
+    # New signature misses the cache, but bullet embeddings come from storage
+    assert len(embeddings.calls) == 1
+    rewriter.reasoning_cache.close()
@@ -1,9 +1,12 @@
 """Unit tests for database operations."""
 
+import sqlite3
+from datetime import datetime, timedelta
+
 import pytest
-from src.db.database import Database
+from src.db.database import JSONB_AVAILABLE, Database
 from src.models.resume import Resume, Justification, Reasoning
-from src.models.job import JobPosting, JobSkills
+from src.models.job import JobPosting, JobSkills, JobMatch
 
 
 def test_database_creation(test_db):
@@ -11,6 +14,12 @@ def test_database_creation(test_db):
     assert test_db is not None
 
 
+def test_database_uses_wal(test_db):
+    """Test the connection is opened in WAL mode."""
+    mode = test_db.conn.execute("PRAGMA journal_mode").fetchone()[0]
+    assert mode == "wal"
+
+
 def test_save_and_get_resume(test_db, sample_resume):
     """Test saving and retrieving resume."""
     resume_id = test_db.save_resume(sample_resume)
@@ -21,6 +30,18 @@ def test_save_and_get_resume(test_db, sample_resume):
     assert retrieved.name == sample_resume.name
 
 
+def test_get_resume_returns_independent_copies(test_db, sample_resume):
+    """Test cached resumes are parsed once and copied per call."""
+    resume_id = test_db.save_resume(sample_resume)
+    
+    first = test_db.get_resume(resume_id)
+    first.name = "Changed"
+    
+    assert test_db.get_resume(resume_id).name == sample_resume.name
+    assert test_db.get_latest_resume().name == sample_resume.name
+    assert test_db._parsed_resume.cache_info().misses == 1
+
+
 def test_save_job(test_db, sample_job_posting, sample_job_skills):
     """Test saving job."""
     job_id = test_db.save_job(sample_job_posting, sample_job_skills)
@@ -31,6 +52,59 @@ def test_save_job(test_db, sample_job_posting, sample_job_skills):
     assert job.company == sample_job_posting.company
 
 
+@pytest.mark.skipif(not JSONB_AVAILABLE, reason="JSONB needs SQLite 3.45+")
+def test_json_columns_round_trip_as_jsonb(test_db, sample_resume, sample_job_posting, sample_job_skills):
+    """Test JSON columns are stored as JSONB and read back as before."""
+    resume_id = test_db.save_resume(sample_resume)
+    job_id = test_db.save_job(sample_job_posting, sample_job_skills)
+    match_id = test_db.save_job_match(JobMatch(fit_score=0.5, recommendations=["Learn Go"]), job_id, resume_id)
+    
+    for table, column in (("resumes", "resume_json"), ("jobs", "job_skills_json"), ("job_matches", "match_details_json")):
+        stored = test_db.conn.execute(f"SELECT typeof({column}) FROM {table}").fetchone()[0]
+        assert stored == "blob"
+    assert test_db.get_resume(resume_id) == sample_resume
+    assert test_db.get_job_skills(job_id) == sample_job_skills
+    assert test_db.get_job_match(match_id).recommendations == ["Learn Go"]
+    
+    # Rows written as text before the upgrade still read back
+    test_db.conn.execute(
+        "UPDATE jobs SET job_skills_json = ? WHERE id = ?", (sample_job_skills.model_dump_json(), job_id)
+    )
+    assert test_db.get_job_skills(job_id) == sample_job_skills
+
+
+def test_save_job_updates_duplicate(test_db):
+    """Test saving a duplicate job updates the existing row."""
+    job_id = test_db.save_job(JobPosting(
+        company="Acme", title="Engineer", description="First", source_url="https://acme.test/1",
+    ))
+    
+    same_url = test_db.save_job(JobPosting(
+        company="Acme Corp", title="SWE", description="Second", source_url="https://acme.test/1",
+    ))
+    same_title = test_db.save_job(JobPosting(company="ACME", title="engineer", description="Third"))
+    other = test_db.save_job(JobPosting(company="Acme", title="Designer", description="Other"))
+    
+    assert same_title == job_id
+    assert same_url == job_id
+    assert other != job_id
+    assert test_db.get_job(job_id).description == "Third"
+
+
+def test_get_all_jobs_parses_skills_lazily(test_db, sample_job_posting, sample_job_skills):
+    """Test job skills are parsed only when read."""
+    job_id = test_db.save_job(sample_job_posting, sample_job_skills)
+    test_db.save_job(JobPosting(company="Other", title="Role", description="No skills"))
+    
+    jobs = {job["id"]: job for job in test_db.get_all_jobs()}
+    
+    assert "job_skills" not in jobs[job_id].__dict__
+    assert jobs[job_id]["job_skills"] == sample_job_skills
+    assert "job_skills" in jobs[job_id]
+    assert jobs[job_id + 1].get("job_skills") is None
+    assert "job_skills" not in jobs[job_id + 1]
+
+
 def test_save_bullet_change(test_db, sample_resume):
     """Test saving bullet change with reasoning."""
     resume_id = test_db.save_resume(sample_resume)
@@ -63,4 +137,621 @@ def test_save_bullet_change(test_db, sample_resume):
     changes = test_db.get_bullet_changes(resume_id)
     assert len(changes) == 1
     assert changes[0]["bullet_id"] == "test_bullet_1"
+    assert changes[0].justification == justification
+    assert changes[0].reasoning == reasoning
+
+
+
+def test_save_bullet_changes_batch(test_db, sample_resume):
+    """Test saving several bullet changes in one call."""
+    resume_id = test_db.save_resume(sample_resume)
+    justification = Justification(trigger="Job requires Python", skills_added=["Python"])
+    
+    change_ids = test_db.save_bullet_changes([
+        (resume_id, "bullet_1", "Old one", "New one", justification),
+        (resume_id, "bullet_2", "Old two", "New two", justification, None, 1, True),
+    ])
+    
+    assert len(change_ids) == 2 and change_ids[0] < change_ids[1]
+    changes = test_db.get_bullet_changes(resume_id)
+    assert {change["bullet_id"] for change in changes} == {"bullet_1", "bullet_2"}
+    assert all(change.reasoning is None for change in changes)
+
+
+def test_buffered_job_matches_flush_together(test_db, sample_resume):
+    """Test non-durable job matches are held until flush."""
+    resume_id = test_db.save_resume(sample_resume)
+    job_id = test_db.save_job(JobPosting(company="Acme", title="Engineer", description="Build things"))
+    
+    for fit_score in (0.2, 0.4):
+        match = JobMatch(fit_score=fit_score)
+        assert test_db.save_job_match(match, job_id, resume_id, durable=False) is None
+    test_db.flush()
+    
+    assert test_db.get_latest_job_match_fit_score(job_id) is not None
+    count = test_db.conn.execute("SELECT COUNT(*) FROM job_matches").fetchone()[0]
+    assert count == 2
+
+
+def test_deduplicate_jobs_keeps_latest(test_db, sample_resume):
+    """Test duplicates collapse onto the most recent job with their matches."""
+    resume_id = test_db.save_resume(sample_resume)
+    # Databases created before the unique index can hold duplicates
+    test_db.conn.execute("DROP INDEX idx_jobs_company_title")
+    for company in ("Acme", "ACME", "acme", "Other"):
+        test_db.conn.execute(
+            "INSERT INTO jobs (company, title, description) VALUES (?, 'Engineer', 'd')", (company,)
+        )
+    test_db.conn.commit()
+    test_db.save_job_match(JobMatch(fit_score=0.5), 1, resume_id)
+    
+    assert test_db.deduplicate_jobs() == {'removed': 2, 'kept': 1}
+    
+    job_ids = [row["id"] for row in test_db.conn.execute("SELECT id FROM jobs ORDER BY id")]
+    assert job_ids == [3, 4]
+    assert test_db.get_latest_job_match_fit_score(3) == 0.5
+    assert test_db.save_job(JobPosting(company="Acme", title="Engineer", description="d")) == 3
+
+
+def test_deduplicate_jobs_collapses_source_url_duplicates(tmp_path, sample_resume):
+    """Test jobs sharing a source_url are collapsed and both unique indexes rebuilt."""
+    db_path = str(tmp_path / "dupes.db")
+    db = Database(db_path)
+    db.conn.execute("DROP INDEX idx_jobs_source_url")
+    for company, title, url in (
+        ("Acme", "Engineer", "https://example.com/1"),
+        ("Acme Inc", "Software Engineer", "https://example.com/1"),
+        ("Other", "Engineer", "https://example.com/2"),
+    ):
+        db.conn.execute(
+            "INSERT INTO jobs (company, title, description, source_url) VALUES (?, ?, 'd', ?)",
+            (company, title, url),
+        )
+    db.close()
+    
+    db = Database(db_path)
+    try:
+        # Duplicate URLs block only their own index
+        assert db._missing_job_indexes == ["idx_jobs_source_url"]
+        resume_id = db.save_resume(sample_resume)
+        db.save_job_match(JobMatch(fit_score=0.5), 1, resume_id)
+        
+        assert db.deduplicate_jobs() == {'removed': 1, 'kept': 1}
+        
+        assert [row["id"] for row in db.conn.execute("SELECT id FROM jobs ORDER BY id")] == [2, 3]
+        assert db.get_latest_job_match_fit_score(2) == 0.5
+        assert db._missing_job_indexes == []
+    finally:
+        db.close()
+
+
+def test_save_job_updates_duplicates_without_unique_index(tmp_path):
+    """Test save_job still updates existing jobs while duplicates block the unique index."""
+    from src.db.schema import SCHEMA_VERSION
+    
+    db_path = str(tmp_path / "dupes.db")
+    db = Database(db_path)
+    db.conn.execute("DROP INDEX idx_jobs_company_title")
+    for _ in range(2):
+        db.conn.execute("INSERT INTO jobs (company, title, description) VALUES ('Acme', 'Eng', 'd')")
+    db.close()
+    
+    db = Database(db_path)
+    try:
+        assert db.conn.execute("PRAGMA user_version").fetchone()[0] == SCHEMA_VERSION
+        for location in ("A", "B", "C"):
+            db.save_job(JobPosting(company="acme", title="Eng", description="d", location=location))
+        rows = db.conn.execute("SELECT location FROM jobs ORDER BY id").fetchall()
+        assert len(rows) == 2
+        assert "C" in [row["location"] for row in rows]
+    finally:
+        db.close()
+
+
+def test_latest_fit_score_uses_covering_index(test_db):
+    """Test the latest-match lookup is served from the covering index."""
+    plan = test_db.conn.execute("""
+        EXPLAIN QUERY PLAN
+        SELECT fit_score FROM job_matches WHERE job_id = ? ORDER BY created_at DESC LIMIT 1
+    """, (1,)).fetchall()
+    
+    details = " ".join(row["detail"] for row in plan)
+    assert "COVERING INDEX idx_job_matches_job_created" in details
+    assert "TEMP B-TREE" not in details
+
+
+def test_reads_use_read_only_connections(test_db, sample_resume):
+    """Test reads are served from the read-only pool and see committed writes."""
+    resume_id = test_db.save_resume(sample_resume)
+    
+    with test_db._read_connection() as conn:
+        assert conn is not test_db.conn
+        with pytest.raises(sqlite3.OperationalError):
+            conn.execute("DELETE FROM resumes")
+    
+    assert test_db.get_resume(resume_id).name == sample_resume.name
+
+
+def test_list_jobs_rows_support_dict_access(test_db, sample_job_posting):
+    """Test list_jobs rows keep dict-style access."""
+    job_id = test_db.save_job(sample_job_posting)
+    
+    job = test_db.list_jobs()[0]
+    
+    assert job.id == job_id
+    assert job["company"] == sample_job_posting.company
+    assert job.get("missing", "default") == "default"
+    assert "status" in job
+    assert job.asdict()["title"] == sample_job_posting.title
+
+
+def test_delete_job_removes_related_rows(test_db, sample_resume, sample_job_posting):
+    """Test deleting a job also deletes its matches and applications."""
+    resume_id = test_db.save_resume(sample_resume)
+    job_id = test_db.save_job(sample_job_posting)
+    test_db.save_job_match(JobMatch(fit_score=0.5), job_id, resume_id)
+    test_db.save_application(job_id, resume_id)
+    
+    test_db.delete_job(job_id)
+    
+    assert test_db.get_job(job_id) is None
+    assert test_db.get_latest_job_match_fit_score(job_id) is None
+    assert test_db.get_applications(job_id) == []
+
+
+def test_resumes_for_job_listing(test_db, sample_resume, sample_job_posting):
+    """Test per-job resume listings with and without content."""
+    job_id = test_db.save_job(sample_job_posting)
+    resume_id = test_db.save_resume(sample_resume, file_path="out.pdf", job_id=job_id, is_customized=True)
+    test_db.save_resume(sample_resume)
+    
+    meta = test_db.list_resume_meta_for_job(job_id)
+    resumes = test_db.get_resumes_by_job_id(job_id)
+    
+    assert [row["id"] for row in meta] == [resume_id]
+    assert "resume" not in meta[0]
+    assert meta[0]["name"] == sample_resume.name
+    assert meta[0]["version"] == sample_resume.version
+    assert len(resumes) == 1
+    assert resumes[0]["resume"].name == sample_resume.name
+    assert resumes[0]["file_path"] == "out.pdf"
+    assert resumes[0]["is_customized"] is True
+
+
+def test_list_jobs_can_skip_description(test_db, sample_job_posting):
+    """Test list views can leave out job descriptions."""
+    test_db.save_job(sample_job_posting)
+    
+    job = test_db.list_jobs(include_description=False)[0]
+    
+    assert job.description is None
+    assert job.company == sample_job_posting.company
+    assert test_db.list_jobs()[0].description == sample_job_posting.description
+
+
+def test_schema_collects_planner_statistics(test_db):
+    """Test create_tables runs ANALYZE."""
+    tables = test_db.conn.execute(
+        "SELECT name FROM sqlite_master WHERE name = 'sqlite_stat1'"
+    ).fetchall()
+    assert tables
+
+
+def test_periodic_optimize_is_sampled(test_db, sample_job_posting, monkeypatch):
+    """Test write transactions trigger PRAGMA optimize with a bounded ANALYZE."""
+    from src.db import database
+    
+    class RecordingConnection:
+        def __init__(self, conn):
+            self._conn = conn
+            self.statements = []
+        
+        def execute(self, sql, *args):
+            self.statements.append(sql)
+            return self._conn.execute(sql, *args)
+        
+        def __getattr__(self, name):
+            return getattr(self._conn, name)
+    
+    monkeypatch.setattr(database, "_OPTIMIZE_INTERVAL", 2)
+    recorder = RecordingConnection(test_db.conn)
+    monkeypatch.setattr(test_db, "conn", recorder)
+    test_db.save_job(sample_job_posting)
+    assert "PRAGMA optimize" not in recorder.statements
+    test_db.save_job(JobPosting(company="Other", title="Engineer", description="d"))
+    assert "PRAGMA optimize" in recorder.statements
+    
+    assert test_db.conn.execute("PRAGMA analysis_limit").fetchone()[0] == 400
+
+
+def test_schema_version_skips_ddl_on_reopen(tmp_path):
+    """Test create_tables stamps user_version and skips the DDL once stamped."""
+    from src.db.schema import SCHEMA_VERSION, create_tables
+    
+    conn = sqlite3.connect(str(tmp_path / "schema.db"))
+    create_tables(conn)
+    assert conn.execute("PRAGMA user_version").fetchone()[0] == SCHEMA_VERSION
+    
+    conn.execute("DROP TABLE contacts")
+    create_tables(conn)
+    assert not conn.execute("SELECT name FROM sqlite_master WHERE name = 'contacts'").fetchall()
+    
+    conn.execute("PRAGMA user_version = 0")
+    create_tables(conn)
+    assert conn.execute("SELECT name FROM sqlite_master WHERE name = 'contacts'").fetchall()
+    conn.close()
+
+
+def test_schema_leaves_newer_versions_alone(tmp_path):
+    """Test create_tables never downgrades a database stamped by a newer build."""
+    from src.db.schema import SCHEMA_VERSION, create_tables
+    
+    conn = sqlite3.connect(str(tmp_path / "schema.db"))
+    create_tables(conn)
+    conn.execute("CREATE INDEX idx_missing_skills_skill_name ON missing_skills_aggregation(skill_name)")
+    conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION + 1}")
+    
+    create_tables(conn)
+    assert conn.execute("PRAGMA user_version").fetchone()[0] == SCHEMA_VERSION + 1
+    assert conn.execute("SELECT name FROM sqlite_master WHERE name = 'idx_missing_skills_skill_name'").fetchall()
+    conn.close()
+
+
+def test_schema_adds_missing_columns_to_old_tables():
+    """Test create_tables migrates tables created before newer columns."""
+    from src.db.schema import create_tables
+    
+    conn = sqlite3.connect(":memory:")
+    conn.execute("CREATE TABLE resumes (id INTEGER PRIMARY KEY, version INTEGER, resume_json TEXT, created_at TIMESTAMP, updated_at TIMESTAMP)")
+    create_tables(conn)
+    columns = {row[1] for row in conn.execute("PRAGMA table_info(resumes)")}
+    assert {"file_path", "job_id", "is_customized"} <= columns
+    conn.close()
 
+
+def test_schema_creates_databases_in_wal_mode(tmp_path):
+    """Test a database created by create_tables alone is switched to WAL."""
+    from src.db.schema import create_tables
+    
+    db_path = tmp_path / "wal.db"
+    conn = sqlite3.connect(str(db_path))
+    create_tables(conn)
+    conn.close()
+    
+    conn = sqlite3.connect(str(db_path))
+    assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    conn.close()
+
+
+def test_job_match_skills_round_trip(test_db, sample_resume, sample_job_posting):
+    """Test job match skill lists are stored per skill and rebuilt in order."""
+    resume_id = test_db.save_resume(sample_resume)
+    job_id = test_db.save_job(sample_job_posting)
+    match = JobMatch(
+        job_id=job_id,
+        fit_score=0.6,
+        skill_gaps={"required_missing": ["Go", "Rust"], "preferred_missing": []},
+        missing_skills=["Rust"],
+        matching_skills=["Python", "SQL"],
+        recommendations=["Learn Rust"],
+    )
+    
+    match_id = test_db.save_job_match(match, job_id, resume_id)
+    
+    assert test_db.get_job_match(match_id) == match
+    rust_jobs = test_db.conn.execute(
+        "SELECT COUNT(*) FROM job_match_skills WHERE kind = 'missing' AND skill = 'Rust'"
+    ).fetchone()[0]
+    assert rust_jobs == 1
+
+
+def test_write_tx_rolls_back_on_error(test_db, sample_job_posting):
+    """Test a failed write transaction leaves no rows behind and releases the lock."""
+    job_id = test_db.save_job(sample_job_posting)
+    
+    with pytest.raises(sqlite3.IntegrityError):
+        with test_db._write_tx() as conn:
+            conn.execute("DELETE FROM jobs WHERE id = ?", (job_id,))
+            conn.execute("INSERT INTO jobs (id, company, title) VALUES (?, NULL, NULL)", (job_id,))
+    
+    assert not test_db.conn.in_transaction
+    assert test_db.get_job(job_id) is not None
+
+
+def test_save_jobs_bulk(test_db, sample_job_posting):
+    """Test save_jobs saves many jobs and maps duplicates to the existing job."""
+    other = sample_job_posting.model_copy(update={"title": "Data Engineer", "source_url": None})
+    
+    job_ids = test_db.save_jobs(
+        ((job, None) for job in (sample_job_posting, other, sample_job_posting)), status="Interested"
+    )
+    
+    assert len(set(job_ids)) == 2
+    assert job_ids[0] == job_ids[2]
+    assert test_db.get_job_full(job_ids[1])["status"] == "Interested"
+
+
+def test_bulk_rolls_back_all_writes(test_db, sample_job_posting):
+    """Test writes inside bulk() commit together or not at all."""
+    with pytest.raises(RuntimeError):
+        with test_db.bulk():
+            test_db.save_job(sample_job_posting)
+            raise RuntimeError("abort import")
+    
+    assert test_db.get_all_jobs() == []
+
+
+def test_bulk_with_buffered_saves_does_not_deadlock(test_db):
+    """Test a timed flush firing inside bulk() waits for the block to finish."""
+    import threading
+    import time
+    
+    def run():
+        with test_db.bulk():
+            test_db.save_application(1, 1, durable=False)
+            time.sleep(0.1)  # lets the flush timer fire mid-block
+            test_db.save_application(2, 1, durable=False)
+    
+    worker = threading.Thread(target=run, daemon=True)
+    worker.start()
+    worker.join(timeout=5)
+    assert not worker.is_alive()
+    
+    test_db.flush()
+    assert sorted(row["job_id"] for row in test_db.get_applications()) == [1, 2]
+
+
+def test_buffered_saves_survive_bulk_rollback(test_db, monkeypatch):
+    """Test a size-triggered flush inside bulk() waits for the block instead of joining it."""
+    import src.db.database as database_module
+    
+    monkeypatch.setattr(database_module, "_WRITE_BUFFER_MAX_ROWS", 2)
+    with pytest.raises(RuntimeError):
+        with test_db.bulk():
+            test_db.save_application(1, 1, durable=False)
+            test_db.save_application(2, 1, durable=False)
+            assert test_db._buffer.count == 2
+            raise RuntimeError("roll back")
+    
+    test_db.flush()
+    assert sorted(row["job_id"] for row in test_db.get_applications()) == [1, 2]
+
+
+def test_bulk_flushes_buffered_saves_on_exit(test_db):
+    """Test the outermost bulk() block flushes saves buffered inside it."""
+    with test_db.bulk():
+        with test_db.bulk():
+            test_db.save_application(1, 1, durable=False)
+        assert test_db._buffer.count == 1
+    assert test_db._buffer.count == 0
+    assert [row["job_id"] for row in test_db.get_applications()] == [1]
+
+
+def test_failed_flush_keeps_buffered_rows(test_db):
+    """Test rows from a failed flush stay buffered and commit on the next one."""
+    test_db.conn.execute("""
+        CREATE TEMP TRIGGER reject_applications BEFORE INSERT ON applications
+        BEGIN SELECT RAISE(ABORT, 'rejected'); END
+    """)
+    test_db.save_application(1, 1, durable=False)
+    
+    with pytest.raises(sqlite3.IntegrityError):
+        test_db.flush()
+    assert test_db._buffer.count == 1
+    
+    test_db.conn.execute("DROP TRIGGER reject_applications")
+    test_db.flush()
+    assert [row["job_id"] for row in test_db.get_applications()] == [1]
+
+
+def test_databases_on_one_file_share_connections(tmp_path, monkeypatch, sample_job_posting):
+    """Test every Database on a file shares one writer until the last one closes."""
+    monkeypatch.chdir(tmp_path)
+    first = Database("shared.db")
+    second = Database(str(tmp_path / "shared.db"))
+    
+    assert second.conn is first.conn
+    assert second._write_lock is first._write_lock
+    job_id = first.save_job(sample_job_posting)
+    
+    first.close()
+    assert second.get_job(job_id).company == sample_job_posting.company
+    second.close()
+    with pytest.raises(sqlite3.ProgrammingError):
+        second.conn.execute("SELECT 1")
+    
+    reopened = Database("shared.db")
+    try:
+        assert reopened.conn is not first.conn
+        assert reopened.get_job(job_id) is not None
+    finally:
+        reopened.close()
+
+
+def test_in_memory_databases_stay_private():
+    """Test each in-memory Database keeps a connection of its own."""
+    first, second = Database(":memory:"), Database(":memory:")
+    try:
+        assert first.conn is not second.conn
+    finally:
+        first.close()
+        second.close()
+
+
+def test_close_releases_connections_when_flush_fails(tmp_path):
+    """Test close() closes every connection before re-raising a flush error."""
+    db = Database(str(tmp_path / "close.db"))
+    db.get_applications()
+    reader = db._pool.readers.queue[0]
+    db.conn.execute("""
+        CREATE TEMP TRIGGER reject_applications BEFORE INSERT ON applications
+        BEGIN SELECT RAISE(ABORT, 'rejected'); END
+    """)
+    db.save_application(1, 1, durable=False)
+    
+    with pytest.raises(sqlite3.IntegrityError):
+        db.close()
+    for conn in (db.conn, reader):
+        with pytest.raises(sqlite3.ProgrammingError):
+            conn.execute("SELECT 1")
+
+
+def test_read_pool_ignores_later_directory_changes(tmp_path, monkeypatch, sample_job_posting):
+    """Test a relative db_path keeps pointing at the same file after a chdir."""
+    (tmp_path / "other").mkdir()
+    monkeypatch.chdir(tmp_path)
+    db = Database("relative.db")
+    try:
+        job_id = db.save_job(sample_job_posting)
+        monkeypatch.chdir(tmp_path / "other")
+        assert db.get_job(job_id).company == sample_job_posting.company
+    finally:
+        db.close()
+
+
+def test_fast_mode_off_uses_full_sync(tmp_path):
+    """Test fast_mode=False fsyncs every commit."""
+    db = Database(str(tmp_path / "durable.db"), fast_mode=False)
+    try:
+        assert db.conn.execute("PRAGMA synchronous").fetchone()[0] == 2
+    finally:
+        db.close()
+
+
+def test_list_jobs_summary_rows(test_db, sample_job_posting):
+    """Test list_jobs_summary rows expose only the summary columns."""
+    job_id = test_db.save_job(sample_job_posting)
+    
+    rows = test_db.list_jobs_summary()
+    
+    assert rows[0].id == job_id
+    assert rows[0]["company"] == sample_job_posting.company
+    assert "description" not in rows[0]
+
+
+@pytest.mark.parametrize("query, index", [
+    (
+        "SELECT resume_id FROM job_matches WHERE job_id = 1 AND resume_customized_for_job = 1 ORDER BY created_at DESC",
+        "idx_job_matches_job_customized",
+    ),
+    ("SELECT id, updated_at FROM resumes ORDER BY updated_at DESC LIMIT 1", "idx_resumes_updated"),
+    ("SELECT * FROM bullet_changes WHERE resume_id = 1 ORDER BY created_at DESC", "idx_bullet_changes_resume_created"),
+    ("SELECT * FROM applications WHERE job_id = 1 ORDER BY created_at DESC", "idx_applications_job_created"),
+    (
+        "SELECT * FROM analytics_events WHERE event_type = 'job_added' ORDER BY created_at DESC LIMIT 10",
+        "idx_analytics_events_type_created",
+    ),
+    (
+        "SELECT * FROM missing_skills_aggregation ORDER BY priority_score DESC, frequency_count DESC LIMIT 10",
+        "idx_missing_skills_priority_desc",
+    ),
+])
+def test_listing_queries_avoid_sorts(test_db, query, index):
+    """Test per-id listings are range scans over an index, with no sort step."""
+    plan = test_db.conn.execute(f"EXPLAIN QUERY PLAN {query}").fetchall()
+    
+    details = " ".join(row["detail"] for row in plan)
+    assert index in details
+    assert "TEMP B-TREE" not in details
+
+
+def test_resume_timestamp_sorts_after_python_timestamps(test_db, sample_resume):
+    """Test SQLite-generated updated_at values order after older datetime.now() rows."""
+    older_id = test_db.save_resume(sample_resume)
+    test_db.conn.execute(
+        "UPDATE resumes SET updated_at = ? WHERE id = ?",
+        (str(datetime.now() - timedelta(seconds=1)), older_id),
+    )
+    newer_id = test_db.save_resume(sample_resume)
+    
+    assert test_db.get_latest_resume_id() == newer_id
+
+
+def test_save_bullet_change_returns_row(test_db, sample_resume):
+    """Test return_row gives back the stored row without a second query."""
+    resume_id = test_db.save_resume(sample_resume)
+    justification = Justification(trigger="Job requires Python", skills_added=["Python"])
+    
+    row = test_db.save_bullet_change(
+        resume_id, "bullet_1", "Old", "New", justification, return_row=True
+    )
+    
+    assert row == test_db.get_bullet_changes(resume_id)[0]
+    assert row.justification == justification
+
+
+def test_save_bullet_change_rejects_buffered_row(test_db, sample_resume):
+    """Test return_row cannot be combined with a buffered write."""
+    resume_id = test_db.save_resume(sample_resume)
+    justification = Justification(trigger="Job requires Python", skills_added=["Python"])
+    
+    with pytest.raises(ValueError):
+        test_db.save_bullet_change(
+            resume_id, "bullet_1", "Old", "New", justification, durable=False, return_row=True
+        )
+    assert test_db._buffer.count == 0
+
+
+@pytest.mark.parametrize("durations, median", [
+    ([], None),
+    ([30, 10, 20], 20),
+    ([40, 10, 30, 20, None], 25),
+])
+def test_time_to_apply_median(test_db, durations, median):
+    """Test the median is computed in SQL for odd, even and empty inputs."""
+    test_db.conn.executemany(
+        "INSERT INTO time_to_apply (job_id, created_at, duration_seconds) VALUES (1, '2024-01-01', ?)",
+        [(duration,) for duration in durations],
+    )
+    
+    stats = test_db.get_time_to_apply_stats()
+    
+    assert stats["median_seconds"] == median
+    assert stats["count"] == len([d for d in durations if d is not None])
+
+
+def test_missing_skills_ranked_order(test_db):
+    """Test ranking by frequency or priority, with priority as the fallback."""
+    test_db.conn.executemany(
+        "INSERT INTO missing_skills_aggregation (skill_name, frequency_count, priority_score) VALUES (?, ?, ?)",
+        [("Go", 5, 1.0), ("Rust", 1, 9.0)],
+    )
+    
+    assert [s["skill_name"] for s in test_db.get_missing_skills_ranked(by="frequency")] == ["Go", "Rust"]
+    assert [s["skill_name"] for s in test_db.get_missing_skills_ranked()] == ["Rust", "Go"]
+    assert [s["skill_name"] for s in test_db.get_missing_skills_ranked(limit=1, by="other")] == ["Rust"]
+
+
+def test_save_applications_batch(test_db, sample_resume, sample_job_posting):
+    """Test saving several applications in one call, with default status."""
+    resume_id = test_db.save_resume(sample_resume)
+    job_id = test_db.save_job(sample_job_posting)
+    
+    app_ids = test_db.save_applications([
+        (job_id, resume_id),
+        (job_id, resume_id, "interview", "Phone screen"),
+    ])
+    
+    apps = {app.id: app for app in test_db.get_applications(job_id)}
+    assert apps[app_ids[0]].status == "pending"
+    assert apps[app_ids[1]].notes == "Phone screen"
+
+
+def test_iter_jobs_streams_rows(test_db, sample_job_posting):
+    """Test iter_jobs yields job rows one at a time."""
+    test_db.save_job(sample_job_posting)
+    
+    jobs = test_db.iter_jobs(include_description=False)
+    
+    assert next(jobs).title == sample_job_posting.title
+    assert next(jobs, None) is None
+
+
+def test_track_event_timestamp_is_local_time(test_db):
+    """Test events are stamped by SQLite in the same local-time format as before."""
+    event_id = test_db.track_event("job_added", {"job_id": 1})
+    
+    created_at = test_db.conn.execute(
+        "SELECT created_at FROM analytics_events WHERE id = ?", (event_id,)
+    ).fetchone()[0]
+    assert abs(datetime.fromisoformat(created_at) - datetime.now()) < timedelta(minutes=1)
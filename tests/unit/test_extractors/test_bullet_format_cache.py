@@ -0,0 +1,65 @@
+"""Tests for the formatted bullet cache."""
+
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from src.extractors.bullet_format_cache import BulletFormatCache
+from src.extractors.bullet_formatter import BulletFormatter
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = BulletFormatCache(path=tmp_path / "cache.db")
+    yield cache
+    cache.close()
+
+
+class FakeCompletions:
+    def __init__(self):
+        self.calls = 0
+
+    def create(self, **kwargs):
+        self.calls += 1
+        content = json.dumps({"bullets": ["Built REST APIs in Python using FastAPI and PostgreSQL"]})
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+
+
+def test_put_and_get_round_trip(cache):
+    """Stored bullets are returned for the same key and persist across instances."""
+    key = cache.make_key("gpt-4o-mini", "prompt")
+    assert cache.get(key) is None
+
+    cache.put(key, ["Built APIs."])
+    assert cache.get(key) == ["Built APIs."]
+
+    reopened = BulletFormatCache(path=cache.path)
+    assert reopened.get(key) == ["Built APIs."]
+    reopened.close()
+
+
+def test_expired_entries_are_ignored(cache):
+    """Entries older than the TTL miss the cache."""
+    key = cache.make_key("gpt-4o-mini", "prompt")
+    cache.put(key, ["Built APIs."])
+
+    cache.ttl_seconds = -1
+    assert cache.get(key) is None
+
+    cache.ttl_seconds = None
+    assert cache.get(key) == ["Built APIs."]
+
+
+def test_formatter_reuses_cached_bullets(cache):
+    """Formatting the same project twice calls the model once."""
+    completions = FakeCompletions()
+    formatter = BulletFormatter(cache=cache)
+    formatter.client = SimpleNamespace(chat=SimpleNamespace(completions=completions))
+
+    first = formatter.format_bullets(["rest api"], "API", ["Python"])
+    second = formatter.format_bullets(["rest api"], "API", ["Python"])
+    formatter.format_bullets(["rest api"], "API", ["Python", "Go"])
+
+    assert first == second == ["Built REST APIs in Python using FastAPI and PostgreSQL."]
+    assert completions.calls == 2
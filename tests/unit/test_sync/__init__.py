@@ -0,0 +1 @@
+"""Sync unit tests."""
@@ -0,0 +1,39 @@
+"""Unit tests for SheetSyncService database writes."""
+
+import threading
+from unittest.mock import Mock
+
+import pytest
+
+from src.models.job import JobPosting
+from src.sync.sheet_sync import SheetSyncService
+
+
+def test_sheet_writes_do_not_commit_other_transactions(test_db):
+    """Test a sheet write waits for another thread's transaction instead of committing it."""
+    service = SheetSyncService(test_db, Mock())
+    job_id = test_db.save_job(JobPosting(company="Acme", title="Engineer", description="d"))
+    in_block = threading.Event()
+    release = threading.Event()
+    
+    def import_then_abort():
+        with pytest.raises(RuntimeError):
+            with test_db.bulk():
+                test_db.save_job(JobPosting(company="Other", title="Engineer", description="d"))
+                in_block.set()
+                release.wait(timeout=5)
+                raise RuntimeError("abort import")
+    
+    worker = threading.Thread(target=import_then_abort)
+    worker.start()
+    in_block.wait(timeout=5)
+    sheet_write = threading.Thread(
+        target=service._save_application, args=(job_id, {"Offer / Outcome": "Interview"})
+    )
+    sheet_write.start()
+    release.set()
+    worker.join(timeout=5)
+    sheet_write.join(timeout=5)
+    
+    assert [job.company for job in test_db.list_jobs()] == ["Acme"]
+    assert [row["status"] for row in test_db.get_applications(job_id)] == ["interview"]
@@ -0,0 +1,29 @@
+"""Tests for the Aho-Corasick multi-pattern matcher."""
+
+from src.utils.aho_corasick import AhoCorasick, entry_at, join_with_offsets
+
+
+def test_iter_matches_finds_overlapping_patterns():
+    """All patterns are reported, including ones that overlap or nest."""
+    matcher = AhoCorasick(["he", "she", "his", "hers"])
+
+    matches = sorted(matcher.iter_matches("ushers"))
+
+    assert matches == [(3, 0), (3, 1), (5, 3)]
+
+
+def test_empty_patterns_are_ignored():
+    """An empty pattern never matches."""
+    matcher = AhoCorasick(["", "go"])
+
+    assert list(matcher.iter_matches("golang")) == [(1, 1)]
+
+
+def test_matches_do_not_cross_joined_entries():
+    """Joined entries map back to their index and never match across the separator."""
+    text, starts = join_with_offsets(["java", "script", "react"])
+    matcher = AhoCorasick(["javascript", "script", "act"])
+
+    matches = [(entry_at(starts, position), index) for position, index in matcher.iter_matches(text)]
+
+    assert matches == [(1, 1), (2, 2)]